@@ -0,0 +1,148 @@
+"""Deterministic synthetic SSH config generator used by the benchmark suite."""
+
+import os
+import random
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class GeneratorSpec:
+    """Shape of the generated configuration."""
+
+    hosts: int = 1000
+    patterns: int = 50
+    groups: int = 20
+    includes: int = 0
+    jump_hosts: int = 10
+    forwards: int = 2
+    seed: int = 1
+
+
+def _group_name(index: int) -> str:
+    return f"group-{index:04d}"
+
+
+def _host_name(index: int) -> str:
+    return f"host-{index:06d}"
+
+
+def _jump_name(index: int) -> str:
+    return f"jump-{index:03d}"
+
+
+def _render_pattern(rng: random.Random, index: int) -> list[str]:
+    """Render a pattern block, alternating between prefix, suffix and generic glob shapes."""
+
+    shape = index % 4
+    if shape == 0:
+        name = f"host-{index % 100:02d}*"
+    elif shape == 1:
+        name = f"*-{index % 10}"
+    elif shape == 2:
+        name = f"host-?{index % 10}*"
+    else:
+        name = f"*{index % 100:02d}*"
+
+    return [
+        f"Host {name}",
+        f"    port {rng.randint(1024, 65000)}",
+        f"    user pattern{index}",
+        f"    serveraliveinterval {rng.randint(10, 120)}",
+        "",
+    ]
+
+
+def _render_host(rng: random.Random, spec: GeneratorSpec, index: int) -> list[str]:
+    lines = []
+    if index % 5 == 0:
+        lines.append(f"#@host: generated host {index}")
+    lines.append(f"Host {_host_name(index)}" + (f" alias-{index:06d}" if index % 7 == 0 else ""))
+    lines.append(f"    hostname 10.{(index >> 16) & 255}.{(index >> 8) & 255}.{index & 255}")
+    lines.append(f"    user user{rng.randint(0, 50)}")
+    if spec.jump_hosts and index % 3 == 0:
+        lines.append(f"    proxyjump {_jump_name(rng.randrange(spec.jump_hosts))}")
+    for forward in range(spec.forwards if index % 2 == 0 else 0):
+        port = 10000 + (index * spec.forwards + forward) % 50000
+        lines.append(f"    localforward {port} localhost:{rng.choice([22, 80, 443, 5432, 8080])}")
+    if index % 4 == 0:
+        lines.append(f"    identityfile ~/.ssh/id_{index % 8}")
+    lines.append("")
+    return lines
+
+
+def _render_group(rng: random.Random, spec: GeneratorSpec, group_index: int, host_indexes: list[int]) -> list[str]:
+    lines = [
+        "#" + "-" * 79,
+        f"#@group: {_group_name(group_index)}",
+        f"#@desc: Generated group {group_index}",
+        "#" + "-" * 79,
+    ]
+    for host_index in host_indexes:
+        lines.extend(_render_host(rng, spec, host_index))
+    return lines
+
+
+def generate_config_files(spec: GeneratorSpec) -> dict[str, list[str]]:
+    """
+    Return generated config content as `{relative file name: lines}`.
+
+    The root file is always named `config`. Hosts are split evenly across
+    groups, and when includes are requested the groups are spread across
+    `includes/part-NNN.conf` files pulled in by a top-level `Include`.
+    """
+    rng = random.Random(spec.seed)
+    files: dict[str, list[str]] = {}
+
+    # Global values must come before any host, including hosts pulled in from included files
+    root: list[str] = ["#<<<<< SSH Config file managed by sshclick >>>>>", "", "#<<<<< Global values >>>>>", "ServerAliveCountMax 3", ""]
+    if spec.includes:
+        root.extend(["Include includes/part-*.conf", ""])
+
+    # Jump hosts chain into each other, so proxy traces have several hops
+    root.extend(["#@group: jumps", ""])
+    for jump in range(spec.jump_hosts):
+        root.append(f"Host {_jump_name(jump)}")
+        root.append(f"    hostname 172.16.{jump // 256}.{jump % 256}")
+        if jump > 0:
+            root.append(f"    proxyjump {_jump_name(rng.randrange(jump))}")
+        root.append("")
+
+    group_count = max(spec.groups, 1)
+    group_hosts: list[list[int]] = [[] for _ in range(group_count)]
+    for host_index in range(spec.hosts):
+        group_hosts[host_index % group_count].append(host_index)
+
+    group_blocks = [_render_group(rng, spec, group_index, hosts) for group_index, hosts in enumerate(group_hosts)]
+
+    if spec.includes:
+        for part in range(spec.includes):
+            lines: list[str] = []
+            for group_index in range(part, group_count, spec.includes):
+                lines.extend(group_blocks[group_index])
+            files[f"includes/part-{part:03d}.conf"] = lines
+    else:
+        for block in group_blocks:
+            root.extend(block)
+
+    # Patterns are placed in the middle and at the end, to exercise before/after inheritance
+    pattern_blocks = [_render_pattern(rng, index) for index in range(spec.patterns)]
+    middle = len(root) // 2
+    while middle < len(root) and root[middle - 1] != "":
+        middle += 1
+    head_patterns = [line for block in pattern_blocks[: spec.patterns // 2] for line in block]
+    tail_patterns = [line for block in pattern_blocks[spec.patterns // 2:] for line in block]
+    root = root[:middle] + head_patterns + root[middle:] + tail_patterns
+
+    files["config"] = root
+    return files
+
+
+def write_config(directory: str, spec: GeneratorSpec) -> str:
+    """Write generated config files under `directory` and return the root config path."""
+
+    for name, lines in generate_config_files(spec).items():
+        path = os.path.join(directory, name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as fh:
+            fh.write("\n".join(lines))
+    return os.path.join(directory, "config")
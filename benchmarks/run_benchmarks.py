@@ -0,0 +1,194 @@
+"""
+Phase-by-phase SSHClick benchmark runner.
+
+Example:
+    python -m benchmarks.run_benchmarks --hosts 40000 --patterns 300 --groups 100 --output bench.json
+    python -m benchmarks.run_benchmarks --hosts 40000 --compare bench.json
+"""
+
+import asyncio
+import json
+import os
+import platform
+import statistics
+import tempfile
+import time
+from collections.abc import Callable
+from datetime import datetime, timezone
+
+import click
+
+from sshclick.core import SSH_Config, expand_names, load_config_names, scan_config_names
+from sshclick.core.ssh_diff import block_unified_diff
+from sshclick.version import VERSION
+
+from .config_generator import GeneratorSpec, write_config
+
+RESULTS_FORMAT = 1
+
+
+def _summary(samples: list[float]) -> dict:
+    return {
+        "runs": len(samples),
+        "min": min(samples),
+        "median": statistics.median(samples),
+        "mean": statistics.fmean(samples),
+        "max": max(samples),
+    }
+
+
+def _timed(func: Callable[[], object]) -> float:
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def _count_lines(path: str) -> int:
+    with open(path) as fh:
+        return sum(1 for _ in fh)
+
+
+def _reset_inheritance(config: SSH_Config) -> None:
+    for host in config.all_hosts:
+        host.matched_params = {}
+
+
+def _time_tree_rebuild(config: SSH_Config, repeat: int) -> list[float]:
+    """Time `NavigationTree.rebuild` inside a headless Textual app."""
+    from textual.app import App, ComposeResult
+
+    from sshclick.tui.widgets import NavigationTree
+
+    class TreeBenchApp(App):
+        def compose(self) -> ComposeResult:
+            yield NavigationTree(config, id="nav_tree")
+
+    samples: list[float] = []
+
+    async def scenario() -> None:
+        app = TreeBenchApp()
+        async with app.run_test() as pilot:
+            await pilot.pause()
+            nav_tree = app.query_one(NavigationTree)
+            for _ in range(repeat):
+                samples.append(_timed(lambda: nav_tree.rebuild(config)))
+                await pilot.pause()
+
+    asyncio.run(scenario())
+    return samples
+
+
+def run_benchmarks(spec: GeneratorSpec, repeat: int = 3, with_tui: bool = True) -> dict:
+    """
+    Generate a config for `spec` and time each SSHClick processing phase.
+
+    Every phase runs `repeat` times on its own input, so phases can be
+    compared independently. Returned dict is JSON serializable.
+    """
+    phases: dict[str, list[float]] = {}
+
+    with tempfile.TemporaryDirectory(prefix="sshclick-bench-") as workdir:
+        config_path = write_config(workdir, spec)
+
+        for _ in range(repeat):
+            phases.setdefault("read", []).append(_timed(lambda: SSH_Config(config_path).read()))
+
+            config = SSH_Config(config_path).read()
+            phases.setdefault("parse", []).append(_timed(config.parse))
+
+            _reset_inheritance(config)
+            phases.setdefault("check_inheritance", []).append(_timed(config._check_inheritance))
+
+            phases.setdefault("scan_config_names", []).append(_timed(lambda: scan_config_names(config_path)))
+            load_config_names(config_path)
+            phases.setdefault("load_config_names", []).append(_timed(lambda: load_config_names(config_path)))
+
+        host_names = config.get_all_host_names()
+        proxied_hosts = [host.name for host in config.all_hosts if "proxyjump" in host.params][:1000]
+
+        for _ in range(repeat):
+            phases.setdefault("filter_hosts", []).append(_timed(lambda: config.filter_hosts("group-00", "host-0+1")))
+            phases.setdefault("expand_names", []).append(_timed(lambda: expand_names(("r:^host-00", "r:7$", "jump-001"), host_names)))
+            phases.setdefault("trace_proxyjump", []).append(_timed(lambda: [config.trace_proxyjump(name) for name in proxied_hosts]))
+
+        # Rendering is done on a writable copy of the model, into a scratch file
+        config.write_locked = False
+        config.ssh_config_file = os.path.join(workdir, "rendered_config")
+        for _ in range(repeat):
+            phases.setdefault("generate_ssh_config", []).append(_timed(config.generate_ssh_config))
+
+        # Diff of rendered config against a copy with one changed line (what `--diff` shows for a single host edit)
+        rendered = config.ssh_config_lines
+        changed = list(rendered)
+        changed[len(changed) // 2] += " # changed"
+        for _ in range(repeat):
+            phases.setdefault("block_diff", []).append(_timed(lambda: list(block_unified_diff(rendered, changed))))
+
+        if with_tui:
+            phases["navigation_tree_rebuild"] = _time_tree_rebuild(config, repeat)
+
+        line_count = sum(_count_lines(path) for path in [config_path] + config.included_files)
+
+    return {
+        "format": RESULTS_FORMAT,
+        "sshclick_version": VERSION,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "spec": spec.__dict__,
+        "config": {
+            "lines": line_count,
+            "hosts": len(config.all_hosts),
+            "groups": len(config.groups),
+            "included_files": len(config.included_files),
+        },
+        "phases": {name: _summary(samples) for name, samples in phases.items()},
+    }
+
+
+def _print_results(results: dict, baseline: dict | None = None) -> None:
+    config = results["config"]
+    print(f"SSHClick {results['sshclick_version']} - {config['hosts']} hosts, {config['groups']} groups, {config['lines']} lines")
+    header = f"{'phase':<26}{'median':>12}{'min':>12}"
+    if baseline:
+        header += f"{'baseline':>12}{'ratio':>9}"
+    print(header)
+
+    for name, stats in results["phases"].items():
+        row = f"{name:<26}{stats['median']:>11.4f}s{stats['min']:>11.4f}s"
+        base_stats = (baseline or {}).get("phases", {}).get(name)
+        if base_stats:
+            row += f"{base_stats['median']:>11.4f}s{stats['median'] / base_stats['median']:>8.2f}x"
+        print(row)
+
+
+@click.command(context_settings={"help_option_names": ["-h", "--help"]})
+@click.option("--hosts", default=GeneratorSpec.hosts, show_default=True, help="Number of generated hosts")
+@click.option("--patterns", default=GeneratorSpec.patterns, show_default=True, help="Number of generated pattern hosts")
+@click.option("--groups", default=GeneratorSpec.groups, show_default=True, help="Number of generated groups")
+@click.option("--includes", default=GeneratorSpec.includes, show_default=True, help="Number of included files (0 disables Include)")
+@click.option("--jump-hosts", default=GeneratorSpec.jump_hosts, show_default=True, help="Number of chained jump hosts")
+@click.option("--forwards", default=GeneratorSpec.forwards, show_default=True, help="LocalForward lines on every second host")
+@click.option("--seed", default=GeneratorSpec.seed, show_default=True, help="Generator seed")
+@click.option("--repeat", default=3, show_default=True, help="Runs per phase")
+@click.option("--no-tui", is_flag=True, help="Skip Textual tree benchmark")
+@click.option("--output", type=click.Path(dir_okay=False), help="Write JSON results to file")
+@click.option("--compare", type=click.Path(exists=True, dir_okay=False), help="Compare against earlier JSON results")
+def main(hosts, patterns, groups, includes, jump_hosts, forwards, seed, repeat, no_tui, output, compare):
+    spec = GeneratorSpec(hosts=hosts, patterns=patterns, groups=groups, includes=includes, jump_hosts=jump_hosts, forwards=forwards, seed=seed)
+    results = run_benchmarks(spec, repeat=repeat, with_tui=not no_tui)
+
+    baseline = None
+    if compare:
+        with open(compare) as fh:
+            baseline = json.load(fh)
+
+    _print_results(results, baseline)
+
+    if output:
+        with open(output, "w") as fh:
+            json.dump(results, fh, indent=2)
+
+
+if __name__ == "__main__":
+    main()
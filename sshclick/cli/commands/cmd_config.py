@@ -1,15 +1,17 @@
 import click
 
-from .config import config_set, config_del, config_show
+from sshclick.cli.common import LazyGroup
 
 #------------------------------------------------------------------------------
 # CONFIG Commands
 #------------------------------------------------------------------------------
-@click.group(name="config", help="Modify SSHClick configuration through SSH Config")
+#// Linking other sub-commands (imported only when used)
+SUBCOMMANDS = {
+    "set": "sshclick.cli.commands.config.config_set.cmd",
+    "del": "sshclick.cli.commands.config.config_del.cmd",
+    "show": "sshclick.cli.commands.config.config_show.cmd",
+}
+
+@click.group(name="config", cls=LazyGroup, lazy_subcommands=SUBCOMMANDS, help="Modify SSHClick configuration through SSH Config")
 def ssh_config():
     pass
-
-#// Linking other sub-commands
-ssh_config.add_command(config_set.cmd)
-ssh_config.add_command(config_del.cmd)
-ssh_config.add_command(config_show.cmd)
@@ -1,18 +1,20 @@
 import click
 
-from .group import group_create, group_delete, group_list, group_set, group_show, group_rename
+from sshclick.cli.common import LazyGroup
 
 #------------------------------------------------------------------------------
 # GROUP Commands
 #------------------------------------------------------------------------------
-@click.group(name="group", help="Command group for managing groups")
+#// Linking other sub-commands (imported only when used)
+SUBCOMMANDS = {
+    "create": "sshclick.cli.commands.group.group_create.cmd",
+    "delete": "sshclick.cli.commands.group.group_delete.cmd",
+    "list": "sshclick.cli.commands.group.group_list.cmd",
+    "set": "sshclick.cli.commands.group.group_set.cmd",
+    "show": "sshclick.cli.commands.group.group_show.cmd",
+    "rename": "sshclick.cli.commands.group.group_rename.cmd",
+}
+
+@click.group(name="group", cls=LazyGroup, lazy_subcommands=SUBCOMMANDS, help="Command group for managing groups")
 def ssh_group():
     pass
-
-#// Linking other sub-commands
-ssh_group.add_command(group_create.cmd)
-ssh_group.add_command(group_delete.cmd)
-ssh_group.add_command(group_list.cmd)
-ssh_group.add_command(group_set.cmd)
-ssh_group.add_command(group_show.cmd)
-ssh_group.add_command(group_rename.cmd)
@@ -1,19 +1,22 @@
 import click
 
-from .host import host_create, host_delete, host_list, host_set, host_show, host_rename, host_install_key
+from sshclick.cli.common import LazyGroup
 
 #------------------------------------------------------------------------------
 # HOST Commands
 #------------------------------------------------------------------------------
-@click.group(name="host", help="Command group for managing hosts")
+#// Linking other sub-commands (imported only when used)
+SUBCOMMANDS = {
+    "create": "sshclick.cli.commands.host.host_create.cmd",
+    "delete": "sshclick.cli.commands.host.host_delete.cmd",
+    "list": "sshclick.cli.commands.host.host_list.cmd",
+    "set": "sshclick.cli.commands.host.host_set.cmd",
+    "show": "sshclick.cli.commands.host.host_show.cmd",
+    "rename": "sshclick.cli.commands.host.host_rename.cmd",
+    "install": "sshclick.cli.commands.host.host_install_key.cmd",
+    "check": "sshclick.cli.commands.host.host_check.cmd",
+}
+
+@click.group(name="host", cls=LazyGroup, lazy_subcommands=SUBCOMMANDS, help="Command group for managing hosts")
 def ssh_host():
     pass
-
-#// Linking other sub-commands
-ssh_host.add_command(host_create.cmd)
-ssh_host.add_command(host_delete.cmd)
-ssh_host.add_command(host_list.cmd)
-ssh_host.add_command(host_set.cmd)
-ssh_host.add_command(host_show.cmd)
-ssh_host.add_command(host_rename.cmd)
-ssh_host.add_command(host_install_key.cmd)
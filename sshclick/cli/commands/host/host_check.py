@@ -0,0 +1,84 @@
+import click
+from sshclick.core import SSH_Config, HostType
+from sshclick.core import check_reachability, complete_ssh_group_names, complete_ssh_host_names, expand_names
+from sshclick.globals import REACHABILITY_CONCURRENCY, SSH_CONNECT_TIMEOUT
+
+from rich.console import Console
+from rich.table import Table
+from rich import box
+console = Console()
+
+#------------------------------------------------------------------------------
+# COMMAND: host check
+#------------------------------------------------------------------------------
+SHORT_HELP = "Check TCP reachability of hosts"
+LONG_HELP  = """
+Check if hosts accept TCP connections on their SSH address and port
+
+Command opens TCP connection to "hostname" and "port" (including inherited values) of
+every selected host, and reports if connection was accepted and how long it took.
+Only TCP handshake is done, no SSH session is started, and "proxyjump" is not followed,
+so hosts behind jump proxies are checked directly from this machine.
+Many hosts are checked concurrently, so even thousands of hosts are done in seconds.
+
+Hosts can be selected by NAMES (with "r:" prefix used as regex, same as for "host delete"),
+and/or by --group option (can be repeated, also supports "r:" prefix).
+When nothing is selected, all hosts are checked. Exit code is 1 if any host is offline.
+
+\b
+Example: (sshc host check -g r:^prod r:^lb-)
+-> checks all hosts in groups starting with "prod", and all hosts starting with "lb-"
+"""
+
+# Parameters help:
+GROUP_HELP       = "Check all hosts in group (repeatable, 'r:' prefix for regex)"
+TIMEOUT_HELP     = "Timeout for each TCP connection (seconds)"
+CONCURRENCY_HELP = "Max number of connections opened at the same time"
+#------------------------------------------------------------------------------
+
+@click.command(name="check", short_help=SHORT_HELP, help=LONG_HELP)
+@click.option("-g", "--group", "groups", multiple=True, help=GROUP_HELP, shell_complete=complete_ssh_group_names)
+@click.option("--timeout", default=SSH_CONNECT_TIMEOUT, type=float, show_default=True, help=TIMEOUT_HELP)
+@click.option("--concurrency", default=REACHABILITY_CONCURRENCY, type=click.IntRange(min=1), show_default=True, help=CONCURRENCY_HELP)
+@click.argument("names", nargs=-1, shell_complete=complete_ssh_host_names)
+@click.pass_context
+def cmd(ctx, names, groups, timeout, concurrency):
+    config: SSH_Config = ctx.obj
+
+    selected_names = set(expand_names(names, config.get_all_host_names()))
+    for name in selected_names:
+        if not config.check_host_by_name(name):
+            print(f"Unknown host '{name}'!")
+            ctx.exit(1)
+
+    selected_groups = set(expand_names(groups, config.get_all_group_names()))
+    for group_name in selected_groups:
+        if not config.check_group_by_name(group_name):
+            print(f"Unknown group '{group_name}'!")
+            ctx.exit(1)
+
+    # Patterns have no address to check, only concrete hosts are checked
+    select_all = not names and not groups
+    hosts = [
+        host for host in config.all_hosts
+        if host.type == HostType.NORMAL and (select_all or host.name in selected_names or host.group in selected_groups)
+    ]
+    if not hosts:
+        print("No host is matching given selection!")
+        ctx.exit(1)
+
+    results = check_reachability(hosts, concurrency=concurrency, timeout=timeout)
+
+    table = Table("name", "group", "address", "port", "status", "latency", box=box.SQUARE, style="gray35")
+    for host, result in zip(hosts, results):
+        if result.online:
+            status, latency = "[green]online[/]", f"{result.latency * 1000:.1f} ms"
+        else:
+            status, latency = "[red]offline[/]", result.error
+        table.add_row(host.name, host.group, result.address, str(result.port or ""), status, latency)
+    console.print(table)
+
+    online = sum(1 for result in results if result.online)
+    print(f"{online}/{len(results)} hosts online")
+    if online != len(results):
+        ctx.exit(1)
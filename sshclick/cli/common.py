@@ -1,21 +1,61 @@
+"""CLI-specific helpers and command wiring for SSHClick."""
+
+import importlib
 import os.path
+from typing import TYPE_CHECKING
+
+import click
 
 from sshclick.globals import USER_SSH_CONFIG
-from sshclick.core import SSH_Config
+
+if TYPE_CHECKING:
+    from sshclick.core import SSH_Config
 
 CONTEXT_SETTINGS = {"help_option_names": ["-h", "--help"]}
 SSHCONFIG_ENVVAR = "SSHC_CONFIG"
 SSHCONFIG_HELP = f"Config file (default: {USER_SSH_CONFIG}). Can be set with SSHC_CONFIG."
 
 
+class LazyGroup(click.Group):
+    """
+    Click group that imports its sub-commands only when they are needed.
+
+    Sub-commands are given as `{name: "module.path.attribute"}`, and a module is
+    imported the first time its command is resolved (invoked, completed, or
+    listed in help). This keeps `sshc --version` and shell completion from
+    loading every command module and their Rich dependencies.
+    """
+
+    def __init__(self, *args, lazy_subcommands: dict[str, str] | None = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = dict(lazy_subcommands or {})
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        return sorted(set(super().list_commands(ctx)) | set(self.lazy_subcommands))
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        if cmd_name in self.lazy_subcommands:
+            self.add_command(self._load_command(cmd_name), cmd_name)
+            del self.lazy_subcommands[cmd_name]
+        return super().get_command(ctx, cmd_name)
+
+    def _load_command(self, cmd_name: str) -> click.Command:
+        module_name, attr_name = self.lazy_subcommands[cmd_name].rsplit(".", 1)
+        command = getattr(importlib.import_module(module_name), attr_name)
+        if not isinstance(command, click.Command):
+            raise TypeError(f"Lazy loaded '{cmd_name}' from '{module_name}' is not a click command!")
+        return command
+
+
 def expand_config_path(config: str) -> str:
     """Expand `~` in the configured SSH config path."""
 
     return os.path.expanduser(config)
 
 
-def load_ssh_config(config: str, *, stdout: bool = False, diff: bool = False) -> SSH_Config:
+def load_ssh_config(config: str, *, stdout: bool = False, diff: bool = False, use_cache: bool = True) -> "SSH_Config":
     """Load and parse the SSHClick config model for CLI/TUI entrypoints."""
 
-    return SSH_Config(file=expand_config_path(config), stdout=stdout, diff=diff).read().parse()
+    from sshclick.core import load_ssh_config_cached
 
+    return load_ssh_config_cached(expand_config_path(config), stdout=stdout, diff=diff, use_cache=use_cache)
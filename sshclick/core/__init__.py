@@ -1,7 +1,10 @@
+from .ssh_cache import get_cache_dir, load_ssh_config_cached
 from .ssh_config import SSH_Config
 from .ssh_graph import generate_graph
 from .ssh_group import SSH_Group
 from .ssh_host import HostType, SSH_Host
+from .ssh_names import SSH_ConfigNames, load_config_names, scan_config_names
+from .ssh_patterns import SSH_PatternIndex
 from .ssh_parameters import (
     ALL_PARAM_LC_NAMES,
     ALL_PARAMS,
@@ -12,6 +15,8 @@ from .ssh_parameters import (
     get_param_description,
     get_param_spec,
 )
+from .ssh_reachability import ReachabilityResult, check_reachability
+from .ssh_search import SSH_HostSearchIndex
 from .ssh_utils import (
     build_context_config,
     complete_params,
@@ -21,6 +26,7 @@ from .ssh_utils import (
     expand_names,
     filter_dict,
 )
+from .ssh_watch import SSH_ConfigWatcher
 
 __all__ = [
     "ALL_PARAMS",
@@ -28,11 +34,17 @@ __all__ = [
     "ALL_PARAM_SPECS",
     "HostType",
     "PARAMS_WITH_ALLOWED_MULTIPLE_VALUES",
+    "ReachabilityResult",
     "SSHParameterSpec",
     "SSH_Config",
+    "SSH_ConfigWatcher",
+    "SSH_ConfigNames",
     "SSH_Group",
     "SSH_Host",
+    "SSH_HostSearchIndex",
+    "SSH_PatternIndex",
     "build_context_config",
+    "check_reachability",
     "complete_params",
     "complete_ssh_group_names",
     "complete_ssh_host_names",
@@ -43,4 +55,8 @@ __all__ = [
     "get_param_description",
     "get_param_spec",
     "generate_graph",
+    "get_cache_dir",
+    "load_config_names",
+    "load_ssh_config_cached",
+    "scan_config_names",
 ]
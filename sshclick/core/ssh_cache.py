@@ -0,0 +1,157 @@
+import glob
+import hashlib
+import os
+import pickle
+from typing import Optional
+
+from .ssh_config import SSH_Config
+
+from sshclick.logging import debug
+from sshclick.version import VERSION
+
+# Bump when cached model layout changes in a way that old entries cannot be reused
+CACHE_FORMAT = 4
+
+# Runtime-only attributes that are never persisted, they are always set by current invocation
+CACHE_SKIPPED_ATTRS = {"stdout", "diff", "config_lines_full", "_dirty_hosts", "_dirty_groups"}
+
+FileSignature = tuple[str, int, int, int]
+
+
+def get_cache_dir() -> str:
+    """Return SSHClick cache folder, following XDG base directory spec."""
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+    return os.path.join(cache_home, "sshclick")
+
+
+def _cache_file_path(config_path: str, kind: str = "parse", extension: str = "pickle") -> str:
+    digest = hashlib.sha256(os.path.abspath(config_path).encode()).hexdigest()[:32]
+    return os.path.join(get_cache_dir(), f"{kind}-{digest}.{extension}")
+
+
+def _file_signature(path: str) -> Optional[FileSignature]:
+    """Return (path, mtime, size, inode) signature for file, or None if it cannot be checked."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (path, st.st_mtime_ns, st.st_size, st.st_ino)
+
+
+def _glob_include_patterns(patterns: list[str]) -> list[str]:
+    """Re-evaluate Include globs, so files added or removed later invalidate the cache."""
+    matched_paths = [os.path.abspath(path) for pattern in patterns for path in sorted(glob.glob(pattern))]
+    return list(dict.fromkeys(matched_paths))
+
+
+def _config_signatures(config: SSH_Config) -> Optional[list[FileSignature]]:
+    signatures = []
+    for path in [os.path.abspath(config.ssh_config_file)] + config.included_files:
+        signature = _file_signature(path)
+        if signature is None:
+            return None
+        signatures.append(signature)
+    return signatures
+
+
+def load_cached_config(config_path: str, *, stdout: bool = False, diff: bool = False) -> Optional[SSH_Config]:
+    """
+    Return the cached parsed model for `config_path`, if it is still valid.
+
+    The entry is valid only when the root config and every resolved include
+    have the same path, mtime, size and inode as when the entry was stored, and
+    include globs still resolve to the same files. Any mismatch or unreadable
+    entry is treated as a cache miss.
+    """
+    cache_path = _cache_file_path(config_path)
+    try:
+        with open(cache_path, "rb") as fh:
+            entry = pickle.load(fh)
+    except FileNotFoundError:
+        return None
+    except Exception as exc:
+        debug(f"Ignoring unreadable SSH config cache ({cache_path}): {exc}")
+        return None
+
+    if not isinstance(entry, dict) or entry.get("format") != CACHE_FORMAT or entry.get("version") != VERSION:
+        debug(f"Ignoring SSH config cache from other sshclick version ({cache_path})")
+        return None
+
+    signatures = entry["signatures"]
+    if any(_file_signature(signature[0]) != signature for signature in signatures):
+        debug(f"SSH config cache is stale ({cache_path})")
+        return None
+
+    state = entry["model"]
+    if _glob_include_patterns(state.get("include_patterns", [])) != state.get("included_files", []):
+        debug(f"SSH config cache is stale, included files changed ({cache_path})")
+        return None
+
+    config = SSH_Config(file=config_path, stdout=stdout, diff=diff)
+    config.__dict__.update(state)
+    debug(f"Loaded SSH config model from cache ({cache_path})")
+    return config
+
+
+def store_cached_config(config: SSH_Config, root_signature: Optional[FileSignature] = None) -> bool:
+    """
+    Persist a parsed model for later invocations.
+
+    When `root_signature` is given (taken before reading the config), the entry
+    is stored only if the root file did not change while it was being parsed.
+    Failures to write the cache are never fatal, the model is simply not cached.
+    """
+    if config.ssh_config_file is None:
+        return False
+
+    signatures = _config_signatures(config)
+    if signatures is None:
+        return False
+    if root_signature is not None and signatures[0] != root_signature:
+        return False
+
+    state = {key: value for key, value in config.__dict__.items() if key not in CACHE_SKIPPED_ATTRS}
+    entry = {"format": CACHE_FORMAT, "version": VERSION, "signatures": signatures, "model": state}
+
+    cache_path = _cache_file_path(config.ssh_config_file)
+    if not _write_cache_file(cache_path, pickle.dumps(entry, protocol=pickle.HIGHEST_PROTOCOL)):
+        return False
+
+    debug(f"Stored SSH config model to cache ({cache_path})")
+    return True
+
+
+def _write_cache_file(cache_path: str, content: bytes) -> bool:
+    """Atomically replace cache file content, so concurrent runs never see a partial entry."""
+    import tempfile
+
+    cache_dir = os.path.dirname(cache_path)
+    try:
+        os.makedirs(cache_dir, mode=0o700, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, prefix=".cache-", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as fh:
+                fh.write(content)
+            os.replace(tmp_path, cache_path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except Exception as exc:
+        debug(f"Failed storing cache file ({cache_path}): {exc}")
+        return False
+    return True
+
+
+def load_ssh_config_cached(config_path: str, *, stdout: bool = False, diff: bool = False, use_cache: bool = True) -> SSH_Config:
+    """Read and parse SSH config, reusing the persistent parse cache when enabled."""
+    if not use_cache:
+        return SSH_Config(file=config_path, stdout=stdout, diff=diff).read().parse()
+
+    config = load_cached_config(config_path, stdout=stdout, diff=diff)
+    if config is not None:
+        return config
+
+    root_signature = _file_signature(os.path.abspath(config_path))
+    config = SSH_Config(file=config_path, stdout=stdout, diff=diff).read().parse()
+    store_cached_config(config, root_signature)
+    return config
@@ -1,17 +1,20 @@
 import os
 import re
-import fnmatch
 import time
 import glob
 import shlex
+import sys
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass
 from enum import Enum
-from typing import Optional
+from typing import Optional, TextIO
 
 from .ssh_host import SSH_Host, HostType
 from .ssh_group import SSH_Group
 from .ssh_diff import output_diff
 from .ssh_parameters import PARAMS_WITH_ALLOWED_MULTIPLE_VALUES
+from .ssh_patch import LinePatch, plan_line_patch
+from .ssh_patterns import SSH_PatternIndex
 
 from sshclick.globals import (
     DEFAULT_GROUP_DESC,
@@ -45,6 +48,21 @@ class ConfigLine:
     source_line: int
 
 
+# Visual separator line, used around group headers
+HLINE_RE = re.compile(r"^#-+$")
+
+
+def expand_include_patterns(value: str, base_dir: str) -> list[str]:
+    """Expand user/env references in `Include` value, making relative patterns relative to `base_dir`."""
+    patterns = []
+    for pattern in shlex.split(value):
+        expanded_pattern = os.path.expandvars(os.path.expanduser(pattern))
+        if not os.path.isabs(expanded_pattern):
+            expanded_pattern = os.path.join(base_dir, expanded_pattern)
+        patterns.append(expanded_pattern)
+    return patterns
+
+
 class SSH_Config:
     """
     SSH Configuration class
@@ -65,11 +83,19 @@ class SSH_Config:
         self.ssh_config_lines: list[str] = list(config_lines) if config_lines is not None else []
         self.config_lines_full: list[ConfigLine] = []
         self.included_files: list[str] = []
+        self.include_patterns: list[str] = []     # Expanded Include globs, kept to detect added/removed include files
 
         # configuration representation (array of SSH groups?)
         self.groups: list[SSH_Group] = [SSH_Group(name=DEFAULT_GROUP_NAME, desc=DEFAULT_GROUP_DESC)]
         self.all_hosts: list[SSH_Host] = []
 
+        # name lookup indexes, kept in sync by parser and model mutation methods
+        self._host_index: dict[str, SSH_Host] = {}
+        self._host_alt_index: dict[str, SSH_Host] = {}
+        self._group_index: dict[str, SSH_Group] = {}
+        self._indexed_host_count: int = 0
+        self._indexed_group_count: int = 0
+
         # options
         self.write_locked: bool = False     # Internal "safety" for not allowing to change original file when writing is unsafe
         self.write_locked_reason: str = ""
@@ -78,15 +104,34 @@ class SSH_Config:
         self.opts: dict = {}
 
         # parsing "cache" info
-        self.current_grindex: int = 0
+        self.current_group_entry: SSH_Group = self.groups[0]
         self.current_group: str = DEFAULT_GROUP_NAME
         self.current_host: Optional[SSH_Host] = None
         self.current_host_info: list = []
         self.current_host_pass: str = ""
+        self.current_host_start: Optional[int] = None    # First line index of current host block (including host info)
+        self.current_host_end: int = 0                   # Line index after last line of current host block
+        self.current_info_start: Optional[int] = None    # Line index of first pending host info line
+
+        # change tracking, used to write back only modified blocks (see ssh_patch.py)
+        self._line_spans_valid: bool = False
+        self._source_opts: dict = {}
+        self._source_global_params: dict = {}
+        self._block_count: int = 0    # Expected number of hosts and patterns in groups, kept by model methods
+        self._removed_spans: list[tuple[int, int]] = []
+        self._dirty_hosts: dict[int, tuple[SSH_Host, bool]] = {}
+        self._dirty_groups: dict[int, SSH_Group] = {}
+
+        # per source file parse state, used to re-parse a single changed file (see parse_source_file)
+        self._source_starts: dict[str, tuple[str, list]] = {}   # {file: (group, pending host info)} at file start
+        self._source_ends: dict[str, str] = {}                  # {file: group} at file end, next file continues in it
+        self._entangled_files: set[str] = set()                 # Files sharing host block or host info with neighbor file
 
         # Support for global keywords
         self.global_params: dict = {}
 
+        self._rebuild_indexes()
+
 
     def _set_write_locked(self, reason: str) -> None:
         self.write_locked = True
@@ -106,10 +151,8 @@ class SSH_Config:
     def _resolve_include_paths(self, value: str, base_dir: str) -> list[str]:
         include_paths: list[str] = []
 
-        for pattern in shlex.split(value):
-            expanded_pattern = os.path.expandvars(os.path.expanduser(pattern))
-            if not os.path.isabs(expanded_pattern):
-                expanded_pattern = os.path.join(base_dir, expanded_pattern)
+        for expanded_pattern in expand_include_patterns(value, base_dir):
+            self.include_patterns.append(expanded_pattern)
 
             matched_paths = sorted(glob.glob(expanded_pattern))
             if matched_paths:
@@ -173,20 +216,91 @@ class SSH_Config:
         return records
 
 
-    def _get_or_create_group_index(self, name: str, source_file: Optional[str] = None, source_line: int = 0) -> int:
-        for index, group in enumerate(self.groups):
-            if group.name == name:
-                if source_file:
-                    source_ref = (source_file, source_line)
-                    if source_ref not in group.source_refs:
-                        group.source_refs.append(source_ref)
-                return index
+    def _get_or_create_group(self, name: str, source_file: Optional[str] = None, source_line: int = 0) -> SSH_Group:
+        group = self._lookup_group(name)
+        if group is not None:
+            if source_file:
+                source_ref = (source_file, source_line)
+                if source_ref not in group.source_refs:
+                    group.source_refs.append(source_ref)
+            return group
 
         new_group = SSH_Group(name=name)
         if source_file:
             new_group.source_refs.append((source_file, source_line))
-        self.groups.append(new_group)
-        return len(self.groups) - 1
+        self.add_group(new_group)
+        return new_group
+
+
+    def _rebuild_indexes(self) -> None:
+        """
+        Recreate host and group name indexes from the model lists.
+
+        The first defined host or group wins for duplicated names, same as the
+        previous linear lookups did. Alternative host names are kept in a
+        separate index, so they never shadow a primary host name.
+        """
+        self._host_index = {}
+        self._host_alt_index = {}
+        for host in self.all_hosts:
+            self._host_index.setdefault(host.name, host)
+            for alt_name in host.alt_names:
+                self._host_alt_index.setdefault(alt_name, host)
+
+        self._group_index = {}
+        for group in self.groups:
+            self._group_index.setdefault(group.name, group)
+
+        self._indexed_host_count = len(self.all_hosts)
+        self._indexed_group_count = len(self.groups)
+
+
+    def _sync_indexes(self) -> None:
+        # Model lists can still be changed directly (not via methods), so detect that and re-index
+        if self._indexed_host_count != len(self.all_hosts) or self._indexed_group_count != len(self.groups):
+            self._rebuild_indexes()
+
+
+    def _index_host(self, host: SSH_Host) -> None:
+        self._host_index.setdefault(host.name, host)
+        for alt_name in host.alt_names:
+            self._host_alt_index.setdefault(alt_name, host)
+        self._indexed_host_count = len(self.all_hosts)
+
+
+    def _unindex_host(self, host: SSH_Host, name: Optional[str] = None) -> None:
+        """Drop index entries pointing to host, falling back to any duplicate defined with the same name."""
+        name = host.name if name is None else name
+        if self._host_index.get(name) is host:
+            del self._host_index[name]
+            duplicate = next((other for other in self.all_hosts if other.name == name and other is not host), None)
+            if duplicate is not None:
+                self._host_index[name] = duplicate
+
+        for alt_name in host.alt_names:
+            if self._host_alt_index.get(alt_name) is host:
+                del self._host_alt_index[alt_name]
+        self._indexed_host_count = len(self.all_hosts)
+
+
+    def _lookup_host(self, name: str) -> Optional[SSH_Host]:
+        self._sync_indexes()
+        host = self._host_index.get(name) or self._host_alt_index.get(name)
+        if host is not None and host.name != name and name not in host.alt_names:
+            # Host was renamed outside of model methods, index is stale
+            self._rebuild_indexes()
+            host = self._host_index.get(name) or self._host_alt_index.get(name)
+        return host
+
+
+    def _lookup_group(self, name: str) -> Optional[SSH_Group]:
+        self._sync_indexes()
+        group = self._group_index.get(name)
+        if group is not None and group.name != name:
+            # Group was renamed outside of model methods, index is stale
+            self._rebuild_indexes()
+            group = self._group_index.get(name)
+        return group
 
 
     def read(self):
@@ -239,12 +353,17 @@ class SSH_Config:
         Internal function used to flush host configuration while parsing config file
         """
         if self.current_host:
+            if self.current_host_start is not None:
+                self.current_host.source_span = (self.current_host_start, self.current_host_end)
+                self.current_host_start = None
+
             if self.current_host.type == HostType.NORMAL:
-                self.groups[self.current_grindex].hosts.append(self.current_host)
+                self.current_group_entry.hosts.append(self.current_host)
             else:
-                self.groups[self.current_grindex].patterns.append(self.current_host)
+                self.current_group_entry.patterns.append(self.current_host)
 
             self.all_hosts.append(self.current_host)
+            self._index_host(self.current_host)
             # Reset "cache" since we flushed host info
             self.current_host = None
 
@@ -257,14 +376,30 @@ class SSH_Config:
         limited to OpenSSH keywords alone. Once all lines are consumed, a second
         pass resolves inherited parameters from globals and pattern hosts.
         """
+        root_file = os.path.abspath(self.ssh_config_file) if self.ssh_config_file else None
         if not self.config_lines_full:
-            self.config_lines_full = self._build_line_records(self.ssh_config_lines, self.ssh_config_file)
+            self.config_lines_full = self._build_line_records(self.ssh_config_lines, root_file)
+
+        # Line spans of host blocks and group headers in root config, used for minimal-change write-back
+        self._line_spans_valid = True
+        header_group: Optional[SSH_Group] = None    # Group whose header block is still being extended
+        header_end = 0
+        previous_file: Optional[str] = None
 
         # Parse each line of the configuration, line by line
         for config_line in self.config_lines_full:
             source_file = config_line.source_file
             line_number = config_line.source_line
+            if source_file != previous_file:
+                if self.current_host_info and previous_file is not None:
+                    # Host info at the end of one file applies to first host of next file
+                    self._entangled_files.update([previous_file, source_file])
+                if previous_file is not None:
+                    self._source_ends[previous_file] = self.current_group
+                self._source_starts.setdefault(source_file, (self.current_group, list(self.current_host_info)))
+                previous_file = source_file
             source_label = f"{source_file}:{line_number}" if source_file else f"line {line_number}"
+            line_index = line_number - 1 if source_file == root_file else None
             line = config_line.text.strip()     # remove start and end whitespace
             if not line:
                 continue   # Skip empty lines, go to next...
@@ -281,6 +416,11 @@ class SSH_Config:
 
                 # If we didn't find metadata, its just comment or something we dont care about
                 if not match:
+                    if header_group is not None and line_index == header_group.header_span[1] and HLINE_RE.match(line):
+                        # Separator line closes group header block
+                        header_group.header_span = (header_group.header_span[0], line_index + 1)
+                        header_end = line_index + 1
+                    header_group = None
                     continue
                 
                 # extract two items expected in matching group
@@ -296,28 +436,48 @@ class SSH_Config:
                 elif metadata == MetaTAG.GNAME:
                     # New group found... flush any previous data and create new baseline
                     self._config_flush_host()
+                    if self.current_host_info:
+                        # Host info above group header cannot be kept as part of a single host block
+                        self._line_spans_valid = False
 
                     debug(f"META group: '{value}'")
-                    self.current_grindex = self._get_or_create_group_index(value, source_file, line_number)
+                    self.current_group_entry = self._get_or_create_group(value, source_file, line_number)
                     self.current_group = value
-                    debug(f"META Group index: {self.current_grindex}")
+
+                    header_group = None
+                    if line_index is not None and self.current_group_entry.header_span is None:
+                        header_start = line_index
+                        if line_index > header_end and HLINE_RE.match(self.ssh_config_lines[line_index - 1].strip()):
+                            header_start -= 1
+                        header_group = self.current_group_entry
+                        header_group.header_span = (header_start, line_index + 1)
+                        header_end = line_index + 1
                     continue
 
                 elif metadata == MetaTAG.GDESC:
                     debug(f"META Group description: '{value}'")
-                    if not self.groups[self.current_grindex].desc:
-                        self.groups[self.current_grindex].desc = value
+                    if not self.current_group_entry.desc:
+                        self.current_group_entry.desc = value
+                    if header_group is not None and line_index == header_group.header_span[1]:
+                        header_group.header_span = (header_group.header_span[0], line_index + 1)
+                        header_end = line_index + 1
                     continue
 
                 elif metadata == MetaTAG.GINFO:
                     debug(f"META Group info: '{value}'")
-                    if value not in self.groups[self.current_grindex].info:
-                        self.groups[self.current_grindex].info.append(value)
+                    if value not in self.current_group_entry.info:
+                        self.current_group_entry.info.append(value)
+                    if header_group is not None and line_index == header_group.header_span[1]:
+                        header_group.header_span = (header_group.header_span[0], line_index + 1)
+                        header_end = line_index + 1
                     continue
 
                 elif metadata == MetaTAG.HINFO:
                     debug(f"META Host info cached: '{value}'")
                     self.current_host_info.append(value)
+                    if self.current_info_start is None:
+                        self.current_info_start = line_index
+                    header_group = None
                     continue
 
                 else:
@@ -334,6 +494,7 @@ class SSH_Config:
 
             keyword, value = match.groups()
             keyword = keyword.lower()         # keywords are case insensitive, so we lowercase them
+            header_group = None
             
             # First we need to handle "top-level" keywords that defines host blocks or special behavior
             # ----- INCLUDE -----
@@ -343,6 +504,8 @@ class SSH_Config:
             # ----- MATCH -----
             elif keyword == "match":
                 warn("Unsupported keyword 'Match' found, ignoring...")
+                # Following keywords are attached to previous host, so its block cannot be patched alone
+                self._line_spans_valid = False
 
             # ----- HOST -----
             elif keyword == "host":
@@ -370,6 +533,10 @@ class SSH_Config:
 
                 # debug(f"SSH Host definition created: {new_host}")
                 self.current_host = new_host
+                if line_index is not None:
+                    self.current_host_start = self.current_info_start if self.current_info_start is not None else line_index
+                    self.current_host_end = line_index + 1
+                self.current_info_start = None
 
                 # Reset global host info cache when we find new host (from this line, any host comments will apply to next host)
                 self.current_host_info = []
@@ -390,6 +557,14 @@ class SSH_Config:
                         self.global_params[keyword] = value
                 else:
                     debug(f"SSH Config keyword for host '{self.current_host.name}': {keyword} -> {value}")
+                    if self.current_host.source_file != (source_file or ""):
+                        # Host block started in previous file continues in this one
+                        self._entangled_files.update([self.current_host.source_file, source_file])
+                    if line_index is not None:
+                        if self.current_info_start is not None:
+                            # Host info of next host is placed between keywords of current host
+                            self._line_spans_valid = False
+                        self.current_host_end = line_index + 1
                     if keyword in PARAMS_WITH_ALLOWED_MULTIPLE_VALUES:
                         if keyword not in self.current_host.params:
                             self.current_host.params[keyword] = [value]
@@ -400,6 +575,9 @@ class SSH_Config:
         
         # Last entries must be flushed manually as there are no new "hosts" to trigger storing parsed data into config struct
         self._config_flush_host()
+        if previous_file is not None:
+            self._source_ends[previous_file] = self.current_group
+        self._reset_change_tracking()
 
         # Second stage, check any inheritances and fill it in
         self._check_inheritance()
@@ -407,9 +585,28 @@ class SSH_Config:
         return self
 
 
-    def _check_inheritance(self):
+    def _build_pattern_index(self) -> tuple[SSH_PatternIndex, list[tuple[int, SSH_Host]]]:
+        """
+        Index all pattern hosts once, keeping their position in `all_hosts`.
+
+        The returned list is aligned with index ordinals, so a match can be
+        mapped back to the pattern host and whether it is defined before or
+        after the host being resolved.
         """
-        Resolve effective parameters for each normal host.
+        pattern_index = SSH_PatternIndex()
+        pattern_hosts: list[tuple[int, SSH_Host]] = []
+
+        for position, host in enumerate(self.all_hosts):
+            if host.type == HostType.PATTERN:
+                pattern_index.add(host.name)
+                pattern_hosts.append((position, host))
+
+        return pattern_index, pattern_hosts
+
+
+    def _check_inheritance(self, hosts: Optional[list[SSH_Host]] = None):
+        """
+        Resolve effective parameters for each normal host (or only for given `hosts`).
 
         The algorithm follows SSHClick's current interpretation of OpenSSH order:
         global parameters are applied first, then pattern hosts are considered in
@@ -418,7 +615,18 @@ class SSH_Config:
         if DEBUG:
             start = time.time()
 
-        for host in self.all_hosts:
+        # Patterns are indexed once, so each host only visits patterns that actually match it
+        pattern_index, pattern_hosts = self._build_pattern_index()
+
+        if DEBUG:
+            debug(f"Pattern index built for {len(pattern_index)} patterns: {time.time() - start:0.6f}s")
+
+        positioned_hosts: Iterable[tuple[int, SSH_Host]] = enumerate(self.all_hosts)
+        if hosts is not None:
+            wanted = {id(host) for host in hosts}
+            positioned_hosts = [(position, host) for position, host in positioned_hosts if id(host) in wanted]
+
+        for position, host in positioned_hosts:
             # We only check what "normal" hosts inherits
             if host.type == HostType.PATTERN:
                 continue
@@ -429,147 +637,370 @@ class SSH_Config:
                 if param not in host.matched_params:
                     host.matched_params[param] = (value, "global")
 
-            # NOTE: This has added almost O^2 complexity with the number of hosts
-            #       We need to find a way to optimize this, if it becomes a problem
-            before = True
-            for other_host in self.all_hosts:
-                # Skip current host, and mark that we have passed it
-                if other_host == host:
-                    before = False
-                    continue
-                
-                # We test only pattern hosts, and if they match the name of current host
-                if other_host.type == HostType.PATTERN and fnmatch.fnmatch(host.name, other_host.name):
-                    for param, value in other_host.params.items():
-                        if before:
-                            # If parameter is seen before in used params, first instance is then already
-                            # seen, and we dont care about this value anymore
-                            if param not in host.matched_params:
-                                host.matched_params[param] = (value, other_host.name)
-                        else:
-                            # If matching host is after current host, store parameter only if it is not
-                            # already defined in current host parameters or used parameters that are inherited
-                            if param in host.params:
-                                continue
-                            if param in host.matched_params:
-                                continue
-                            # if param not in host.params or param not in host.matched_params:
-                            host.matched_params[param] = (value, other_host.name)
+            # Matches come back in file order, so "before" is decided by position against current host
+            for ordinal in pattern_index.match(host.name):
+                pattern_position, pattern_host = pattern_hosts[ordinal]
+                before = pattern_position < position
+
+                for param, value in pattern_host.params.items():
+                    if before:
+                        # If parameter is seen before in used params, first instance is then already
+                        # seen, and we dont care about this value anymore
+                        if param not in host.matched_params:
+                            host.matched_params[param] = (value, pattern_host.name)
+                    else:
+                        # If matching host is after current host, store parameter only if it is not
+                        # already defined in current host parameters or used parameters that are inherited
+                        if param in host.params:
+                            continue
+                        if param in host.matched_params:
+                            continue
+                        host.matched_params[param] = (value, pattern_host.name)
         if DEBUG:
             end = time.time() - start
             debug(f"Inheritance check elapsed: {end:0.6f}s")
-            # inspect(self, all=True)
 
 
-    def generate_ssh_config(self) -> bool:
+    def resolve_inheritance(self, hosts: list[SSH_Host]) -> list[SSH_Host]:
+        """Resolve inherited parameters again for given hosts only, returning hosts whose inherited values changed."""
+        previous = {id(host): host.matched_params for host in hosts}
+        for host in hosts:
+            host.matched_params = {}
+        self._check_inheritance(hosts)
+        return [host for host in hosts if host.matched_params != previous[id(host)]]
+
+
+    def parse_source_file(self, path: str, lines: list[str]) -> Optional["SSH_Config"]:
         """
-        Render the in-memory model back into SSH config text.
+        Parse new content of one source file alone, as a separate config model.
 
-        Depending on the active mode, the rendered output is written back to the
-        original file, sent to stdout, or diffed against the original content.
-        When the config is write-locked or only exists in memory, rendering still
-        happens but disk writes are skipped.
+        Included file is parsed starting with the group and pending host info it
+        had in full parse, so its hosts land in same groups as they would in full
+        parse. Returns None when file cannot be parsed alone: root config that
+        has includes, changed global keywords or options, or a file that shares
+        host block or host info with neighbor file.
         """
-        # If config is write locked, dont allow saving
-        if self.write_locked:
-            warn("Configuration modification is disabled")
-            warn(self.write_locked_reason)
-            return False
+        path = os.path.abspath(path)
+        root_file = os.path.abspath(self.ssh_config_file) if self.ssh_config_file else None
+        if path in self._entangled_files or path not in self._source_starts:
+            return None
+
+        if path == root_file:
+            if self.included_files:
+                return None
+            source = SSH_Config(path, lines)
+            source.config_lines_full = source._build_line_records(lines, path)
+            source.parse()
+            if source.global_params != self.global_params or source.opts != self.opts or source.write_locked:
+                return None
+        else:
+            source = SSH_Config(None)
+            source.config_lines_full = self._build_line_records(lines, path)
+            start_group, start_info = self._source_starts[path]
+            source.current_group = start_group
+            source.current_group_entry = source._get_or_create_group(start_group)
+            source.current_host_info = list(start_info)
+            source.parse()
+            if source.global_params or source.opts or source.write_locked or source.current_host_info:
+                return None
+            if source.current_group != self._source_ends.get(path):
+                # Hosts in next file would continue in other group
+                return None
+        return source
 
-        # Prepare all lines for configuration
-        lines: list[str] = [SSHCONFIG_SIGNATURE_LINE]
+
+    def replace_source_hosts(self, path: str, old_hosts: list[SSH_Host], new_hosts: list[SSH_Host], source: "SSH_Config") -> None:
+        """
+        Replace hosts defined in one source file with hosts from its re-parsed `source` model.
+
+        Hosts of one file are always one continuous run in `all_hosts`, which is
+        replaced in place, then member lists of affected groups and name indexes
+        are rebuilt. Group source references (and line layout of root config)
+        are taken from `source`, and it becomes new baseline for change tracking.
+        """
+        path = os.path.abspath(path)
+        if old_hosts:
+            start = next(index for index, host in enumerate(self.all_hosts) if host is old_hosts[0])
+            self.all_hosts[start:start + len(old_hosts)] = new_hosts
+        else:
+            self.all_hosts.extend(new_hosts)
+
+        touched = {host.group for host in old_hosts} | {host.group for host in new_hosts}
+        source_groups = {group.name: group for group in source.groups}
+        for group in self.groups:
+            if group.name in source_groups:
+                refs = [ref for ref in group.source_refs if ref[0] != path]
+                group.source_refs = refs + [(path, line) for _, line in source_groups[group.name].source_refs]
+            if group.name in touched:
+                group.hosts, group.patterns = [], []
+        for host in self.all_hosts:
+            if host.group in touched:
+                group = self._lookup_group(host.group)
+                (group.hosts if host.type == HostType.NORMAL else group.patterns).append(host)
+
+        root_file = os.path.abspath(self.ssh_config_file) if self.ssh_config_file else None
+        if path == root_file:
+            # Whole root config was re-parsed, so its line layout replaces the old one
+            self.ssh_config_lines = source.ssh_config_lines
+            self._line_spans_valid = source._line_spans_valid
+            for group in self.groups:
+                group.header_span = source_groups[group.name].header_span if group.name in source_groups else None
+
+        self._rebuild_indexes()
+        self._reset_change_tracking()
+
+
+    def _render_group_header(self, group: SSH_Group) -> list[str]:
+        comment_hline = f"#{'-' * 79}"
+
+        # Add extra blank line when outputting new group header
+        lines = ["", comment_hline]
+
+        # Start header line for the group with known metadata
+        lines.append(f"#{SSHCONFIG_META_PREFIX}{MetaTAG.GNAME.value}{SSHCONFIG_META_SEPARATOR} {group.name}")
+
+        if group.desc:
+            lines.append(f"#{SSHCONFIG_META_PREFIX}{MetaTAG.GDESC.value}{SSHCONFIG_META_SEPARATOR} {group.desc}")
+
+        for info in group.info:
+            lines.append(f"#{SSHCONFIG_META_PREFIX}{MetaTAG.GINFO.value}{SSHCONFIG_META_SEPARATOR} {info}")
+
+        lines.append(comment_hline)
+        return lines
+
+
+    def _render_host_block(self, host: SSH_Host) -> list[str]:
+        # If there is host-info assigned to host, add it before adding "host" definition
+        lines = [f"#{SSHCONFIG_META_PREFIX}{MetaTAG.HINFO.value}{SSHCONFIG_META_SEPARATOR} {host_info}" for host_info in host.info]
+
+        # Add "host" line definition
+        alt_names = " " + " ".join(host.alt_names) if host.alt_names else ""
+        lines.append(f"Host {host.name}{alt_names}")
+
+        # Add all assigned host params
+        SSHCONFIG_INDENT_STR = " " * SSHCONFIG_INDENT
+        for token, value in host.params.items():
+            if type(value) is str:
+                lines.append(f"{SSHCONFIG_INDENT_STR}{token} {value}")
+            elif type(value) is list:
+                for v in value:
+                    lines.append(f"{SSHCONFIG_INDENT_STR}{token} {v}")
+            else:
+                raise Exception("Host parameter is not 'str' or 'list'!!!")
+        return lines
+
+
+    def _render_chunks(self) -> Iterator[tuple[Optional[SSH_Host | SSH_Group], list[str]]]:
+        """Render full config as chunks of lines, each tagged with group or host it was rendered from."""
+        header = [SSHCONFIG_SIGNATURE_LINE]
 
         # Dump any saved configuration
         for option in self.opts:
-            lines.append(f"#{SSHCONFIG_META_PREFIX}{MetaTAG.CONFIG.value}{SSHCONFIG_META_SEPARATOR} {option}={self.opts[option]}")
+            header.append(f"#{SSHCONFIG_META_PREFIX}{MetaTAG.CONFIG.value}{SSHCONFIG_META_SEPARATOR} {option}={self.opts[option]}")
 
         # Add separation from header/config and rest of ssh-config
-        lines.append("")
+        header.append("")
 
         if self.global_params:
-            lines.append(SSHCONFIG_GLOBAL_KEYWORDS_LINE)
+            header.append(SSHCONFIG_GLOBAL_KEYWORDS_LINE)
             for token, value in self.global_params.items():
-                lines.append(f"{token} {value}")
-            lines.append("")
+                header.append(f"{token} {value}")
+            header.append("")
+        yield None, header
 
         # Render all groups
         for group in self.groups:
             # Ship default group as it does not have to be specified
-            render_header = False if group.name == DEFAULT_GROUP_NAME else True
-            
-            if render_header:
-                # Add extra blank line when outputting new group header
-                lines.append("")
-                comment_hline = f"#{'-' * 79}"
+            if group.name != DEFAULT_GROUP_NAME:
+                yield group, self._render_group_header(group)
 
-                # Start header line for the group with known metadata
-                lines.append(comment_hline)
-                lines.append(f"#{SSHCONFIG_META_PREFIX}{MetaTAG.GNAME.value}{SSHCONFIG_META_SEPARATOR} {group.name}")
+            # Append hosts and patterns items from group, with newline after each host definition
+            for host in group.hosts + group.patterns:
+                yield host, self._render_host_block(host) + [""]
 
-                if group.desc:
-                    lines.append(f"#{SSHCONFIG_META_PREFIX}{MetaTAG.GDESC.value}{SSHCONFIG_META_SEPARATOR} {group.desc}")
 
-                for info in group.info:
-                    lines.append(f"#{SSHCONFIG_META_PREFIX}{MetaTAG.GINFO.value}{SSHCONFIG_META_SEPARATOR} {info}")
+    def render_ssh_config(self) -> Iterator[str]:
+        """
+        Render the in-memory model as SSH config lines, one line at a time.
 
-                lines.append(comment_hline)
+        Lines are yielded without line endings, so the generator can be
+        streamed straight into a file or stdout without building the whole
+        config text in memory first.
+        """
+        for _, lines in self._render_chunks():
+            yield from lines
+
+
+    def _render_tracked(self) -> Iterator[str]:
+        """Render full config like `render_ssh_config`, recording line spans of rendered blocks."""
+        self._line_spans_valid = False
+        for host in self.all_hosts:
+            host.source_span = None
+        for group in self.groups:
+            group.header_span = None
+
+        position = 0
+        for owner, lines in self._render_chunks():
+            if isinstance(owner, SSH_Host):
+                owner.source_span = (position, position + len(lines) - 1)
+            elif isinstance(owner, SSH_Group):
+                owner.header_span = (position + 1, position + len(lines))
+            position += len(lines)
+            yield from lines
+        self._line_spans_valid = True
+
+
+    def _output_lines(self) -> tuple[Iterable[str], Optional[LinePatch]]:
+        """Return lines to write: patched original lines when possible, otherwise full tracked render."""
+        patch = plan_line_patch(self)
+        if patch is None:
+            return self._render_tracked(), None
+        debug(f"Patching {len(patch.splices)} changed block(s) into SSH config")
+        return patch.lines, patch
+
+
+    def _commit_line_patch(self, patch: LinePatch) -> None:
+        """Move recorded line spans to their place in patched config lines."""
+        # Only blocks after first changed line are shifted, and only when any lines moved
+        first_end = patch.splices[0].end if patch.splices else len(patch.lines)
+        if patch.shifts_lines:
+            shift = patch.shift
+            for owner in self.all_hosts:
+                span = owner.source_span
+                if span is not None and span[0] >= first_end:
+                    owner.source_span = (shift(span[0]), shift(span[1] - 1) + 1)
+            for group in self.groups:
+                span = group.header_span
+                if span is not None and span[0] >= first_end:
+                    group.header_span = (shift(span[0]), shift(span[1] - 1) + 1)
+
+        for splice in patch.splices:
+            for owner, offset, length in splice.blocks:
+                span = (splice.new_start + offset, splice.new_start + offset + length)
+                if isinstance(owner, SSH_Host):
+                    owner.source_span = span
+                else:
+                    owner.header_span = span
+
+
+    def _stream_lines(self, lines: Iterable[str], out: TextIO) -> list[str]:
+        """Write lines to `out` in batches as they are generated, and return them."""
+        written: list[str] = []
+        flushed = 0
+        for line in lines:
+            written.append(line)
+            if len(written) - flushed >= 4096:
+                out.write(("\n" if flushed else "") + "\n".join(written[flushed:]))
+                flushed = len(written)
+        if len(written) > flushed:
+            out.write(("\n" if flushed else "") + "\n".join(written[flushed:]))
+        return written
 
-            # Append hosts and patterns items from group
-            for host in group.hosts + group.patterns:
-                # If there is host-info assigned to host, add it before adding "host" definition
-                for host_info in host.info:
-                    lines.append(f"#{SSHCONFIG_META_PREFIX}{MetaTAG.HINFO.value}{SSHCONFIG_META_SEPARATOR} {host_info}")
-
-                # Add "host" line definition
-                alt_names = " " + " ".join(host.alt_names) if host.alt_names else ""
-                lines.append(f"Host {host.name}{alt_names}")
-
-                # Add all assigned host params
-                for token, value in host.params.items():
-                    SSHCONFIG_INDENT_STR = ' ' * SSHCONFIG_INDENT
-                    if type(value) is str:
-                        lines.append(f"{SSHCONFIG_INDENT_STR}{token} {value}")
-                    elif type(value) is list:
-                        for v in value:
-                            lines.append(f"{SSHCONFIG_INDENT_STR}{token} {v}")
-                    else:
-                        raise Exception("Host parameter is not 'str' or 'list'!!!")
-                
-                # Add newline after host definition
-                lines.append("")
+
+    def _write_ssh_config_file(self, lines: Iterable[str]) -> list[str]:
+        """
+        Stream config lines into a temporary file and atomically replace the original.
+
+        The temporary file is created next to the target (so rename stays on
+        the same filesystem), flushed and fsync-ed before the rename, and gets
+        the original file mode (0600 for new files). If rendering or writing
+        fails midway, the original config is left untouched.
+        """
+        import stat
+        import tempfile
+
+        # Follow symlinked configs (dotfiles), so the link itself is kept
+        config_path = os.path.realpath(self.ssh_config_file)
+        config_dir = os.path.dirname(config_path)
+        try:
+            mode = stat.S_IMODE(os.stat(config_path).st_mode)
+        except FileNotFoundError:
+            mode = 0o600
+
+        fd, tmp_path = tempfile.mkstemp(dir=config_dir, prefix=f".{os.path.basename(config_path)}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", buffering=1024 * 1024) as tmp_file:
+                written = self._stream_lines(lines, tmp_file)
+                tmp_file.flush()
+                os.fsync(tmp_file.fileno())
+            os.chmod(tmp_path, mode)
+            os.replace(tmp_path, config_path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+        # Persist the rename itself (not supported on every platform)
+        if hasattr(os, "O_DIRECTORY"):
+            try:
+                dir_fd = os.open(config_dir, os.O_RDONLY | os.O_DIRECTORY)
+                try:
+                    os.fsync(dir_fd)
+                finally:
+                    os.close(dir_fd)
+            except OSError:
+                pass
+        return written
+
+
+    def generate_ssh_config(self) -> bool:
+        """
+        Render the in-memory model back into SSH config text.
+
+        Depending on the active mode, the rendered output is written back to the
+        original file, sent to stdout, or diffed against the original content.
+        When the config is write-locked or only exists in memory, rendering still
+        happens but disk writes are skipped.
+
+        Configs already managed by SSHClick are patched: only host blocks and
+        group headers changed through model methods (or marked with
+        `mark_host_changed`/`mark_group_changed`) are rendered and spliced into
+        the original lines. Other configs are fully rendered in SSHClick style.
+        """
+        # If config is write locked, dont allow saving
+        if self.write_locked:
+            warn("Configuration modification is disabled")
+            warn(self.write_locked_reason)
+            return False
 
         # If we are running in diff mode, only show the changes, and return false (dont store new config)
         if self.diff:
-            output_diff(self.ssh_config_lines, lines)
+            patch = plan_line_patch(self)
+            output_diff(self.ssh_config_lines, patch.lines if patch is not None else list(self.render_ssh_config()))
             return False
 
-        # Store new config lines as actual
-        self.ssh_config_lines = lines
-
-        # Prepare multiline content string for output configuration
-        config_content = "\n".join(lines)
+        lines, patch = self._output_lines()
 
-        # When output is changed to write config to STDOUT, just print all lines
+        # When output is changed to write config to STDOUT, stream all lines there
         if self.stdout:
-            print(config_content)
-            return False
-
+            self.ssh_config_lines = self._stream_lines(lines, sys.stdout)
+            sys.stdout.write("\n")
         # In-memory configuration objects can be rendered and mutated, but must not write to disk
-        if self.ssh_config_file is None:
+        elif self.ssh_config_file is None:
+            self.ssh_config_lines = list(lines)
+        # Write content to target config file, and store new config lines as actual
+        else:
+            try:
+                self.ssh_config_lines = self._write_ssh_config_file(lines)
+            except OSError as exc:
+                error(f"Failed modifying configuration file: {self.ssh_config_file}! ({exc})")
+                exit(1)
+
+        if patch is not None:
+            self._commit_line_patch(patch)
+        self._reset_change_tracking()
+
+        if self.stdout or self.ssh_config_file is None:
             return False
 
-        # Write content to target config file
-        try:
-            with open(self.ssh_config_file, "w") as config_file:
-                config_file.write(config_content)
-                return True
-        except OSError as exc:
-            error(f"Failed modifying configuration file: {self.ssh_config_file}! ({exc})")
-            exit(1)
+        # Keep precomputed names for shell completion in sync with written config
+        from .ssh_names import store_config_names
+
+        store_config_names(self)
+        return True
 
 
     def check_group_by_name(self, name: str) -> bool:
-        return any(group.name == name for group in self.groups)
+        return self._lookup_group(name) is not None
 
 
     def get_group_by_name(self, name: str) -> SSH_Group:
@@ -578,26 +1009,26 @@ class SSH_Config:
         On success returns matched group, on fail depending on 'throw_on_fail' flag
         function will either return 'None' or will throw exception
         """
-        for group in self.groups:
-            if group.name == name:
-                return group
-        raise Exception(f"Requested group '{name}' not found in the SSH configuration")
+        group = self._lookup_group(name)
+        if group is None:
+            raise Exception(f"Requested group '{name}' not found in the SSH configuration")
+        return group
 
 
     def check_host_by_name(self, name: str) -> bool:
-        return any(host.name == name for host in self.all_hosts)
+        return self._lookup_host(name) is not None
 
 
     def get_host_by_name(self, name: str) -> SSH_Host:
         """
         Find host in configuration that matches the name (strict match, one only!)
-        On success returns host and his assigned group, on fail depending on 'throw_on_fail' flag
-        function will either return ('None','None') or will throw exception
+        Name can be also one of host alternative names, when no host uses it as main name.
+        On fail, function will throw exception
         """
-        for host in self.all_hosts:
-            if host.name == name:
-                return host
-        raise Exception(f"Requested host '{name}' not found in the SSH configuration")
+        host = self._lookup_host(name)
+        if host is None:
+            raise Exception(f"Requested host '{name}' not found in the SSH configuration")
+        return host
 
 
     def get_all_host_names(self) -> list[str]:
@@ -635,7 +1066,7 @@ class SSH_Config:
         if not host.group:
             raise Exception("Internal ERROR, host group missing, or empty, please report issue!")
         
-        found_group = next((group for group in self.groups if group.name == host.group), None)
+        found_group = self._lookup_group(host.group)
         if found_group is None:
             # When group does not exist, we return false
             return False
@@ -646,9 +1077,73 @@ class SSH_Config:
         else:
             found_group.patterns.append(host)
         self.all_hosts.append(host)
+        self._index_host(host)
+        self._block_count += 1
+        self.mark_host_changed(host, moved=True)
         return True
 
 
+    def remove_host(self, host: SSH_Host) -> None:
+        """Detach a host from its group and from the configuration."""
+        host_group = self.get_group_by_name(host.group)
+
+        if host.type == HostType.NORMAL:
+            host_group.hosts.remove(host)
+        else:
+            host_group.patterns.remove(host)
+
+        self.all_hosts.remove(host)
+        self._unindex_host(host)
+        self._block_count -= 1
+        self._forget_block(host)
+
+
+    def change_host_name(self, host: SSH_Host, new_name: str) -> None:
+        """Rename a host object, keeping name lookups in sync."""
+        self._sync_indexes()
+        old_name = host.name
+        host.name = new_name
+        self._unindex_host(host, old_name)
+        self._index_host(host)
+        self.mark_host_changed(host)
+
+
+    def add_group(self, group: SSH_Group) -> None:
+        """Append a new group at the end of the configuration."""
+        self.groups.append(group)
+        self._group_index.setdefault(group.name, group)
+        self._indexed_group_count = len(self.groups)
+
+
+    def remove_group(self, group: SSH_Group) -> None:
+        """Remove a group from configuration (its hosts are not re-homed)."""
+        self.groups.remove(group)
+        if self._group_index.get(group.name) is group:
+            del self._group_index[group.name]
+        self._indexed_group_count = len(self.groups)
+
+        for host in group.hosts + group.patterns:
+            self._block_count -= 1
+            self._forget_block(host)
+        if group.header_span is not None:
+            self._removed_spans.append(group.header_span)
+            group.header_span = None
+        self._dirty_groups.pop(id(group), None)
+
+
+    def change_group_name(self, group: SSH_Group, new_name: str) -> None:
+        """Rename a group and update the group reference on its hosts and patterns."""
+        self._sync_indexes()
+        if self._group_index.get(group.name) is group:
+            del self._group_index[group.name]
+        group.name = new_name
+        self._group_index.setdefault(new_name, group)
+
+        for host in group.hosts + group.patterns:
+            host.group = new_name
+        self.mark_group_changed(group)
+
+
     def move_host_to_group(self, host: SSH_Host, source_group: SSH_Group, target_group: SSH_Group) -> None:
         """
         Move a host object between two already-resolved groups.
@@ -666,6 +1161,41 @@ class SSH_Config:
         else:
             target_group.patterns.append(host)
             source_group.patterns.remove(host)
+        self.mark_host_changed(host, moved=True)
+
+
+    def mark_host_changed(self, host: SSH_Host, moved: bool = False) -> None:
+        """
+        Record that host block must be rendered again on next write-back.
+
+        Hosts that are `moved` (new, or placed into other group) are written
+        at the end of their group, other changed hosts are rewritten in place.
+        """
+        moved = moved or self._dirty_hosts.get(id(host), (host, False))[1]
+        self._dirty_hosts[id(host)] = (host, moved)
+
+
+    def mark_group_changed(self, group: SSH_Group) -> None:
+        """Record that group header (name, description or info) must be rendered again on next write-back."""
+        self._dirty_groups[id(group)] = group
+
+
+    def _forget_block(self, host: SSH_Host) -> None:
+        # Removed host block is cut out from config on next write-back
+        if host.source_span is not None:
+            self._removed_spans.append(host.source_span)
+            host.source_span = None
+        self._dirty_hosts.pop(id(host), None)
+
+
+    def _reset_change_tracking(self) -> None:
+        """Take current model as baseline for tracking changes, after parse or write-back."""
+        self._source_opts = dict(self.opts)
+        self._source_global_params = {key: list(value) if type(value) is list else value for key, value in self.global_params.items()}
+        self._block_count = sum(len(group.hosts) + len(group.patterns) for group in self.groups)
+        self._removed_spans = []
+        self._dirty_hosts = {}
+        self._dirty_groups = {}
 
 
     def trace_proxyjump(self, name: str) -> list[SSH_Host] | None:
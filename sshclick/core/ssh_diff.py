@@ -1,24 +1,145 @@
-from rich.console import Console
-from difflib import unified_diff
+from difflib import SequenceMatcher
+from typing import Iterator
+
+Opcode = tuple[str, int, int, int, int]
+
+
+def _block_starts(lines: list[str]) -> list[int]:
+    """Return start index of each block of lines. Blocks (host entries, group headers...) are separated by blank lines."""
+    starts = [0]
+    starts.extend(index for index, line in enumerate(lines[:-1], 1) if not line or line.isspace())
+    return starts
+
+
+def _blocks(lines: list[str]) -> tuple[list[int], list[str]]:
+    # Each block is keyed by its whole text, so blocks are compared with a single hash/compare instead of line by line
+    starts = _block_starts(lines) if lines else []
+    bounds = starts + [len(lines)]
+    return bounds, ["\n".join(lines[bounds[index]:bounds[index + 1]]) for index in range(len(starts))]
+
+
+def diff_opcodes(original: list[str], modified: list[str]) -> list[Opcode]:
+    """
+    Return line-level opcodes (same format as `SequenceMatcher.get_opcodes`) turning `original` into `modified`.
+
+    Lines are first grouped into blocks and blocks are matched by their text.
+    Common leading and trailing blocks are skipped in linear time, the rest
+    is matched block by block, and line-level matching only runs inside
+    blocks that actually differ. For a few changed hosts in a huge config,
+    this is close to linear in config size.
+    """
+    a_bounds, a_keys = _blocks(original)
+    b_bounds, b_keys = _blocks(modified)
+
+    prefix = 0
+    while prefix < min(len(a_keys), len(b_keys)) and a_keys[prefix] == b_keys[prefix]:
+        prefix += 1
+    suffix = 0
+    while suffix < min(len(a_keys), len(b_keys)) - prefix and a_keys[-1 - suffix] == b_keys[-1 - suffix]:
+        suffix += 1
+
+    block_opcodes = [("equal", 0, prefix, 0, prefix)] if prefix else []
+    matcher = SequenceMatcher(None, a_keys[prefix:len(a_keys) - suffix], b_keys[prefix:len(b_keys) - suffix], autojunk=False)
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        block_opcodes.append((tag, i1 + prefix, i2 + prefix, j1 + prefix, j2 + prefix))
+    if suffix:
+        block_opcodes.append(("equal", len(a_keys) - suffix, len(a_keys), len(b_keys) - suffix, len(b_keys)))
+
+    opcodes: list[Opcode] = []
+
+    def add(tag: str, i1: int, i2: int, j1: int, j2: int) -> None:
+        # Neighbouring equal ranges are merged, so hunks are grouped same as difflib does
+        if opcodes and opcodes[-1][0] == tag == "equal":
+            opcodes[-1] = (tag, opcodes[-1][1], i2, opcodes[-1][3], j2)
+        else:
+            opcodes.append((tag, i1, i2, j1, j2))
+
+    for tag, i1, i2, j1, j2 in block_opcodes:
+        a1, a2, b1, b2 = a_bounds[i1], a_bounds[i2], b_bounds[j1], b_bounds[j2]
+        if tag == "replace":
+            for line_tag, k1, k2, l1, l2 in SequenceMatcher(None, original[a1:a2], modified[b1:b2]).get_opcodes():
+                add(line_tag, a1 + k1, a1 + k2, b1 + l1, b1 + l2)
+        elif a1 != a2 or b1 != b2:
+            add(tag, a1, a2, b1, b2)
+    return opcodes
+
+
+def _grouped_opcodes(opcodes: list[Opcode], n: int) -> Iterator[list[Opcode]]:
+    # Same hunk grouping as `SequenceMatcher.get_grouped_opcodes`
+    codes = list(opcodes) or [("equal", 0, 1, 0, 1)]
+    if codes[0][0] == "equal":
+        tag, i1, i2, j1, j2 = codes[0]
+        codes[0] = tag, max(i1, i2 - n), i2, max(j1, j2 - n), j2
+    if codes[-1][0] == "equal":
+        tag, i1, i2, j1, j2 = codes[-1]
+        codes[-1] = tag, i1, min(i2, i1 + n), j1, min(j2, j1 + n)
+
+    group: list[Opcode] = []
+    for tag, i1, i2, j1, j2 in codes:
+        if tag == "equal" and i2 - i1 > n * 2:
+            group.append((tag, i1, min(i2, i1 + n), j1, min(j2, j1 + n)))
+            yield group
+            group = []
+            i1, j1 = max(i1, i2 - n), max(j1, j2 - n)
+        group.append((tag, i1, i2, j1, j2))
+    if group and not (len(group) == 1 and group[0][0] == "equal"):
+        yield group
+
+
+def _format_range(start: int, stop: int) -> str:
+    beginning = start + 1
+    length = stop - start
+    if length == 1:
+        return f"{beginning}"
+    if not length:
+        beginning -= 1
+    return f"{beginning},{length}"
+
+
+def block_unified_diff(original: list[str], modified: list[str], fromfile: str = "", tofile: str = "", n: int = 3) -> Iterator[str]:
+    """Generate unified diff lines (like `difflib.unified_diff` with `lineterm=""`), using block-level matching."""
+    started = False
+    for group in _grouped_opcodes(diff_opcodes(original, modified), n):
+        if not started:
+            started = True
+            yield f"--- {fromfile}"
+            yield f"+++ {tofile}"
+
+        first, last = group[0], group[-1]
+        yield f"@@ -{_format_range(first[1], last[2])} +{_format_range(first[3], last[4])} @@"
+        for tag, i1, i2, j1, j2 in group:
+            if tag == "equal":
+                for line in original[i1:i2]:
+                    yield " " + line
+                continue
+            if tag in {"replace", "delete"}:
+                for line in original[i1:i2]:
+                    yield "-" + line
+            if tag in {"replace", "insert"}:
+                for line in modified[j1:j2]:
+                    yield "+" + line
 
-# We use console to get nice colors
-out = Console()
 
 def output_diff(original: list[str], modified: list[str]) -> None:
     """
     Print out what would be difference after config change is applied
     """
-    
-    # Generate diff line object iterator
-    diff = unified_diff(original, modified, fromfile="original", tofile="modified", lineterm="")
+    # We use console to get nice colors (imported here, as it is only needed in diff mode)
+    from rich.console import Console
+    from rich.text import Text
+    out = Console()
 
-    # Print colored diff
-    for line in diff:
+    # Build whole colored diff as single renderable, and print it at once
+    text = Text()
+    for line in block_unified_diff(original, modified, fromfile="original", tofile="modified"):
         if line.startswith("+"):
-            out.print(line, style="green", markup=False, highlight=False)
+            text.append(line + "\n", style="green")
         elif line.startswith("-"):
-            out.print(line, style="red", markup=False, highlight=False)
+            text.append(line + "\n", style="red")
         elif line.startswith("@@"):
-            out.print(line, style="cyan", markup=False, highlight=False)
+            text.append(line + "\n", style="cyan")
         else:
-            out.print(line, markup=False, highlight=False)
+            text.append(line + "\n")
+
+    if text:
+        out.print(text, highlight=False, end="")
@@ -1,7 +1,3 @@
-from rich.table import Table
-from rich.text import Text
-from rich.padding import Padding
-
 from .ssh_host import SSH_Host
 
 # from rich import print
@@ -33,6 +29,10 @@ def generate_graph(traced_hosts: list[SSH_Host], print_tunnels=True, show_title=
     """
     Function that generates nice "graph" view of connected hosts
     """
+    # Rich is imported only when graph is really rendered, to keep CLI startup fast
+    from rich.padding import Padding
+    from rich.table import Table
+    from rich.text import Text
 
     # TODO: This is currently static, but we could improve it, as in very long hostname
     #       it will result in broken lines, or alternatively in cut-off names
@@ -66,9 +66,9 @@ def generate_graph(traced_hosts: list[SSH_Host], print_tunnels=True, show_title=
 
     # Add Jump proxies in graph-row
     for host in reversed_hosts[:-1]:
-        # Status is filled by testing function before calling graph, so status is
-        # already updated in given traced hosts
-        host_status = host.params.get("status", "unchecked")
+        # Status is filled by reachability check (ssh_reachability.py) before calling graph,
+        # so status is already updated in given traced hosts
+        host_status = host.status
         address = f"[{ADDRESS_COLOR[host_status]}]{host.params.get('hostname', '')}[/]"
 
         graph_row.append(Padding(Text.from_markup("\n".join([
@@ -79,7 +79,7 @@ def generate_graph(traced_hosts: list[SSH_Host], print_tunnels=True, show_title=
         ]))))
 
     # Add Target info in graph-row
-    target_status = reversed_hosts[-1].params.get("status", "unchecked")
+    target_status = reversed_hosts[-1].status
     target_address = f"[{ADDRESS_COLOR[target_status]}]{reversed_hosts[-1].params.get('hostname', '')}[/]"
 
     # The target column always keeps two spacer rows so it lines up with the
@@ -7,6 +7,7 @@ class SSH_Group:
     name: str
     desc: str = ""
     source_refs: list[tuple[str, int]] = field(default_factory=list, compare=False)
+    header_span: tuple[int, int] | None = field(default=None, compare=False, repr=False)  # [start, end) lines of header in root config
     info: list = field(default_factory=list)
     hosts: list[SSH_Host] = field(default_factory=list)
     patterns: list[SSH_Host] = field(default_factory=list)
@@ -20,11 +20,13 @@ class SSH_Host:
     group: str
     source_file: str = field(default="", compare=False)
     source_line: int = field(default=0, compare=False)
+    source_span: tuple[int, int] | None = field(default=None, compare=False, repr=False)  # [start, end) lines of block in root config
     password: str = ""
     type: HostType = HostType.NORMAL
     alt_names: list = field(default_factory=list)
     info: list = field(default_factory=list)
     print_style: str = DEFAULT_HOST_STYLE
+    status: str = field(default="unchecked", compare=False, repr=False)  # Reachability (online/offline/unchecked), never written to config
 
     # Parameters separation, from directly configured under host definition, global
     # patterns that apply to every host defined after it (unless explicitly overridden)
@@ -0,0 +1,161 @@
+import glob
+import json
+import os
+import re
+from dataclasses import dataclass, field
+from typing import Optional
+
+from .ssh_cache import _cache_file_path, _file_signature, _glob_include_patterns, _write_cache_file
+from .ssh_config import SSH_Config, expand_include_patterns
+
+from sshclick.globals import DEFAULT_GROUP_NAME
+from sshclick.logging import debug
+
+# Bump when stored name index layout changes
+NAMES_FORMAT = 1
+
+# Names are collected with a few whole-text searches instead of a line-by-line parse.
+# Text is always prefixed with "\n", so each pattern can anchor on a line start cheaply.
+_HOST_RE = re.compile(r"\n[ \t]*host(?:[ \t]*=[ \t]*|[ \t]+)(\S+)", re.IGNORECASE)
+_GROUP_RE = re.compile(r"\n[ \t]*#[ @]group:[ \t]+([^\n]*)")
+_INCLUDE_RE = re.compile(r"\n[ \t]*include(?:[ \t]*=[ \t]*|[ \t]+)([^\n]*)", re.IGNORECASE)
+_SCOPE_END_RE = re.compile(r"\n[ \t]*(?:host|match)(?:[ \t]*=|[ \t])", re.IGNORECASE)
+
+
+@dataclass
+class SSH_ConfigNames:
+    """Host and group names defined in SSH config, with files they were collected from."""
+
+    hosts: list[str] = field(default_factory=list)
+    groups: list[str] = field(default_factory=lambda: [DEFAULT_GROUP_NAME])
+    included_files: list[str] = field(default_factory=list)
+    include_patterns: list[str] = field(default_factory=list)
+
+
+def _scan_text(text: str, hosts: dict, groups: dict) -> None:
+    # dict.update keeps position of already seen keys, so first definition order is kept
+    groups.update(dict.fromkeys(name for name in (value.strip() for value in _GROUP_RE.findall(text)) if name))
+    hosts.update(dict.fromkeys(_HOST_RE.findall(text)))
+
+
+def _scan_root_text(text: str, names: SSH_ConfigNames, hosts: dict, groups: dict, base_dir: str) -> None:
+    # Includes are followed only from root config top-level scope (before any Host/Match), same as full parser does
+    scope_end = _SCOPE_END_RE.search(text)
+    position = 0
+    for match in _INCLUDE_RE.finditer(text, 0, scope_end.start() if scope_end else len(text)):
+        _scan_text(text[position:match.start()], hosts, groups)
+        position = match.end()
+
+        for pattern in expand_include_patterns(match.group(1).strip(), base_dir):
+            names.include_patterns.append(pattern)
+            for include_path in sorted(glob.glob(pattern)):
+                include_path = os.path.abspath(include_path)
+                if include_path not in names.included_files:
+                    names.included_files.append(include_path)
+                try:
+                    with open(include_path, "r") as fh:
+                        _scan_text("\n" + fh.read(), hosts, groups)
+                except OSError:
+                    continue
+
+    _scan_text(text[position:], hosts, groups)
+
+
+def scan_config_names(config_path: str) -> SSH_ConfigNames:
+    """
+    Collect host and group names without parsing the full config model.
+
+    Only `Host` lines, `#@group:` metadata and top-level `Include` lines are
+    looked at, no host objects are created and no inheritance is resolved.
+    This is what shell completion needs, and is far cheaper than a full parse.
+    Missing or unreadable config simply gives no names.
+    """
+    names = SSH_ConfigNames()
+    root_path = os.path.abspath(config_path)
+    try:
+        with open(root_path, "r") as fh:
+            text = fh.read()
+    except OSError:
+        return names
+
+    hosts: dict[str, None] = {}
+    groups: dict[str, None] = dict.fromkeys(names.groups)
+    _scan_root_text("\n" + text, names, hosts, groups, os.path.dirname(root_path))
+    names.hosts = list(hosts)
+    names.groups = list(groups)
+    return names
+
+
+def _names_index_path(config_path: str) -> str:
+    return _cache_file_path(config_path, kind="names", extension="json")
+
+
+def store_names_index(config_path: str, names: SSH_ConfigNames) -> bool:
+    """Write precomputed name index for config, keyed by signatures of config and included files."""
+    signatures = []
+    for path in [os.path.abspath(config_path)] + names.included_files:
+        signature = _file_signature(path)
+        if signature is None:
+            return False
+        signatures.append(signature)
+
+    entry = {"format": NAMES_FORMAT, "signatures": signatures, "names": names.__dict__}
+    index_path = _names_index_path(config_path)
+    if not _write_cache_file(index_path, json.dumps(entry).encode()):
+        return False
+
+    debug(f"Stored SSH config name index ({index_path})")
+    return True
+
+
+def load_names_index(config_path: str) -> Optional[SSH_ConfigNames]:
+    """Return stored name index for config, or None when missing or stale."""
+    index_path = _names_index_path(config_path)
+    try:
+        with open(index_path, "rb") as fh:
+            entry = json.load(fh)
+    except FileNotFoundError:
+        return None
+    except Exception as exc:
+        debug(f"Ignoring unreadable SSH config name index ({index_path}): {exc}")
+        return None
+
+    if not isinstance(entry, dict) or entry.get("format") != NAMES_FORMAT:
+        return None
+
+    if any(_file_signature(signature[0]) != tuple(signature) for signature in entry["signatures"]):
+        debug(f"SSH config name index is stale ({index_path})")
+        return None
+
+    names = SSH_ConfigNames(**entry["names"])
+    if _glob_include_patterns(names.include_patterns) != names.included_files:
+        debug(f"SSH config name index is stale, included files changed ({index_path})")
+        return None
+    return names
+
+
+def store_config_names(config: SSH_Config) -> bool:
+    """Refresh name index from a parsed model, used after config is written back to disk."""
+    if config.ssh_config_file is None:
+        return False
+
+    names = SSH_ConfigNames(
+        hosts=list(dict.fromkeys(config.get_all_host_names())),
+        groups=list(dict.fromkeys(config.get_all_group_names())),
+        included_files=list(config.included_files),
+        include_patterns=list(config.include_patterns),
+    )
+    return store_names_index(config.ssh_config_file, names)
+
+
+def load_config_names(config_path: str, use_cache: bool = True) -> SSH_ConfigNames:
+    """Return host and group names for config, from name index when valid, otherwise by scanning it."""
+    if use_cache:
+        names = load_names_index(config_path)
+        if names is not None:
+            return names
+
+    names = scan_config_names(config_path)
+    if use_cache and os.path.exists(config_path):
+        store_names_index(config_path, names)
+    return names
@@ -0,0 +1,162 @@
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Optional, Union
+
+from .ssh_group import SSH_Group
+from .ssh_host import SSH_Host
+
+from sshclick.globals import DEFAULT_GROUP_NAME, SSHCONFIG_SIGNATURE_LINE
+from sshclick.logging import debug
+
+if TYPE_CHECKING:
+    from .ssh_config import SSH_Config
+
+
+@dataclass
+class LineSplice:
+    """Replace original lines [start, end) with `lines`."""
+
+    start: int
+    end: int
+    lines: list[str]
+    # Blocks rendered into `lines`: (host or group, start offset within `lines`, number of lines)
+    blocks: list[tuple[Union[SSH_Host, SSH_Group], int, int]] = field(default_factory=list)
+    new_start: int = 0
+
+
+@dataclass
+class LinePatch:
+    """Result of patching original config lines with only the changed blocks."""
+
+    lines: list[str]
+    splices: list[LineSplice]
+
+    def shift(self, index: int) -> int:
+        """Map an index of an untouched original line to its index in patched lines."""
+        position = bisect_right(self._ends, index) - 1
+        return index + (self._deltas[position] if position >= 0 else 0)
+
+    @property
+    def shifts_lines(self) -> bool:
+        """True when any untouched line ends up at other index than in original lines."""
+        return any(self._deltas)
+
+    def __post_init__(self):
+        self._ends = [splice.end for splice in self.splices]
+        self._deltas = []
+        delta = 0
+        for splice in self.splices:
+            delta += len(splice.lines) - (splice.end - splice.start)
+            self._deltas.append(delta)
+
+
+def _removal_span(lines: list[str], start: int, end: int) -> tuple[int, int]:
+    # Swallow one trailing blank line, when block is already separated by blank line above
+    if end < len(lines) and not lines[end].strip() and (start == 0 or not lines[start - 1].strip()):
+        end += 1
+    return (start, end)
+
+
+def _host_splice(config: "SSH_Config", host: SSH_Host, start: int, end: int, prefix: list[str], suffix: list[str]) -> LineSplice:
+    block = config._render_host_block(host)
+    return LineSplice(start, end, prefix + block + suffix, [(host, len(prefix), len(block))])
+
+
+def plan_line_patch(config: "SSH_Config") -> Optional[LinePatch]:
+    """
+    Return `config.ssh_config_lines` patched with only the blocks that changed since parse.
+
+    Changed hosts and group headers are re-rendered in place, removed ones are
+    cut out, and new or moved hosts are inserted after the last block of
+    their group. New groups are appended at the end. Untouched lines are kept
+    verbatim, including formatting and comments SSHClick does not understand.
+
+    Returns None whenever the change cannot be expressed safely as splices,
+    and the caller must fall back to rendering the whole config.
+    """
+    lines = config.ssh_config_lines
+    if not config._line_spans_valid or not lines or lines[0] != SSHCONFIG_SIGNATURE_LINE:
+        return None
+    if config.opts != config._source_opts or config.global_params != config._source_global_params:
+        return None
+
+    # Host lists changed without going through config methods cannot be tracked
+    if sum(len(group.hosts) + len(group.patterns) for group in config.groups) != config._block_count:
+        debug("Untracked config changes found, rendering full SSH config")
+        return None
+
+    splices: list[LineSplice] = [LineSplice(*_removal_span(lines, start, end), []) for start, end in config._removed_spans]
+    new_groups = [group for group in config.groups if group.header_span is None and group.name != DEFAULT_GROUP_NAME]
+    new_group_ids = {id(group) for group in new_groups}
+
+    # Changed hosts are rewritten in place, new and moved hosts are placed again into their group
+    placed_groups: dict[int, SSH_Group] = {}
+    placed_ids: set[int] = set()
+    for host, moved in config._dirty_hosts.values():
+        group = config._lookup_group(host.group)
+        if group is None:
+            return None
+        if host.source_span is not None and not moved:
+            splices.append(_host_splice(config, host, *host.source_span, [], []))
+            continue
+        if host.source_span is not None:
+            splices.append(LineSplice(*_removal_span(lines, *host.source_span), []))
+        if id(group) not in new_group_ids:
+            placed_groups[id(group)] = group
+            placed_ids.add(id(host))
+
+    for group in config._dirty_groups.values():
+        if group.header_span is None:
+            continue
+        if len(group.source_refs) > 1:
+            return None
+        header = config._render_group_header(group)[1:]
+        splices.append(LineSplice(*group.header_span, header, [(group, 0, len(header))]))
+
+    # New blocks go after last block that stays in group, or right after group header
+    # (or before first group header, for hosts of default group)
+    first_header_start = min((group.header_span[0] for group in config.groups if group.header_span), default=len(lines))
+    for group in placed_groups.values():
+        members = group.hosts + group.patterns
+        placed = [host for host in members if id(host) in placed_ids]
+        staying_ends = [host.source_span[1] for host in members if host.source_span is not None and id(host) not in placed_ids]
+        if staying_ends:
+            anchor = max(staying_ends)
+            prefix, suffix = [""], []
+        else:
+            anchor = group.header_span[1] if group.header_span else first_header_start
+            prefix = [""] if group.header_span is None and anchor > 0 and lines[anchor - 1].strip() else []
+            suffix = [""] if anchor < len(lines) and lines[anchor].strip() else []
+        for index, host in enumerate(placed):
+            splices.append(_host_splice(config, host, anchor, anchor, prefix if index == 0 else [""], suffix if index == len(placed) - 1 else []))
+
+    # Whole new groups are rendered at the end of config
+    appended: list[str] = [""] if new_groups and lines[-1].strip() else []
+    appended_blocks: list[tuple[Union[SSH_Host, SSH_Group], int, int]] = []
+    for group in new_groups:
+        header = config._render_group_header(group)
+        appended_blocks.append((group, len(appended) + 1, len(header) - 1))
+        appended.extend(header)
+        for host in group.hosts + group.patterns:
+            if host.source_span is not None and id(host) not in config._dirty_hosts:
+                return None
+            block = config._render_host_block(host)
+            appended_blocks.append((host, len(appended), len(block)))
+            appended.extend(block + [""])
+    if appended:
+        splices.append(LineSplice(len(lines), len(lines), appended, appended_blocks))
+
+    splices.sort(key=lambda splice: (splice.start, splice.end))
+    patched: list[str] = []
+    position = 0
+    for splice in splices:
+        if splice.start < position:
+            debug("Overlapping config changes found, rendering full SSH config")
+            return None
+        patched.extend(lines[position:splice.start])
+        splice.new_start = len(patched)
+        patched.extend(splice.lines)
+        position = splice.end
+    patched.extend(lines[position:])
+
+    return LinePatch(patched, splices)
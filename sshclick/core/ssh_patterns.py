@@ -0,0 +1,99 @@
+import fnmatch
+import os
+import re
+from typing import Optional
+
+# Characters that make a "Host" token a glob instead of a literal name
+GLOB_CHARS = "*?["
+
+
+class _PatternTrie:
+    """
+    Minimal character trie used for prefix (`abc*`) and suffix (`*abc`) globs.
+
+    Every node is a plain dict of child characters, with pattern ordinals that
+    terminate at that node stored under the `None` key.
+    """
+
+    def __init__(self) -> None:
+        self.root: dict = {}
+
+    def add(self, key: str, ordinal: int) -> None:
+        node = self.root
+        for char in key:
+            node = node.setdefault(char, {})
+        node.setdefault(None, []).append(ordinal)
+
+    def collect(self, text: str, matched: list[int]) -> None:
+        """Append ordinals of every stored key that is a prefix of `text`."""
+        node = self.root
+        matched.extend(node.get(None, ()))
+        for char in text:
+            node = node.get(char)
+            if node is None:
+                return
+            matched.extend(node.get(None, ()))
+
+
+class SSH_PatternIndex:
+    """
+    Index over pattern host names used to resolve which patterns match a host.
+
+    Patterns are sorted into buckets by shape: literal names go into a hash
+    lookup, simple prefix/suffix wildcards go into tries, and anything else is
+    compiled once into a regex. Matching results are returned as ordinals in the
+    same order the patterns were added, so callers keep file-order semantics.
+    """
+
+    def __init__(self, patterns: Optional[list[str]] = None) -> None:
+        self.patterns: list[str] = []
+        self._literals: dict[str, list[int]] = {}
+        self._prefixes = _PatternTrie()
+        self._suffixes = _PatternTrie()
+        self._regexes: list[tuple[int, re.Pattern]] = []
+
+        for pattern in patterns or []:
+            self.add(pattern)
+
+
+    def add(self, pattern: str) -> int:
+        """Register a pattern and return its ordinal within the index."""
+        ordinal = len(self.patterns)
+        self.patterns.append(pattern)
+
+        # Same case handling as "fnmatch.fnmatch", which we are replacing
+        key = os.path.normcase(pattern)
+        body = key.strip("*")
+
+        if not any(char in key for char in GLOB_CHARS):
+            self._literals.setdefault(key, []).append(ordinal)
+        elif any(char in body for char in GLOB_CHARS):
+            self._regexes.append((ordinal, re.compile(fnmatch.translate(key))))
+        elif key.endswith("*") and not key.startswith("*"):
+            self._prefixes.add(key.rstrip("*"), ordinal)
+        elif key.startswith("*") and not key.endswith("*"):
+            self._suffixes.add(key.lstrip("*")[::-1], ordinal)
+        elif not body:
+            # Only stars in the name ("*", "**"), matches anything
+            self._prefixes.add("", ordinal)
+        else:
+            # Infix patterns like "*abc*" are not worth a separate structure
+            self._regexes.append((ordinal, re.compile(fnmatch.translate(key))))
+        return ordinal
+
+
+    def match(self, name: str) -> list[int]:
+        """Return ordinals of all patterns matching `name`, in insertion order."""
+        key = os.path.normcase(name)
+        matched: list[int] = list(self._literals.get(key, ()))
+        self._prefixes.collect(key, matched)
+        self._suffixes.collect(key[::-1], matched)
+        for ordinal, regex in self._regexes:
+            if regex.match(key):
+                matched.append(ordinal)
+        matched.sort()
+        return matched
+
+
+    def __len__(self) -> int:
+        return len(self.patterns)
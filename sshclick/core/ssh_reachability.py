@@ -0,0 +1,88 @@
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+from .ssh_host import SSH_Host
+
+from sshclick.globals import REACHABILITY_CONCURRENCY, SSH_CONNECT_TIMEOUT
+
+DEFAULT_SSH_PORT = 22
+
+
+@dataclass
+class ReachabilityResult:
+    """Outcome of TCP connection check against host address and port."""
+
+    name: str
+    address: str
+    port: int
+    online: bool = False
+    latency: Optional[float] = None     # Seconds until TCP connection was established
+    error: str = ""
+
+    @property
+    def status(self) -> str:
+        return "online" if self.online else "offline"
+
+
+def host_endpoint(host: SSH_Host) -> tuple[str, str]:
+    """Return (address, port) ssh would connect to for host, using applied (inherited) parameters."""
+    address, _ = host.get_applied_param("hostname")
+    port, _ = host.get_applied_param("port")
+    return (address or host.name, port or str(DEFAULT_SSH_PORT))
+
+
+async def _check_endpoint(name: str, address: str, port: str, timeout: float, limit: asyncio.Semaphore) -> ReachabilityResult:
+    try:
+        port_number = int(port)
+    except ValueError:
+        return ReachabilityResult(name, address, 0, error=f"invalid port '{port}'")
+
+    result = ReachabilityResult(name, address, port_number)
+    async with limit:
+        start = time.perf_counter()
+        try:
+            _, writer = await asyncio.wait_for(asyncio.open_connection(address, port_number), timeout)
+        except asyncio.TimeoutError:
+            result.error = "timeout"
+            return result
+        except OSError as exc:
+            result.error = exc.strerror or str(exc)
+            return result
+        result.latency = time.perf_counter() - start
+        result.online = True
+
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except OSError:
+            pass
+    return result
+
+
+async def check_reachability_async(
+    hosts: list[SSH_Host], concurrency: int = REACHABILITY_CONCURRENCY, timeout: float = SSH_CONNECT_TIMEOUT
+) -> list[ReachabilityResult]:
+    """Check all hosts concurrently, with at most `concurrency` connections in flight. Results keep order of hosts."""
+    limit = asyncio.Semaphore(max(1, concurrency))
+    return await asyncio.gather(*(_check_endpoint(host.name, *host_endpoint(host), timeout, limit) for host in hosts))
+
+
+def check_reachability(
+    hosts: list[SSH_Host], concurrency: int = REACHABILITY_CONCURRENCY, timeout: float = SSH_CONNECT_TIMEOUT
+) -> list[ReachabilityResult]:
+    """
+    Open TCP connection to HostName:Port of every host and report if it was accepted and how fast.
+
+    Connections are made directly from this machine (ProxyJump is not followed)
+    and closed right after the TCP handshake, so no SSH session is started.
+    Each host gets `status` updated (online/offline), which is used for graph
+    coloring in `sshc host show --graph`.
+    """
+    if not hosts:
+        return []
+    results = asyncio.run(check_reachability_async(hosts, concurrency, timeout))
+    for host, result in zip(hosts, results):
+        host.status = result.status
+    return results
@@ -0,0 +1,119 @@
+import re
+from itertools import islice
+from typing import Optional
+
+from .ssh_host import SSH_Host
+
+# Each host is one line of searched text: "\n<name>\x01<field>\t<field>...\x00<ordinal>".
+# Ordinal goes last, so every pattern can capture it after matching (findall stays in C).
+_NAME_END = "\x01"
+_FIELD_END = "\t"
+_ORDINAL_START = "\x00"
+_FIELD_STOP = "\t\n\x00\x01"        # Chars a match inside one field must not cross
+_REST = rf".*{_ORDINAL_START}(\d+)"      # Rest of the line (dot stops at line end), capturing host ordinal
+
+# When query only extends previous one, matches can only be among previous matches,
+# and below this many of them, scanning only their lines is cheaper than whole text
+NARROW_LIMIT = 20000
+
+
+def _field_text(value) -> str:
+    if isinstance(value, list):
+        value = " ".join(value)
+    value = str(value)
+    for char in _FIELD_STOP:
+        value = value.replace(char, " ")
+    return value.lower()
+
+
+def _subsequence(query: str, stop: str) -> str:
+    # Pattern starts with a literal, so regex engine can jump between its occurrences.
+    # Every next char skips straight to its first occurrence (no backtracking), which
+    # finds a subsequence whenever one exists in the text up to a "stop" char
+    return re.escape(query[0]) + "".join(f"[^{re.escape(char)}{stop}]*{re.escape(char)}" for char in query[1:])
+
+
+class SSH_HostSearchIndex:
+    """
+    Fuzzy (subsequence) search over host names, alt names, HostName and "#@host:" info lines.
+
+    Searched fields of every host are precomputed once into one lowercase line
+    (name first, host ordinal last), and all lines are joined into one text,
+    with a smaller text of names only for name tiers. Each query is then a few
+    regex scans done in C instead of per-host Python work, and query that
+    extends previous one only scans lines of previous matches.
+
+    Results are ranked in tiers: name starts with query, name contains query,
+    name contains query chars in order, any field contains query, any field
+    contains query chars in order. Within a tier hosts keep config file order.
+    """
+
+    def __init__(self, hosts: list[SSH_Host]) -> None:
+        self.hosts = list(hosts)
+        # Lines are keyed by ordinal as captured from text, so narrowing never converts them
+        self._lines: dict[str, str] = {}
+        self._name_lines: dict[str, str] = {}
+        for ordinal, host in enumerate(self.hosts):
+            hostname, _ = host.get_applied_param("hostname")
+            name = _field_text(host.name)
+            fields = _FIELD_END.join(_field_text(value) for value in [*host.alt_names, hostname, *host.info] if value)
+            self._lines[str(ordinal)] = f"\n{name}{_NAME_END}{fields}{_ORDINAL_START}{ordinal}"
+            self._name_lines[str(ordinal)] = f"\n{name}{_NAME_END}{_ORDINAL_START}{ordinal}"
+        self._text = "".join(self._lines.values())
+        self._names_text = "".join(self._name_lines.values())
+
+        self._last_query = ""
+        self._last_matches: Optional[list[str]] = None     # Ordinals matched by last query (None = all)
+
+
+    def __len__(self) -> int:
+        return len(self.hosts)
+
+
+    def count(self) -> int:
+        """Return number of hosts matched by the last search."""
+        return len(self.hosts) if self._last_matches is None else len(self._last_matches)
+
+
+    def search(self, query: str, limit: Optional[int] = None) -> list[SSH_Host]:
+        """Return hosts matching query as subsequence, best first (at most `limit` of them)."""
+        query = "".join(query.lower().split())
+        if not query:
+            self._last_query, self._last_matches = "", None
+            return self.hosts[:limit]
+
+        text, names_text = self._text, self._names_text
+        if self._last_matches is not None and query.startswith(self._last_query) and len(self._last_matches) <= NARROW_LIMIT:
+            text = "".join([self._lines[ordinal] for ordinal in self._last_matches])
+
+        literal = re.escape(query)
+        in_order = _subsequence(query, _FIELD_STOP)
+        in_name = rf"[^{_FIELD_STOP}]*{_NAME_END}"     # Match is followed by end of name field
+
+        # Broadest tier matches everything other tiers do, so it also gives the match count
+        matched = re.findall(in_order + _REST, text)
+        self._last_query, self._last_matches = query, matched
+        if not matched:
+            return []
+        if text is not self._text:
+            names_text = "".join([self._name_lines[ordinal] for ordinal in matched])
+
+        tiers = [
+            ("\n" + literal + _REST, names_text),
+            (literal + in_name + _REST, names_text),
+            (in_order + in_name + _REST, names_text),
+            (literal + _REST, text),
+        ]
+        wanted = len(matched) if limit is None else min(limit, len(matched))
+        ranked: dict[str, None] = {}
+        for pattern, tier_text in tiers:
+            for match in islice(re.finditer(pattern, tier_text), wanted):
+                ranked.setdefault(match.group(1))
+                if len(ranked) >= wanted:
+                    return [self.hosts[int(ordinal)] for ordinal in ranked]
+
+        for ordinal in matched:
+            ranked.setdefault(ordinal)
+            if len(ranked) >= wanted:
+                break
+        return [self.hosts[int(ordinal)] for ordinal in ranked]
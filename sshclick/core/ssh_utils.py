@@ -1,10 +1,11 @@
 import os.path
 import re
 import sys
-from typing import List
+from typing import List, Optional
 
 from ..globals import ENABLED_HOST_STYLES
-from .ssh_config import SSH_Config
+from .ssh_cache import load_ssh_config_cached
+from .ssh_names import SSH_ConfigNames, load_config_names
 from .ssh_parameters import ALL_PARAM_LC_NAMES
 
 
@@ -13,6 +14,18 @@ def filter_dict(d: dict, ignored: list = []) -> dict:
     return {k: v for (k, v) in d.items() if k not in ignored}
 
 
+# Click completion does not always preserve the original command context chain,
+# so root parameters (like "--config") must be looked up on parent contexts
+def _find_root_params(ctx) -> Optional[dict]:
+    current_obj = ctx.parent
+    while current_obj is not None:
+        params = getattr(current_obj, "params", None) or {}
+        if params.get("config") is not None:
+            return params
+        current_obj = current_obj.parent
+    return None
+
+
 # Custom parsing trough parent object types until required parameters are found
 # Then build config object and bound it to ctx.obj
 def build_context_config(ctx) -> None:
@@ -26,33 +39,42 @@ def build_context_config(ctx) -> None:
     if ctx.obj is not None:
         return
 
-    current_obj = ctx.parent
-    while current_obj is not None:
-        params = getattr(current_obj, "params", None) or {}
-        config = params.get("config")
-        if config is not None:
-            full_path = os.path.expanduser(config)
-            ctx.obj = SSH_Config(file=full_path, stdout=params.get("stdout", False)).read().parse()
-            return
-        current_obj = current_obj.parent
+    params = _find_root_params(ctx)
+    if params is None:
+        print("\nINTERNAL ERROR: Could not reconstruct context for SSH configuration!", file=sys.stderr)
+        ctx.exit(1)
+
+    full_path = os.path.expanduser(params["config"])
+    ctx.obj = load_ssh_config_cached(full_path, stdout=params.get("stdout", False), use_cache=not params.get("no_cache", False))
+
+
+def _context_config_names(ctx) -> SSH_ConfigNames:
+    """
+    Return host and group names for completion, without parsing the full config.
+
+    Names come from the precomputed name index or a lightweight line scan, so a
+    TAB press stays fast even on very large configs.
+    """
+    if ctx.obj is not None:
+        return SSH_ConfigNames(hosts=ctx.obj.get_all_host_names(), groups=ctx.obj.get_all_group_names())
 
-    print("\nINTERNAL ERROR: Could not reconstruct context for SSH configuration!", file=sys.stderr)
-    ctx.exit(1)
+    params = _find_root_params(ctx)
+    if params is None:
+        return SSH_ConfigNames(hosts=[], groups=[])
+    return load_config_names(os.path.expanduser(params["config"]), use_cache=not params.get("no_cache", False))
 
 
 # For some reason I cant get context object initialized by main app when running autocomplete
 # BUG: https://github.com/pallets/click/issues/2303
 def complete_ssh_host_names(ctx, param, incomplete) -> List[str]:
-    build_context_config(ctx)
-    all_hosts = ctx.obj.get_all_host_names()
+    all_hosts = _context_config_names(ctx).hosts
     return [k for k in all_hosts if k.startswith(incomplete)]
 
 
 # For some reason I cant get context object initialized by main app when running autocomplete
 # BUG: https://github.com/pallets/click/issues/2303
 def complete_ssh_group_names(ctx, param, incomplete) -> List[str]:
-    build_context_config(ctx)
-    all_groups = ctx.obj.get_all_group_names()
+    all_groups = _context_config_names(ctx).groups
     return [k for k in all_groups if k.startswith(incomplete)]
 
 
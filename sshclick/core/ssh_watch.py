@@ -0,0 +1,202 @@
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import threading
+import time
+from typing import Optional
+
+from .ssh_cache import FileSignature, _file_signature
+
+from sshclick.globals import WATCH_POLL_INTERVAL, WATCH_SETTLE_DELAY
+from sshclick.logging import debug
+
+# inotify event flags (linux/inotify.h), folder events are used, so files replaced by rename are seen too
+IN_MODIFY = 0x002
+IN_ATTRIB = 0x004
+IN_CLOSE_WRITE = 0x008
+IN_MOVED_FROM = 0x040
+IN_MOVED_TO = 0x080
+IN_CREATE = 0x100
+IN_DELETE = 0x200
+IN_WATCH_MASK = IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+
+_EVENT_HEADER = struct.Struct("iIII")   # wd, mask, cookie, len (name follows)
+
+
+def _load_inotify():
+    """Return libc with inotify functions, or None when it is not available (non-Linux, restricted libc)."""
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or None, use_errno=True)
+        libc.inotify_init1, libc.inotify_add_watch     # Raise AttributeError when missing
+    except (OSError, AttributeError):
+        return None
+    return libc
+
+
+class SSH_ConfigWatcher:
+    """
+    Watch SSH config files and report which of them changed.
+
+    On Linux, inotify (used directly from libc, no extra dependency) watches
+    folders of the files, so also editors that save by replacing the file are
+    seen. Where inotify is not available, files are polled every `poll_interval`
+    seconds. Either way file signature (mtime, size, inode) decides if file
+    really changed, events only wake the watcher up early.
+
+    `wait` blocks, so it is meant to run in a worker thread; `close` (from any
+    thread) makes it return right away.
+    """
+
+    def __init__(self, paths: list[str], poll_interval: float = WATCH_POLL_INTERVAL, use_inotify: bool = True) -> None:
+        self.poll_interval = poll_interval
+        self.closed = False
+        self._lock = threading.Lock()
+        self._pending_paths: Optional[list[str]] = None
+        self._waiting = False
+        self._signatures: dict[str, Optional[FileSignature]] = {}
+        self._watched_dirs: dict[str, int] = {}
+        self._wake_read, self._wake_write = os.pipe()
+
+        self._libc = _load_inotify() if use_inotify else None
+        self._inotify_fd = -1
+        if self._libc is not None:
+            self._inotify_fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+            if self._inotify_fd < 0:
+                debug(f"inotify not available ({os.strerror(ctypes.get_errno())}), polling config files")
+                self._libc = None
+
+        self._set_watched(paths)
+
+
+    @property
+    def uses_inotify(self) -> bool:
+        return self._libc is not None
+
+
+    @staticmethod
+    def signature(path: str) -> Optional[FileSignature]:
+        """Return file signature as compared by watcher (None when file is missing)."""
+        return _file_signature(os.path.abspath(path))
+
+
+    def set_paths(self, paths: list[str]) -> None:
+        """Replace watched files (safe to call while other thread waits), current state is the new baseline."""
+        with self._lock:
+            if self.closed:
+                return
+            self._pending_paths = list(paths)
+            os.write(self._wake_write, b"\0")
+
+
+    def wait(self, timeout: Optional[float] = None) -> dict[str, Optional[FileSignature]]:
+        """
+        Block until some watched file changes, returning {path: new signature} of changed files.
+
+        Returns empty dict when `timeout` (seconds) expires or watcher is closed.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._lock:
+            if self.closed:
+                return {}
+            self._waiting = True
+        try:
+            while not self.closed:
+                with self._lock:
+                    pending, self._pending_paths = self._pending_paths, None
+                if pending is not None:
+                    self._set_watched(pending)
+
+                changed = self._changed_files()
+                if changed:
+                    return changed
+
+                delay = self.poll_interval
+                if deadline is not None:
+                    delay = min(delay, deadline - time.monotonic())
+                    if delay <= 0:
+                        return {}
+                self._sleep(delay)
+            return {}
+        finally:
+            with self._lock:
+                self._waiting = False
+                if self.closed:
+                    self._release()
+
+
+    def close(self) -> None:
+        """Stop watching, waking up `wait` in other thread."""
+        with self._lock:
+            if self.closed:
+                return
+            self.closed = True
+            if self._waiting:
+                # Waiting thread releases descriptors itself, once it is not using them
+                os.write(self._wake_write, b"\0")
+            else:
+                self._release()
+
+
+    def _release(self) -> None:
+        for fd in (self._inotify_fd, self._wake_read, self._wake_write):
+            if fd >= 0:
+                os.close(fd)
+        self._inotify_fd = self._wake_read = self._wake_write = -1
+
+
+    def _set_watched(self, paths: list[str]) -> None:
+        paths = [os.path.abspath(path) for path in paths]
+        self._signatures = {path: _file_signature(path) for path in paths}
+        if not self.uses_inotify:
+            return
+        for folder in {os.path.dirname(path) for path in paths} - set(self._watched_dirs):
+            wd = self._libc.inotify_add_watch(self._inotify_fd, os.fsencode(folder), IN_WATCH_MASK)
+            if wd >= 0:
+                self._watched_dirs[folder] = wd
+            else:
+                # Polling still covers files in this folder
+                debug(f"Cannot watch folder '{folder}': {os.strerror(ctypes.get_errno())}")
+
+
+    def _changed_files(self) -> dict[str, Optional[FileSignature]]:
+        changed = {}
+        for path, known in self._signatures.items():
+            current = _file_signature(path)
+            if current != known:
+                changed[path] = current
+        self._signatures.update(changed)
+        return changed
+
+
+    def _sleep(self, delay: float) -> None:
+        """Sleep until delay passes, watcher is woken up, or relevant inotify event arrives."""
+        watched_fds = [self._wake_read] + ([self._inotify_fd] if self._inotify_fd >= 0 else [])
+        ready, _, _ = select.select(watched_fds, [], [], delay)
+        if self._wake_read in ready:
+            os.read(self._wake_read, 4096)
+        if self._inotify_fd in ready and self._read_events():
+            # Editors often write file in several steps, let them finish before comparing
+            time.sleep(WATCH_SETTLE_DELAY)
+            self._read_events()
+
+
+    def _read_events(self) -> bool:
+        """Drain pending inotify events, returning True if any of them is about a watched file."""
+        names = {(os.path.dirname(path), os.path.basename(path)) for path in self._signatures}
+        folders = {wd: folder for folder, wd in self._watched_dirs.items()}
+        relevant = False
+        while self._inotify_fd >= 0:
+            try:
+                data = os.read(self._inotify_fd, 65536)
+            except (BlockingIOError, OSError):
+                break
+            offset = 0
+            while offset + _EVENT_HEADER.size <= len(data):
+                wd, _, _, length = _EVENT_HEADER.unpack_from(data, offset)
+                offset += _EVENT_HEADER.size
+                name = os.fsdecode(data[offset:offset + length].rstrip(b"\0"))
+                offset += length
+                relevant = relevant or (folders.get(wd), name) in names
+        return relevant
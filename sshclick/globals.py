@@ -28,6 +28,7 @@ SSHCONFIG_META_SEPARATOR = ":"
 # SSH Connection options
 # -----------------------------------------------------------------------------
 SSH_CONNECT_TIMEOUT = 3
+REACHABILITY_CONCURRENCY = 256      # Max parallel TCP checks (keep well below open files limit)
 
 
 # -----------------------------------------------------------------------------
@@ -37,3 +38,8 @@ ACTIONS_EDIT_DISABLED = True
 ACTIONS_DELETE_DISABLED = True
 ACTIONS_CREATE_HOST_DISABLED = True
 ACTIONS_CREATE_GROUP_DISABLED = True
+DETAILS_DEBOUNCE = 0.05             # Seconds highlight must settle before details pane is rendered
+DETAILS_CACHE_SIZE = 256            # Max hosts with cached details renderables
+SEARCH_RESULT_LIMIT = 200           # Max hosts listed as search results
+WATCH_POLL_INTERVAL = 1.0           # Seconds between config file checks when watching for external edits
+WATCH_SETTLE_DELAY = 0.1            # Seconds to let an editor finish writing before file is re-read
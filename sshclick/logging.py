@@ -1,25 +1,35 @@
 import os
 
-from rich.console import Console
-
-out = Console()
+# Rich console is created only when first message is printed, so importing this
+# module (which is done by most of sshclick) stays cheap for fast paths like
+# "sshc --version" or shell completion
+_console = None
 
 # I dont really need full logging import, just output some info if currently debugging
 DEBUG = True if "SSHC_DEBUG" in os.environ and os.environ["SSHC_DEBUG"] == "1" else False
 
 
+def get_console():
+    global _console
+    if _console is None:
+        from rich.console import Console
+
+        _console = Console()
+    return _console
+
+
 def debug(msg):
     if DEBUG:
-        out.print(f"[bright_blue]DEBUG[/]: {msg}")
+        get_console().print(f"[bright_blue]DEBUG[/]: {msg}")
 
 
 def info(msg):
-    out.print(f"[cyan]INFO[/]: {msg}")
+    get_console().print(f"[cyan]INFO[/]: {msg}")
 
 
 def warn(msg):
-    out.print(f"[yellow]WARN[/]: {msg}")
+    get_console().print(f"[yellow]WARN[/]: {msg}")
 
 
 def error(msg):
-    out.print(f"[bright_red]ERROR[/]: {msg}")
+    get_console().print(f"[bright_red]ERROR[/]: {msg}")
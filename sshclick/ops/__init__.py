@@ -1,11 +1,14 @@
 """Shared config mutation helpers used by both CLI and TUI layers."""
 
+from .changes import ChangeSet
 from .config_ops import delete_host_style, set_host_style
 from .errors import SSHClickOpsError
 from .group_ops import create_group, delete_group, edit_group, rename_group, update_group
 from .host_ops import create_host, delete_host, edit_host, rename_host, update_host
+from .reload_ops import reload_config_file
 
 __all__ = [
+    "ChangeSet",
     "SSHClickOpsError",
     "create_group",
     "create_host",
@@ -15,6 +18,7 @@ __all__ = [
     "edit_group",
     "edit_host",
     "rename_group",
+    "reload_config_file",
     "rename_host",
     "set_host_style",
     "update_group",
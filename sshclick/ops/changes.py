@@ -0,0 +1,32 @@
+from dataclasses import dataclass, field
+
+from sshclick.core import SSH_Group, SSH_Host
+
+# -----------------------------------------------------------------------------
+# Change set collected by config operations
+# -----------------------------------------------------------------------------
+
+@dataclass
+class ChangeSet:
+    """
+    Hosts and groups touched by config operations.
+
+    Operations record into a change set when one is passed to them, so views
+    (like the TUI tree) can update only affected items instead of rebuilding
+    everything from the model. Objects keep their identity, renames and moves
+    also remember the previous name or group.
+    """
+
+    added_hosts: list[SSH_Host] = field(default_factory=list)
+    removed_hosts: list[SSH_Host] = field(default_factory=list)
+    renamed_hosts: list[tuple[SSH_Host, str]] = field(default_factory=list)    # (host, old name)
+    moved_hosts: list[tuple[SSH_Host, str]] = field(default_factory=list)      # (host, old group name)
+    updated_hosts: list[SSH_Host] = field(default_factory=list)
+
+    added_groups: list[SSH_Group] = field(default_factory=list)
+    removed_groups: list[SSH_Group] = field(default_factory=list)
+    renamed_groups: list[tuple[SSH_Group, str]] = field(default_factory=list)  # (group, old name)
+    updated_groups: list[SSH_Group] = field(default_factory=list)
+
+    def __bool__(self) -> bool:
+        return any(getattr(self, name) for name in self.__dataclass_fields__)
@@ -2,24 +2,29 @@ from collections.abc import Sequence
 
 from sshclick.core import SSH_Config, SSH_Group
 
+from .changes import ChangeSet
 from .errors import SSHClickOpsError
 
 # -----------------------------------------------------------------------------
 # SSHClick group configuration operations
 # -----------------------------------------------------------------------------
 
-def create_group(config: SSH_Config, name: str, *, desc: str = "", info: Sequence[str] = ()) -> SSH_Group:
+def create_group(config: SSH_Config, name: str, *, desc: str = "", info: Sequence[str] = (), changes: ChangeSet | None = None) -> SSH_Group:
     """Create a new SSHClick group in the in-memory config model."""
 
     if config.check_group_by_name(name):
         raise SSHClickOpsError(f"Cannot create new group '{name}', as group already exists with this name")
 
     new_group = SSH_Group(name=name, desc=desc, info=list(info))
-    config.groups.append(new_group)
+    config.add_group(new_group)
+    if changes is not None:
+        changes.added_groups.append(new_group)
     return new_group
 
 
-def edit_group(config: SSH_Config, name: str, *, new_name: str, desc: str = "", info: Sequence[str] = ()) -> SSH_Group:
+def edit_group(
+    config: SSH_Config, name: str, *, new_name: str, desc: str = "", info: Sequence[str] = (), changes: ChangeSet | None = None
+) -> SSH_Group:
     """Edit a group in place, optionally renaming it and replacing its metadata."""
 
     if not config.check_group_by_name(name):
@@ -31,27 +36,32 @@ def edit_group(config: SSH_Config, name: str, *, new_name: str, desc: str = "",
         if config.check_group_by_name(new_name):
             raise SSHClickOpsError(f"Cannot rename group '{name}' to '{new_name}' as new name is already used!")
 
-        found_group.name = new_name
-        for host in found_group.hosts + found_group.patterns:
-            host.group = new_name
+        config.change_group_name(found_group, new_name)
+        if changes is not None:
+            changes.renamed_groups.append((found_group, name))
 
     found_group.desc = desc.strip()
     found_group.info = [line.strip() for line in info if line.strip()]
+    config.mark_group_changed(found_group)
+    if changes is not None:
+        changes.updated_groups.append(found_group)
     return found_group
 
 
-def delete_group(config: SSH_Config, name: str) -> SSH_Group:
+def delete_group(config: SSH_Config, name: str, *, changes: ChangeSet | None = None) -> SSH_Group:
     """Delete a group from the in-memory config model and return it."""
 
     if not config.check_group_by_name(name):
         raise SSHClickOpsError(f"Cannot delete group '{name}', it is not defined in configuration!")
 
     found_group = config.get_group_by_name(name)
-    config.groups.remove(found_group)
+    config.remove_group(found_group)
+    if changes is not None:
+        changes.removed_groups.append(found_group)
     return found_group
 
 
-def rename_group(config: SSH_Config, name: str, new_name: str) -> SSH_Group:
+def rename_group(config: SSH_Config, name: str, new_name: str, *, changes: ChangeSet | None = None) -> SSH_Group:
     """Rename a group and update the group reference on its hosts and patterns."""
 
     if not config.check_group_by_name(name):
@@ -60,13 +70,15 @@ def rename_group(config: SSH_Config, name: str, new_name: str) -> SSH_Group:
         raise SSHClickOpsError(f"Cannot rename group '{name}' to '{new_name}' as new name is already used!")
 
     found_group = config.get_group_by_name(name)
-    found_group.name = new_name
-    for host in found_group.hosts + found_group.patterns:
-        host.group = new_name
+    config.change_group_name(found_group, new_name)
+    if changes is not None:
+        changes.renamed_groups.append((found_group, name))
     return found_group
 
 
-def update_group(config: SSH_Config, name: str, *, desc: str | None = None, info: Sequence[str] | None = None) -> SSH_Group:
+def update_group(
+    config: SSH_Config, name: str, *, desc: str | None = None, info: Sequence[str] | None = None, changes: ChangeSet | None = None
+) -> SSH_Group:
     """Update the editable metadata fields on a single group."""
 
     if desc is None and info is None:
@@ -81,4 +93,7 @@ def update_group(config: SSH_Config, name: str, *, desc: str | None = None, info
     if info is not None:
         found_group.info = [line.strip() for line in info if line.strip()]
 
+    config.mark_group_changed(found_group)
+    if changes is not None:
+        changes.updated_groups.append(found_group)
     return found_group
@@ -3,6 +3,7 @@ from collections.abc import Sequence
 from sshclick.globals import DEFAULT_GROUP_NAME
 from sshclick.core import HostType, PARAMS_WITH_ALLOWED_MULTIPLE_VALUES, SSH_Config, SSH_Group, SSH_Host
 
+from .changes import ChangeSet
 from .errors import SSHClickOpsError
 
 # -----------------------------------------------------------------------------
@@ -20,6 +21,7 @@ def create_host(
     parameters: Sequence[tuple[str, str]] = (),
     target_group_name: str | None = None,
     force_group: bool = False,
+    changes: ChangeSet | None = None,
 ) -> SSH_Host:
     """Create a new host or pattern host in the in-memory config model."""
 
@@ -27,7 +29,7 @@ def create_host(
     if config.check_host_by_name(name):
         raise SSHClickOpsError(f"Cannot create host '{name}' as it already exists in configuration!")
 
-    target_group = _resolve_target_group(config, name, target_group_name, force_group)
+    target_group = _resolve_target_group(config, name, target_group_name, force_group, changes)
     inferred_type = HostType.PATTERN if "*" in name else HostType.NORMAL
     target_type = host_type or inferred_type
 
@@ -46,11 +48,9 @@ def create_host(
     for param, value in parameters:
         _store_host_parameter(new_host, param.lower(), value, address=address, user=user)
 
-    if target_type == HostType.NORMAL:
-        target_group.hosts.append(new_host)
-    else:
-        target_group.patterns.append(new_host)
-    config.all_hosts.append(new_host)
+    config.add_host(new_host)
+    if changes is not None:
+        changes.added_hosts.append(new_host)
     return new_host
 
 
@@ -65,6 +65,7 @@ def edit_host(
     parameters: Sequence[tuple[str, str]] = (),
     target_group_name: str | None = None,
     force_group: bool = False,
+    changes: ChangeSet | None = None,
 ) -> SSH_Host:
     """Replace a host definition in the in-memory model using guided-form values."""
 
@@ -76,12 +77,13 @@ def edit_host(
     current_host = config.get_host_by_name(original_name)
     source_group = config.get_group_by_name(current_host.group)
     target_group_name = target_group_name or current_host.group
-    target_group = source_group if target_group_name == current_host.group else _resolve_target_group(config, new_name, target_group_name, force_group)
+    target_group = source_group if target_group_name == current_host.group else _resolve_target_group(config, new_name, target_group_name, force_group, changes)
 
     old_type = current_host.type
     new_type = HostType.PATTERN if "*" in new_name else HostType.NORMAL
 
-    current_host.name = new_name
+    if new_name != original_name:
+        config.change_host_name(current_host, new_name)
     current_host.group = target_group.name
     current_host.type = new_type
     current_host.info = list(info)
@@ -97,30 +99,33 @@ def edit_host(
 
     if source_group != target_group or old_type != new_type:
         _rehome_host(config, current_host, source_group, target_group, old_type)
+    config.mark_host_changed(current_host, moved=source_group != target_group)
+
+    if changes is not None:
+        if new_name != original_name:
+            changes.renamed_hosts.append((current_host, original_name))
+        if source_group != target_group or old_type != new_type:
+            changes.moved_hosts.append((current_host, source_group.name))
+        changes.updated_hosts.append(current_host)
 
     _recompute_inheritance(config)
     return current_host
 
 
-def delete_host(config: SSH_Config, name: str) -> SSH_Host:
+def delete_host(config: SSH_Config, name: str, *, changes: ChangeSet | None = None) -> SSH_Host:
     """Delete a host or pattern host from the in-memory config model and return it."""
 
     if not config.check_host_by_name(name):
         raise SSHClickOpsError(f"Cannot delete host '{name}' as it is not defined in configuration!")
 
     found_host = config.get_host_by_name(name)
-    host_group = config.get_group_by_name(found_host.group)
-
-    if found_host.type == HostType.NORMAL:
-        host_group.hosts.remove(found_host)
-    else:
-        host_group.patterns.remove(found_host)
-
-    config.all_hosts.remove(found_host)
+    config.remove_host(found_host)
+    if changes is not None:
+        changes.removed_hosts.append(found_host)
     return found_host
 
 
-def rename_host(config: SSH_Config, name: str, new_name: str) -> SSH_Host:
+def rename_host(config: SSH_Config, name: str, new_name: str, *, changes: ChangeSet | None = None) -> SSH_Host:
     """Rename a host if the current and target names are valid."""
 
     if not config.check_host_by_name(name):
@@ -129,7 +134,9 @@ def rename_host(config: SSH_Config, name: str, new_name: str) -> SSH_Host:
         raise SSHClickOpsError(f"Cannot rename host '{name}' to '{new_name}' as new name is already used!")
 
     found_host = config.get_host_by_name(name)
-    found_host.name = new_name
+    config.change_host_name(found_host, new_name)
+    if changes is not None:
+        changes.renamed_hosts.append((found_host, name))
     return found_host
 
 
@@ -141,6 +148,7 @@ def update_host(
     parameters: Sequence[tuple[str, str]] = (),
     target_group_name: str | None = None,
     force_group: bool = False,
+    changes: ChangeSet | None = None,
 ) -> SSH_Host:
     """Update host metadata, parameters, and optionally move it to a different group."""
 
@@ -157,8 +165,10 @@ def update_host(
             # Keep current CLI semantics: no hard failure if already in target group.
             pass
         else:
-            target_group = _resolve_target_group(config, name, target_group_name, force_group)
+            target_group = _resolve_target_group(config, name, target_group_name, force_group, changes)
             config.move_host_to_group(current_host, current_group, target_group)
+            if changes is not None:
+                changes.moved_hosts.append((current_host, current_group.name))
 
     if info is not None:
         if info and len(info[0]) > 0:
@@ -169,17 +179,25 @@ def update_host(
     for param, value in parameters:
         _update_host_parameter(current_host, name, param.lower(), value)
 
+    if info is not None or parameters:
+        config.mark_host_changed(current_host)
+        if changes is not None:
+            changes.updated_hosts.append(current_host)
     return current_host
 
 
-def _resolve_target_group(config: SSH_Config, host_name: str, target_group_name: str, force_group: bool) -> SSH_Group:
+def _resolve_target_group(
+    config: SSH_Config, host_name: str, target_group_name: str, force_group: bool, changes: ChangeSet | None = None
+) -> SSH_Group:
     """Return the destination group, creating it only when `force_group` allows it."""
     
     if config.check_group_by_name(target_group_name):
         return config.get_group_by_name(target_group_name)
     if force_group:
         new_group = SSH_Group(name=target_group_name)
-        config.groups.append(new_group)
+        config.add_group(new_group)
+        if changes is not None:
+            changes.added_groups.append(new_group)
         return new_group
     raise SSHClickOpsError(
         f"Cannot create host '{host_name}' in group '{target_group_name}' since the group does not exist\n"
@@ -0,0 +1,132 @@
+import os
+
+from sshclick.core import HostType, SSH_Config, SSH_Host, SSH_PatternIndex
+
+from .changes import ChangeSet
+
+# -----------------------------------------------------------------------------
+# SSHClick incremental reload of changed source files
+# -----------------------------------------------------------------------------
+
+def reload_config_file(config: SSH_Config, path: str, changes: ChangeSet | None = None) -> bool:
+    """
+    Re-parse one changed source file (root config or included file) into the loaded model.
+
+    Only the changed file is read and parsed. Its hosts are matched by name to
+    hosts already in the model: unchanged hosts are kept as they are, changed
+    ones are updated in place (so they keep identity), others are added or
+    removed. Inherited parameters are resolved again only for hosts affected by
+    changed hosts and patterns.
+
+    Returns False (leaving model untouched) when file cannot be reloaded alone,
+    for example when its group headers, global keywords or Include directives
+    changed, or hosts were reordered. Caller should do a full reload then.
+    """
+
+    path = os.path.abspath(path)
+    try:
+        with open(path, "r") as fh:
+            lines = fh.read().split("\n")
+    except OSError:
+        return False
+
+    source = config.parse_source_file(path, lines)
+    if source is None:
+        return False
+
+    old_hosts = [host for host in config.all_hosts if host.source_file == path]
+    new_hosts = source.all_hosts
+    if not _can_replace(config, path, old_hosts, source):
+        return False
+
+    old_by_name = {host.name: host for host in old_hosts}
+    merged_hosts: list[SSH_Host] = []
+    added, moved, updated = [], [], []
+    changed_patterns: list[SSH_Host] = []
+
+    for new_host in new_hosts:
+        host = old_by_name.pop(new_host.name, None)
+        if host is None:
+            merged_hosts.append(new_host)
+            added.append(new_host)
+            if new_host.type == HostType.PATTERN:
+                changed_patterns.append(new_host)
+            continue
+
+        old_group, old_type = host.group, host.type
+        modified = (host.alt_names, host.info, host.password, host.params) != (new_host.alt_names, new_host.info, new_host.password, new_host.params)
+        if HostType.PATTERN in (old_type, new_host.type) and (modified or old_type != new_host.type):
+            changed_patterns.append(host)
+
+        host.group, host.type = new_host.group, new_host.type
+        host.alt_names, host.info, host.password, host.params = new_host.alt_names, new_host.info, new_host.password, new_host.params
+        host.source_line, host.source_span = new_host.source_line, new_host.source_span
+        merged_hosts.append(host)
+        if host.group != old_group or host.type != old_type:
+            moved.append((host, old_group))
+        elif modified:
+            updated.append(host)
+
+    removed = list(old_by_name.values())
+    changed_patterns.extend(host for host in removed if host.type == HostType.PATTERN)
+
+    config.replace_source_hosts(path, old_hosts, merged_hosts, source)
+
+    # Inheritance changes for hosts that changed, and for all hosts matched by changed patterns
+    affected = {id(host): host for host in added + updated + [host for host, _ in moved] if host.type == HostType.NORMAL}
+    if changed_patterns:
+        pattern_index = SSH_PatternIndex([pattern.name for pattern in changed_patterns])
+        for host in config.all_hosts:
+            if host.type == HostType.NORMAL and id(host) not in affected and pattern_index.match(host.name):
+                affected[id(host)] = host
+    inherited = config.resolve_inheritance(list(affected.values()))
+
+    if changes is not None:
+        changes.added_hosts.extend(added)
+        changes.removed_hosts.extend(removed)
+        changes.moved_hosts.extend(moved)
+        reported = {id(host) for host in added + updated} | {id(host) for host, _ in moved}
+        changes.updated_hosts.extend(updated + [host for host in inherited if id(host) not in reported])
+    return True
+
+
+def _can_replace(config: SSH_Config, path: str, old_hosts: list[SSH_Host], source: SSH_Config) -> bool:
+    """Check that re-parsed file can replace its old hosts without touching anything outside of them."""
+
+    new_hosts = source.all_hosts
+    old_names = [host.name for host in old_hosts]
+    new_names = [host.name for host in new_hosts]
+    if len(set(old_names)) != len(old_names) or len(set(new_names)) != len(new_names):
+        return False
+
+    # Hosts of a file must be one continuous run, and a file without hosts has no known place for new ones
+    if not old_hosts:
+        return not new_hosts
+    start = next(index for index, host in enumerate(config.all_hosts) if host is old_hosts[0])
+    if any(current is not old for current, old in zip(config.all_hosts[start:start + len(old_hosts)], old_hosts)):
+        return False
+
+    # Kept hosts must stay in same order, as order decides inheritance and placement in groups
+    old_set, new_set = set(old_names), set(new_names)
+    if [name for name in old_names if name in new_set] != [name for name in new_names if name in old_set]:
+        return False
+
+    # Names of added hosts must not collide with hosts from other files
+    if any(name not in old_set and config.check_host_by_name(name) for name in new_names):
+        return False
+
+    # Group headers defined in file must be same as before (groups are shared between files)
+    declared_before = sorted(
+        (min(line for file, line in group.source_refs if file == path), group.name)
+        for group in config.groups if any(file == path for file, _ in group.source_refs)
+    )
+    declared_now = [group.name for group in source.groups if group.source_refs]
+    if [name for _, name in declared_before] != declared_now:
+        return False
+    for group in source.groups:
+        if group.source_refs:
+            current = config.get_group_by_name(group.name)
+            if (current.desc, current.info) != (group.desc, group.info):
+                return False
+
+    return all(config.check_group_by_name(host.group) for host in new_hosts)
@@ -1,12 +1,25 @@
 import os.path
 
+from textual import work
 from textual.app import App, ComposeResult
 from textual.containers import Horizontal, Vertical
 from textual.widgets import Footer, Header
 
 from sshclick.globals import USER_SSH_CONFIG
-from sshclick.core import SSH_Config, SSH_Group, SSH_Host
-from sshclick.ops import SSHClickOpsError, create_group, create_host, delete_group, delete_host, delete_host_style, edit_group, edit_host, set_host_style
+from sshclick.core import SSH_Config, SSH_ConfigWatcher, SSH_Group, SSH_Host, SSH_HostSearchIndex, load_ssh_config_cached
+from sshclick.ops import (
+    ChangeSet,
+    SSHClickOpsError,
+    create_group,
+    create_host,
+    delete_group,
+    delete_host,
+    delete_host_style,
+    edit_group,
+    edit_host,
+    reload_config_file,
+    set_host_style,
+)
 from sshclick.tui.screens import (
     ActionMenuScreen,
     ConfirmDeleteScreen,
@@ -47,16 +60,26 @@ class SSHTui(App):
         ("f", "connect('sftp')", "SFTP"),
         ("d", "delete", "Delete"),
         ("r", "reload", "Reload"),
+        ("slash", "search", "Search"),
     ]
 
 
-    def __init__(self, config_file: str = USER_SSH_CONFIG) -> None:
+    def __init__(self, config_file: str = USER_SSH_CONFIG, use_cache: bool = True, watch: bool = True) -> None:
         super().__init__()
         config_path = os.path.expanduser(config_file)
-        sshconf = SSH_Config(file=config_path).read().parse()
+        # Initial load happens before the UI is shown, so it does not block the event loop.
+        # Parse cache makes repeated starts with unchanged config cheap.
+        sshconf = load_ssh_config_cached(config_path, use_cache=use_cache)
         self.state = TUIState(config_file=config_path, sshconf=sshconf)
         self.current_node: SSHNode = None
         self._tree_rebuilding = False
+        self._use_cache = use_cache
+        self._reload_generation = 0     # Only the latest started reload may swap in its config model
+        self._search_generation = 0     # Only the latest started search index build may be used
+        self._reloading = False
+        self._watch = watch
+        self._watcher: SSH_ConfigWatcher | None = None
+        self._own_writes: dict[str, tuple] = {}   # Signatures of files as written by TUI, so they are not taken for external edits
 
 
     def get_theme_variable_defaults(self) -> dict[str, str]:
@@ -81,6 +104,13 @@ class SSHTui(App):
         self.theme = SSHCLICK_DARK_THEME.name
         self._refresh_view(rebuild_tree=True)
         self._focus_tree()
+        self._build_search_index(self.state.sshconf)
+        self._start_config_watch()
+
+
+    def on_unmount(self) -> None:
+        if self._watcher is not None:
+            self._watcher.close()
 
 
     def on_navigation_tree_node_highlighted(self, event) -> None:
@@ -217,16 +247,148 @@ class SSHTui(App):
         Reload the parsed config and restore the previous selection when possible.
 
         This is the main refresh path after external writes or destructive TUI
-        actions. Selection is restored by node name so the UI lands roughly
-        where the user was before the reload.
+        actions. Parsing runs in a worker thread, so the UI stays responsive,
+        and the new model is swapped in at once when parsing is done. Starting
+        a reload cancels the one still running. Selection is restored by node
+        name so the UI lands roughly where the user was before the reload.
         """
 
-        selected_name = self._selected_name()
-        self.state.sshconf = SSH_Config(file=self.state.config_file).read().parse()
+        self._reload_generation += 1
+        self._reloading = True
+        status = self.query_one_optional(StatusBar)
+        if status is not None:
+            status.set_progress("Reloading configuration...")
+        self._reload_config(self._reload_generation, self._selected_name())
+
+
+    @work(thread=True, exclusive=True, group="config_reload", exit_on_error=False)
+    def _reload_config(self, generation: int, selected_name: str | None) -> None:
+        """Parse config in worker thread, and hand the new model over to the UI thread."""
+
+        try:
+            if not os.path.exists(self.state.config_file):
+                raise OSError(f"Config file not found: {self.state.config_file}")
+            sshconf = load_ssh_config_cached(self.state.config_file, use_cache=self._use_cache)
+        except (Exception, SystemExit) as exc:
+            self.call_from_thread(self._finish_reload, generation, None, selected_name, str(exc) or "parse failed")
+            return
+        self.call_from_thread(self._finish_reload, generation, sshconf, selected_name)
+
+
+    def _finish_reload(self, generation: int, sshconf: SSH_Config | None, selected_name: str | None, failure: str = "") -> None:
+        if generation != self._reload_generation:
+            # Superseded by a newer reload, its result will be used instead
+            return
+
+        self._reloading = False
+        status = self.query_one_optional(StatusBar)
+        if status is not None:
+            status.set_progress(None)
+
+        if sshconf is None:
+            self.notify(f"Configuration reload failed: {failure}", severity="error")
+            return
+
+        self.state.sshconf = sshconf
         self._refresh_view(preferred_name=selected_name, rebuild_tree=True)
+        self._build_search_index(sshconf)
+        if self._watcher is not None:
+            # Includes may have changed, and model now matches files as they are
+            self._watcher.set_paths(self._watched_files())
         self.notify("Configuration reloaded", severity="information")
 
 
+    def _start_config_watch(self) -> None:
+        """Watch config file and its included files, so external edits show up without manual reload."""
+
+        if not self._watch or not os.path.exists(self.state.config_file):
+            return
+        self._watcher = SSH_ConfigWatcher(self._watched_files())
+        self._watch_config(self._watcher)
+
+
+    def _watched_files(self) -> list[str]:
+        return [os.path.abspath(self.state.config_file)] + self.state.sshconf.included_files
+
+
+    @work(thread=True, exclusive=True, group="config_watch", exit_on_error=False)
+    def _watch_config(self, watcher: SSH_ConfigWatcher) -> None:
+        while not watcher.closed:
+            changed = watcher.wait()
+            if changed and not watcher.closed:
+                self.call_from_thread(self._config_files_changed, changed)
+
+
+    def _config_files_changed(self, changed: dict[str, tuple | None]) -> None:
+        """
+        Bring external edits of watched files into the loaded model.
+
+        Only changed files are parsed again, their hosts are merged into the
+        model, and the tree is patched in place keeping current selection.
+        Edits that cannot be applied to one file alone (Include or group header
+        changes, for example) fall back to a full reload in background.
+        """
+
+        external = [path for path, signature in changed.items() if signature is None or self._own_writes.get(path) != signature]
+        if not external:
+            return
+        if self._reloading:
+            # Running reload could have read files before this edit, so start it over
+            self.action_reload()
+            return
+
+        selected_name = self._selected_name()
+        changes = ChangeSet()
+        for path in external:
+            if not reload_config_file(self.state.sshconf, path, changes):
+                self.action_reload()
+                return
+
+        self._refresh_view(preferred_name=selected_name, changes=changes)
+        if changes:
+            self.notify(f"Configuration updated from {', '.join(os.path.basename(path) for path in external)}", severity="information")
+
+
+    def _write_config(self) -> bool:
+        """Write config model to disk, remembering written file so its watcher event is ignored."""
+
+        written = self.state.sshconf.generate_ssh_config()
+        if written:
+            path = os.path.abspath(self.state.config_file)
+            self._own_writes[path] = SSH_ConfigWatcher.signature(path)
+        return written
+
+
+    def action_search(self) -> None:
+        """Open incremental host search above the navigation tree."""
+
+        nav_tree = self.query_one_optional(NavigationTree)
+        if nav_tree is not None:
+            nav_tree.open_search()
+
+
+    def _build_search_index(self, sshconf: SSH_Config) -> None:
+        """Precompute host search index in background, so typing a query never waits for it."""
+
+        self._search_generation += 1
+        self._search_index_worker(self._search_generation, sshconf)
+
+
+    @work(thread=True, exclusive=True, group="search_index", exit_on_error=False)
+    def _search_index_worker(self, generation: int, sshconf: SSH_Config) -> None:
+        index = SSH_HostSearchIndex(sshconf.all_hosts)
+        self.call_from_thread(self._finish_search_index, generation, sshconf, index)
+
+
+    def _finish_search_index(self, generation: int, sshconf: SSH_Config, index: SSH_HostSearchIndex) -> None:
+        if generation != self._search_generation:
+            # Config was edited while index was built, newer build is on its way
+            return
+        nav_tree = self.query_one_optional(NavigationTree)
+        if nav_tree is not None:
+            nav_tree.set_search_index(sshconf, index)
+
+
     def action_delete(self) -> None:
         if not self._can_delete_current_node():
             return
@@ -239,13 +401,14 @@ class SSHTui(App):
             return
 
         preferred_name = self._preferred_name_after_delete()
-        item_type, deleted_name = self._delete_current_node()
+        changes = ChangeSet()
+        item_type, deleted_name = self._delete_current_node(changes)
 
-        if self.state.sshconf.generate_ssh_config():
+        if self._write_config():
             self.notify(f"Deleted {item_type}: {deleted_name}", severity="information")
         self.current_node = None
         self.state.current_node = None
-        self._refresh_view(preferred_name=preferred_name, rebuild_tree=True)
+        self._refresh_view(preferred_name=preferred_name, changes=changes)
         self._focus_tree()
 
 
@@ -262,6 +425,7 @@ class SSHTui(App):
             self._focus_tree()
             return
 
+        changes = ChangeSet()
         try:
             created_host = create_host(
                 self.state.sshconf,
@@ -272,16 +436,17 @@ class SSHTui(App):
                 parameters=self._request_parameters(request),
                 target_group_name=request.group_name,
                 force_group=request.create_group,
+                changes=changes,
             )
         except SSHClickOpsError as exc:
             self.notify(str(exc), title="Create host failed", severity="error")
             self._focus_tree()
             return
 
-        if self.state.sshconf.generate_ssh_config():
+        if self._write_config():
             self.notify(f"Created host: {created_host.name}", severity="information")
 
-        self._refresh_view(preferred_name=created_host.name, rebuild_tree=True)
+        self._refresh_view(preferred_name=created_host.name, changes=changes)
         self._focus_tree()
 
 
@@ -292,22 +457,24 @@ class SSHTui(App):
             self._focus_tree()
             return
 
+        changes = ChangeSet()
         try:
             created_group = create_group(
                 self.state.sshconf,
                 request.name,
                 desc=request.desc,
                 info=self._request_info_lines(request),
+                changes=changes,
             )
         except SSHClickOpsError as exc:
             self.notify(str(exc), title="Create group failed", severity="error")
             self._focus_tree()
             return
 
-        if self.state.sshconf.generate_ssh_config():
+        if self._write_config():
             self.notify(f"Created group: {created_group.name}", severity="information")
 
-        self._refresh_view(preferred_name=created_group.name, rebuild_tree=True)
+        self._refresh_view(preferred_name=created_group.name, changes=changes)
         self._focus_tree()
 
 
@@ -329,7 +496,7 @@ class SSHTui(App):
             self._focus_tree()
             return
 
-        if self.state.sshconf.generate_ssh_config():
+        if self._write_config():
             self.notify("Updated SSHClick config", severity="information")
 
         self._refresh_view()
@@ -343,6 +510,7 @@ class SSHTui(App):
             self._focus_tree()
             return
 
+        changes = ChangeSet()
         try:
             edited_host = edit_host(
                 self.state.sshconf,
@@ -354,16 +522,17 @@ class SSHTui(App):
                 parameters=self._request_parameters(request),
                 target_group_name=request.group_name,
                 force_group=request.create_group,
+                changes=changes,
             )
         except SSHClickOpsError as exc:
             self.notify(str(exc), title="Edit host failed", severity="error")
             self._focus_tree()
             return
 
-        if self.state.sshconf.generate_ssh_config():
+        if self._write_config():
             self.notify(f"Updated host: {edited_host.name}", severity="information")
 
-        self._refresh_view(preferred_name=edited_host.name, rebuild_tree=True)
+        self._refresh_view(preferred_name=edited_host.name, changes=changes)
         self._focus_tree()
 
 
@@ -374,6 +543,7 @@ class SSHTui(App):
             self._focus_tree()
             return
 
+        changes = ChangeSet()
         try:
             edited_group = edit_group(
                 self.state.sshconf,
@@ -381,37 +551,50 @@ class SSHTui(App):
                 new_name=request.name,
                 desc=request.desc,
                 info=self._request_info_lines(request),
+                changes=changes,
             )
         except SSHClickOpsError as exc:
             self.notify(str(exc), title="Edit group failed", severity="error")
             self._focus_tree()
             return
 
-        if self.state.sshconf.generate_ssh_config():
+        if self._write_config():
             self.notify(f"Updated group: {edited_group.name}", severity="information")
 
-        self._refresh_view(preferred_name=edited_group.name, rebuild_tree=True)
+        self._refresh_view(preferred_name=edited_group.name, changes=changes)
         self._focus_tree()
 
 
     def _set_current_node(self, node: SSHNode) -> None:
         self.current_node = node
         self.state.current_node = node
-        self._refresh_view()
+        self._refresh_view(defer_details=True)
 
 
-    def _refresh_view(self, preferred_name: str | None = None, *, rebuild_tree: bool = False) -> None:
+    def _refresh_view(
+        self, preferred_name: str | None = None, *, rebuild_tree: bool = False, changes: ChangeSet | None = None, defer_details: bool = False
+    ) -> None:
         """
         Refresh every widget that depends on config state or current selection.
 
         This is the central synchronization point for the TUI. It updates the
         tree, details pane, status bar, and left-hand statistics while avoiding
-        unnecessary tree rebuilds that would collapse expanded groups.
+        unnecessary tree rebuilds that would collapse expanded groups. After
+        edits, `changes` from the ops layer are patched into the tree in place;
+        full rebuild is only done on config reloads. Plain highlight changes
+        set `defer_details`, so details are rendered only once selection settles.
         """
         selection_name = preferred_name or self._selected_name()
 
         nav_tree = self.query_one_optional(NavigationTree)
-        if nav_tree is not None and rebuild_tree:
+        if nav_tree is not None and changes is not None and not rebuild_tree:
+            self._tree_rebuilding = True
+            nav_tree.apply_changes(changes)
+            if changes and not nav_tree.has_search_index:
+                self._build_search_index(self.state.sshconf)
+            nav_tree.select_node_by_name(selection_name)
+            self.call_after_refresh(self._finish_tree_rebuild, selection_name)
+        elif nav_tree is not None and rebuild_tree:
             expanded_group_names = nav_tree.get_expanded_group_names()
             if selection_name and self.state.sshconf.check_group_by_name(selection_name) and selection_name not in expanded_group_names:
                 expanded_group_names.append(selection_name)
@@ -423,13 +606,16 @@ class SSHTui(App):
             nav_tree.select_node_by_name(selection_name)
             self.call_after_refresh(self._finish_tree_rebuild, selection_name)
 
-        if rebuild_tree or preferred_name is not None:
+        if rebuild_tree or changes is not None or preferred_name is not None:
             self._restore_selection(selection_name)
 
         details = self.query_one_optional(DetailsPane)
         if details is not None:
             details.update_config(self.state.sshconf)
-            details.update_node(self.current_node)
+            if defer_details:
+                details.schedule_node(self.current_node)
+            else:
+                details.update_node(self.current_node)
 
         status = self.query_one_optional(StatusBar)
         if status is not None:
@@ -511,15 +697,15 @@ class SSHTui(App):
         return True
 
 
-    def _delete_current_node(self) -> tuple[str, str]:
+    def _delete_current_node(self, changes: ChangeSet | None = None) -> tuple[str, str]:
         if isinstance(self.current_node, SSH_Group):
-            deleted_group = delete_group(self.state.sshconf, self.current_node.name)
+            deleted_group = delete_group(self.state.sshconf, self.current_node.name, changes=changes)
             return ("group", deleted_group.name)
-        return self._delete_current_host()
+        return self._delete_current_host(changes)
 
 
-    def _delete_current_host(self) -> tuple[str, str]:
-        deleted_host = delete_host(self.state.sshconf, self.current_node.name)
+    def _delete_current_host(self, changes: ChangeSet | None = None) -> tuple[str, str]:
+        deleted_host = delete_host(self.state.sshconf, self.current_node.name, changes=changes)
         return ("host", deleted_host.name)
 
 
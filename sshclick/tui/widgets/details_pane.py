@@ -8,14 +8,31 @@ from textual.containers import Grid, Vertical
 from textual.widgets import ContentSwitcher, Static, TabbedContent, TabPane
 
 from sshclick.core import SSH_Config, SSH_Group, SSH_Host, generate_graph
+from sshclick.globals import DETAILS_CACHE_SIZE, DETAILS_DEBOUNCE
 from sshclick.tui.state import SSHNode
 
+# Static card id -> builder method, in the order cards are updated for a host
+HOST_CARD_BUILDERS = {
+    "host_identity_card": "_build_host_identity",
+    "host_connection_card": "_build_host_connection",
+    "host_info_card": "_build_host_info",
+    "host_params_card": "_build_host_params",
+    "host_connectivity_route_card": "_build_host_connectivity_route",
+    "host_connectivity_tunnels_card": "_build_host_connectivity_tunnels",
+    "host_connectivity_graph_card": "_build_host_connectivity_graph",
+}
+
 
 class DetailsPane(Vertical):
     """Right-hand inspector that renders group and host details."""
 
     def __init__(self, sshconf: SSH_Config, id: str | None = None) -> None:
         self.sshconf = sshconf
+        # Built host cards keyed by host name, stored with the signature of
+        # everything they were built from: {name: (signature, {card_id: renderable})}
+        self._host_cache: dict[str, tuple[tuple, dict]] = {}
+        self._pending_node: SSHNode = None
+        self._pending_timer = None
         super().__init__(id=id)
 
     def compose(self) -> ComposeResult:
@@ -55,6 +72,8 @@ class DetailsPane(Vertical):
     def update_config(self, sshconf: SSH_Config) -> None:
         """Replace the backing config model after a reload."""
 
+        if sshconf is not self.sshconf:
+            self._host_cache.clear()
         self.sshconf = sshconf
 
     def show_host_tab(self, tab_id: str) -> None:
@@ -67,9 +86,26 @@ class DetailsPane(Vertical):
 
         self.query_one("#host_tabs", TabbedContent).active = tab_id
 
+    def schedule_node(self, node: SSHNode) -> None:
+        """
+        Refresh the inspector once the selection settles.
+
+        Holding an arrow key highlights many nodes in a row, so rendering is
+        delayed by DETAILS_DEBOUNCE and every new request restarts the timer.
+        Only the last highlighted node gets rendered.
+        """
+
+        self._pending_node = node
+        if self._pending_timer is not None:
+            self._pending_timer.stop()
+        self._pending_timer = self.set_timer(DETAILS_DEBOUNCE, self._render_pending_node)
+
     def update_node(self, node: SSHNode) -> None:
         """Refresh the inspector for the currently selected group or host."""
 
+        # Immediate update wins over any highlight still waiting for debounce
+        self._cancel_pending()
+
         if node is None:
             self._show_empty_state()
             return
@@ -80,6 +116,62 @@ class DetailsPane(Vertical):
 
         self._show_host(node)
 
+    def _render_pending_node(self) -> None:
+        node = self._pending_node
+        self._pending_timer = None
+        self.update_node(node)
+
+    def _cancel_pending(self) -> None:
+        if self._pending_timer is not None:
+            self._pending_timer.stop()
+            self._pending_timer = None
+        self._pending_node = None
+
+    def _host_signature(self, host: SSH_Host) -> tuple:
+        """
+        Return a fingerprint of everything the host cards are built from.
+
+        This covers the host itself, current parameters of patterns it inherits
+        from, and every host in its proxyjump chain (graph and route depend on
+        them). Theme is included, as colors are baked into built renderables.
+        """
+
+        parts = [getattr(self.app, "theme", "")]
+        traced, visited = host, set()
+        # Follow proxy chain quietly, broken chains are reported when graph is built
+        while traced is not None and traced.name not in visited:
+            visited.add(traced.name)
+            parts.append(repr((
+                traced.name, traced.group, traced.type, traced.alt_names, traced.info,
+                traced.source_file, traced.source_line, traced.status, traced.params, traced.matched_params,
+            )))
+            for source in {source for _, source in traced.matched_params.values()}:
+                pattern = self.sshconf.get_host_by_name(source) if self.sshconf.check_host_by_name(source) else None
+                if pattern is not None:
+                    parts.append(repr((pattern.name, pattern.params)))
+            proxy_name, _ = traced.get_applied_param("proxyjump")
+            if not proxy_name:
+                break
+            parts.append(proxy_name)
+            traced = self.sshconf.get_host_by_name(proxy_name) if self.sshconf.check_host_by_name(proxy_name) else None
+        return tuple(parts)
+
+    def _get_host_cards(self, host: SSH_Host) -> dict:
+        """Return built host cards, reusing cached ones while the host signature is unchanged."""
+
+        signature = self._host_signature(host)
+        cached = self._host_cache.get(host.name)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+
+        cards = {card_id: getattr(self, builder)(host) for card_id, builder in HOST_CARD_BUILDERS.items()}
+        self._host_cache.pop(host.name, None)
+        self._host_cache[host.name] = (signature, cards)
+        # Drop oldest entries (dict keeps insertion order) to keep memory bounded
+        while len(self._host_cache) > DETAILS_CACHE_SIZE:
+            del self._host_cache[next(iter(self._host_cache))]
+        return cards
+
     def _build_group_overview(self, group: SSH_Group):
         """Render the compact summary card shown for a selected group."""
 
@@ -284,13 +376,8 @@ class DetailsPane(Vertical):
 
         self._switcher().display = True
         self._switcher().current = "details_host_view"
-        self.query_one("#host_identity_card", Static).update(self._build_host_identity(host))
-        self.query_one("#host_connection_card", Static).update(self._build_host_connection(host))
-        self.query_one("#host_info_card", Static).update(self._build_host_info(host))
-        self.query_one("#host_params_card", Static).update(self._build_host_params(host))
-        self.query_one("#host_connectivity_route_card", Static).update(self._build_host_connectivity_route(host))
-        self.query_one("#host_connectivity_tunnels_card", Static).update(self._build_host_connectivity_tunnels(host))
-        self.query_one("#host_connectivity_graph_card", Static).update(self._build_host_connectivity_graph(host))
+        for card_id, renderable in self._get_host_cards(host).items():
+            self.query_one(f"#{card_id}", Static).update(renderable)
         self.call_after_refresh(self._sync_scrollbar_visibility)
 
     def _detail_grid(self, rows: list[tuple[str, str]]) -> Table:
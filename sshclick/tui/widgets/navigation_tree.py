@@ -1,10 +1,43 @@
+from rich.style import Style
 from rich.text import Text
 from textual import events, on
 from textual.app import ComposeResult
+from textual.binding import Binding
 from textual.message import Message
-from textual.widgets import Static, Tree
+from textual.widgets import Input, OptionList, Static, Tree
+from textual.widgets.option_list import Option
+from textual.widgets.tree import TreeNode
 
-from sshclick.core import SSH_Config, SSH_Group, SSH_Host, HostType
+from sshclick.core import SSH_Config, SSH_Group, SSH_Host, SSH_HostSearchIndex, HostType
+from sshclick.globals import SEARCH_RESULT_LIMIT
+from sshclick.ops import ChangeSet
+
+
+class SearchInput(Input):
+    """Host search box, that leaves result navigation keys to the results list."""
+
+    BINDINGS = [
+        Binding("down", "move_result(1)", show=False),
+        Binding("up", "move_result(-1)", show=False),
+        Binding("escape", "cancel", show=False),
+    ]
+
+    class MoveResult(Message):
+        """Posted when up/down should move the highlighted search result."""
+
+        def __init__(self, delta: int) -> None:
+            super().__init__()
+            self.delta = delta
+
+    class Cancelled(Message):
+        """Posted when the user leaves search without picking a result."""
+
+
+    def action_move_result(self, delta: int) -> None:
+        self.post_message(self.MoveResult(delta))
+
+    def action_cancel(self) -> None:
+        self.post_message(self.Cancelled())
 
 
 class SSHObjectTree(Tree[SSH_Group | SSH_Host | None]):
@@ -98,6 +131,15 @@ class SSHObjectTree(Tree[SSH_Group | SSH_Host | None]):
             self.cursor_node.expand()
 
 
+    def render_label(self, node: TreeNode, base_style: Style, style: Style) -> Text:
+        """Show host count next to group names, taken from the model (host leaves may not exist yet)."""
+
+        label = super().render_label(node, base_style, style)
+        if isinstance(node.data, SSH_Group):
+            label.append(f" ({len(node.data.hosts) + len(node.data.patterns)})", style="dim")
+        return label
+
+
     def _clear_pending_click_button(self) -> None:
         self._pending_click_button = None
 
@@ -141,11 +183,20 @@ class NavigationTree(Static):
 
     def __init__(self, sshconf: SSH_Config, id: str | None = None) -> None:
         self.sshconf = sshconf
+        # Group and host nodes by name, and ids of group nodes that already have host leaves
+        self._group_nodes: dict[str, TreeNode] = {}
+        self._host_nodes: dict[str, TreeNode] = {}
+        self._populated_nodes: set[int] = set()
+        # Search index belongs to current config, dropped when tree model changes
+        self._search_index: SSH_HostSearchIndex | None = None
+        self._search_results: list[SSH_Host] = []
         super().__init__(id=id)
 
 
     def compose(self) -> ComposeResult:
+        yield SearchInput(placeholder="Search hosts...", id="tree_search")
         yield SSHObjectTree("SSH Configuration", id="sshtree", data=None)
+        yield OptionList(id="search_results")
 
 
     def on_mount(self) -> None:
@@ -153,26 +204,251 @@ class NavigationTree(Static):
 
 
     def rebuild(self, sshconf: SSH_Config) -> None:
-        """Recreate the visual tree from the parsed SSHClick config model."""
+        """
+        Recreate the visual tree from the parsed SSHClick config model.
+
+        Only group nodes are created here, host leaves are added when a group
+        is expanded. Groups that were expanded before rebuild stay expanded
+        (and get their leaves), collapsed groups stay empty.
+        """
 
+        expanded_names = self.get_expanded_group_names() if self._group_nodes else []
+        if sshconf is not self.sshconf:
+            self._search_index = None
         self.sshconf = sshconf
         tree = self.query_one(SSHObjectTree)
-        pattern_color = getattr(self.app, "theme_variables", {}).get("sshclick-pattern", "bright_blue")
         tree.clear()
         tree.reset("SSH Configuration", data=None)
         tree.root.expand()
+        self._group_nodes = {}
+        self._host_nodes = {}
+        self._populated_nodes = set()
 
         for group in self.sshconf.groups:
-            group_node = tree.root.add(group.name, data=group, expand=False)
+            self._group_nodes.setdefault(group.name, tree.root.add(group.name, data=group, expand=False))
+        self.expand_groups(expanded_names)
+
+
+    def _populate_group(self, group_node: TreeNode) -> None:
+        """Add host leaves to group node, once, when it is about to be shown."""
+
+        if group_node.id in self._populated_nodes or not isinstance(group_node.data, SSH_Group):
+            return
+        self._populated_nodes.add(group_node.id)
+
+        for host in group_node.data.hosts + group_node.data.patterns:
+            self._host_nodes[host.name] = group_node.add_leaf(self._host_label(host), data=host)
+
+
+    def _host_label(self, host: SSH_Host) -> str | Text:
+        if host.type != HostType.PATTERN:
+            return host.name
+        pattern_color = getattr(self.app, "theme_variables", {}).get("sshclick-pattern", "bright_blue")
+        return Text(host.name, style=pattern_color)
+
+
+    def apply_changes(self, changes: ChangeSet) -> None:
+        """
+        Update the tree in place for hosts and groups touched by config operations.
+
+        Nodes are found through name maps, so only affected nodes are added,
+        removed or relabeled, and expansion of other groups is untouched.
+        Host leaves are only added to groups that already have them.
+        """
+
+        tree = self.query_one(SSHObjectTree)
+        touched_groups: set[str] = set()    # Groups whose host count changed
+        if changes:
+            self._search_index = None
+
+        for group in changes.removed_groups:
+            group_node = self._group_nodes.get(group.name)
+            if group_node is None or group_node.data is not group:
+                continue
+            del self._group_nodes[group.name]
             for host in group.hosts + group.patterns:
-                label = host.name if host.type != HostType.PATTERN else Text(host.name, style=pattern_color)
-                group_node.add_leaf(label, data=host)
+                self._remove_host_node(host)
+            self._populated_nodes.discard(group_node.id)
+            group_node.remove()
+
+        for group, old_name in changes.renamed_groups:
+            group_node = self._group_nodes.get(old_name)
+            if group_node is not None and group_node.data is group:
+                del self._group_nodes[old_name]
+                self._group_nodes[group.name] = group_node
+                group_node.set_label(group.name)
+
+        for group in changes.added_groups:
+            if group.name not in self._group_nodes and group in self.sshconf.groups:
+                self._group_nodes[group.name] = tree.root.add(group.name, data=group, expand=False)
+
+        for host in changes.removed_hosts:
+            self._remove_host_node(host)
+            touched_groups.add(host.group)
+
+        for host, old_name in changes.renamed_hosts:
+            host_node = self._host_nodes.get(old_name)
+            if host_node is not None and host_node.data is host:
+                del self._host_nodes[old_name]
+                self._host_nodes[host.name] = host_node
+                host_node.set_label(self._host_label(host))
+
+        # Moved hosts (also hosts that changed type) are placed again, at their new position in group
+        for host, old_group_name in changes.moved_hosts:
+            self._remove_host_node(host)
+            touched_groups.update([old_group_name, host.group])
+        for host, _ in changes.moved_hosts:
+            self._insert_host_node(host)
+
+        for host in changes.added_hosts:
+            self._insert_host_node(host)
+            touched_groups.add(host.group)
+
+        for host in changes.updated_hosts:
+            host_node = self._host_nodes.get(host.name)
+            if host_node is not None and host_node.data is host:
+                host_node.set_label(self._host_label(host))
+
+        for name in touched_groups:
+            group_node = self._group_nodes.get(name)
+            if group_node is not None:
+                group_node.refresh()
+
+
+    def _remove_host_node(self, host: SSH_Host) -> None:
+        host_node = self._host_nodes.get(host.name)
+        if host_node is not None and host_node.data is host:
+            del self._host_nodes[host.name]
+            host_node.remove()
+
+
+    def _insert_host_node(self, host: SSH_Host) -> None:
+        group_node = self._group_nodes.get(host.group)
+        if group_node is None or group_node.id not in self._populated_nodes:
+            return
+
+        # Leaves follow model order (hosts, then patterns), so new leaf goes before leaf of the next member
+        # already in tree (several hosts can be inserted in one change set, in any order)
+        members = group_node.data.hosts + group_node.data.patterns
+        position = next(index for index, member in enumerate(members) if member is host)
+        before = None
+        for member in members[position + 1:]:
+            member_node = self._host_nodes.get(member.name)
+            if member_node is not None and member_node.data is member:
+                before = member_node
+                break
+        self._host_nodes[host.name] = group_node.add_leaf(self._host_label(host), data=host, before=before)
 
 
     def focus_tree(self) -> None:
         self.query_one(SSHObjectTree).focus()
 
 
+    def set_search_index(self, sshconf: SSH_Config, index: SSH_HostSearchIndex) -> None:
+        """Use index prepared in background for current config (index of an older config is ignored)."""
+
+        if sshconf is self.sshconf:
+            self._search_index = index
+
+
+    @property
+    def has_search_index(self) -> bool:
+        return self._search_index is not None
+
+
+    @property
+    def is_searching(self) -> bool:
+        return self.has_class("-searching")
+
+
+    def open_search(self) -> None:
+        """Show the search box over the tree, results replace the tree while query is not empty."""
+
+        self.add_class("-searching")
+        search_input = self.query_one(SearchInput)
+        search_input.focus()
+        self._show_search_results(search_input.value)
+
+
+    def close_search(self, host: SSH_Host | None = None) -> None:
+        """Leave search, and move tree cursor to the picked host (tree itself is never rebuilt)."""
+
+        self.remove_class("-searching", "-has-query")
+        self.query_one(SearchInput).value = ""
+        self._search_results = []
+        self.query_one("#search_results", OptionList).clear_options()
+
+        tree = self.query_one(SSHObjectTree)
+        tree.focus()
+        if host is not None and self.select_node_by_name(host.name):
+            # Expanded group gets its tree lines on next refresh, cursor is moved again once they exist
+            self.call_after_refresh(self.select_node_by_name, host.name)
+            return
+        # Details pane followed search results, point it back to tree cursor
+        if tree.cursor_node is not None:
+            self.post_message(self.NodeHighlighted(tree.cursor_node.data))
+
+
+    def _show_search_results(self, query: str) -> None:
+        """Replace shown results with best matches of query, highlighting the best one."""
+
+        results_list = self.query_one("#search_results", OptionList)
+        self.set_class(bool(query.strip()), "-has-query")
+        if not query.strip():
+            self._search_results = []
+            results_list.clear_options()
+            return
+
+        if self._search_index is None:
+            # Background index is not ready (or config changed since), build it now
+            self._search_index = SSH_HostSearchIndex(self.sshconf.all_hosts)
+        self._search_results = self._search_index.search(query, limit=SEARCH_RESULT_LIMIT)
+
+        results_list.set_options(
+            Option(Text.assemble(self._host_label(host), (f"  {host.group}", "dim")))
+            for host in self._search_results
+        )
+        results_list.border_title = f"{self._search_index.count()} of {len(self._search_index)} hosts"
+        if self._search_results:
+            results_list.highlighted = 0
+
+
+    @on(Input.Changed, "#tree_search")
+    def on_search_changed(self, event: Input.Changed) -> None:
+        event.stop()
+        self._show_search_results(event.value)
+
+    @on(Input.Submitted, "#tree_search")
+    def on_search_submitted(self, event: Input.Submitted) -> None:
+        event.stop()
+        highlighted = self.query_one("#search_results", OptionList).highlighted
+        self.close_search(self._search_results[highlighted] if highlighted is not None and self._search_results else None)
+
+    @on(SearchInput.MoveResult)
+    def on_search_move_result(self, event: SearchInput.MoveResult) -> None:
+        results_list = self.query_one("#search_results", OptionList)
+        if event.delta > 0:
+            results_list.action_cursor_down()
+        else:
+            results_list.action_cursor_up()
+
+    @on(SearchInput.Cancelled)
+    def on_search_cancelled(self, _event: SearchInput.Cancelled) -> None:
+        self.close_search()
+
+    @on(OptionList.OptionHighlighted, "#search_results")
+    def on_search_result_highlighted(self, event: OptionList.OptionHighlighted) -> None:
+        event.stop()
+        if event.option_index < len(self._search_results):
+            self.post_message(self.NodeHighlighted(self._search_results[event.option_index]))
+
+    @on(OptionList.OptionSelected, "#search_results")
+    def on_search_result_selected(self, event: OptionList.OptionSelected) -> None:
+        event.stop()
+        if event.option_index < len(self._search_results):
+            self.close_search(self._search_results[event.option_index])
+
+
     def select_node_by_name(self, name: str | None) -> bool:
         """Expand parents as needed and move the tree cursor to the named node."""
 
@@ -180,7 +456,7 @@ class NavigationTree(Static):
             return False
 
         tree = self.query_one(SSHObjectTree)
-        target_node = self._find_tree_node(tree.root, name)
+        target_node = self._find_tree_node(name)
         if target_node is None:
             return False
 
@@ -196,28 +472,23 @@ class NavigationTree(Static):
     def get_expanded_group_names(self) -> list[str]:
         """Return the names of groups that are currently expanded in the tree."""
 
-        tree = self.query_one(SSHObjectTree)
-        expanded_groups: list[str] = []
-
-        for node in tree.root.children:
-            if node.is_expanded and isinstance(node.data, SSH_Group):
-                expanded_groups.append(node.data.name)
-
-        return expanded_groups
+        return [name for name, node in self._group_nodes.items() if node.is_expanded]
 
 
     def expand_groups(self, names: list[str]) -> None:
         """Restore expanded state for the given group names after a rebuild."""
 
-        if not names:
-            return
-
-        tree = self.query_one(SSHObjectTree)
-        for node in tree.root.children:
-            if isinstance(node.data, SSH_Group) and node.data.name in names:
+        for name in names:
+            node = self._group_nodes.get(name)
+            if node is not None:
+                self._populate_group(node)
                 node.expand()
 
 
+    def on_tree_node_expanded(self, event: Tree.NodeExpanded) -> None:
+        self._populate_group(event.node)
+
+
     def on_tree_node_highlighted(self, event: Tree.NodeHighlighted) -> None:
         self.post_message(self.NodeHighlighted(event.node.data))
 
@@ -244,15 +515,20 @@ class NavigationTree(Static):
         self.post_message(self.NodeDetailTabRequested(event.tab_id))
 
 
-    def _find_tree_node(self, node, name: str):
-        """Return the first tree node whose SSHClick data object matches the given name."""
+    def _find_tree_node(self, name: str) -> TreeNode | None:
+        """Return tree node of group or host with the given name, adding host leaves of its group if needed."""
+
+        group_node = self._group_nodes.get(name)
+        if group_node is not None:
+            return group_node
 
-        node_data = getattr(node, "data", None)
-        if getattr(node_data, "name", None) == name:
-            return node
+        if not self.sshconf.check_host_by_name(name):
+            return None
+        host = self.sshconf.get_host_by_name(name)
+        group_node = self._group_nodes.get(host.group)
+        if group_node is None:
+            return None
 
-        for child in node.children:
-            found = self._find_tree_node(child, name)
-            if found is not None:
-                return found
-        return None
+        self._populate_group(group_node)
+        host_node = self._host_nodes.get(name)
+        return host_node if host_node is not None and host_node.data is host else None
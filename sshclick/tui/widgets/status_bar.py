@@ -6,10 +6,11 @@ from sshclick.tui.state import TUIState
 
 
 class StatusBar(Grid):
-    """Compact top bar for config path and current write mode."""
+    """Compact top bar for config path, background progress and current write mode."""
 
     def compose(self) -> ComposeResult:
         yield Static(id="status_config")
+        yield Static(id="status_progress")
         yield Static(id="status_mode")
 
     def update_state(self, state: TUIState) -> None:
@@ -19,3 +20,8 @@ class StatusBar(Grid):
 
         self.query_one("#status_config", Static).update(f"[b]Config:[/] {state.config_file}")
         self.query_one("#status_mode", Static).update(f"[b]Mode:[/] {mode_value}")
+
+    def set_progress(self, message: str | None) -> None:
+        """Show progress of background work (like config reload), or clear it with None."""
+
+        self.query_one("#status_progress", Static).update(f"[b $accent]{message}[/]" if message else "")
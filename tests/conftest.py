@@ -0,0 +1,7 @@
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache_dir(tmp_path, monkeypatch):
+    # Keep parse cache entries created by tests out of the real user cache folder
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "xdg-cache"))
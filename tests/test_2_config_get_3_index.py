@@ -0,0 +1,79 @@
+import pytest
+from sshclick.core import SSH_Config, SSH_Group, SSH_Host
+from sshclick.ops import create_group, create_host, delete_group, delete_host, edit_group, edit_host, rename_group, rename_host
+
+#-----------------------------------
+# FILE CONTENT SAMPLES FOR PARSING
+#-----------------------------------
+config1="""
+Host first web web.example
+    hostname 1.1.1.1
+
+Host web
+    hostname 2.2.2.2
+
+Host first
+    hostname 3.3.3.3
+
+#@group: lab
+Host lab-host
+    hostname 4.4.4.4
+"""
+
+#-----------------------------------
+# Tests
+#-----------------------------------
+def test_index_lookup_keeps_first_match_and_primary_names():
+    config = SSH_Config(None, config1.splitlines()).parse()
+
+    assert config.get_host_by_name("first").params["hostname"] == "1.1.1.1"
+    assert config.get_host_by_name("web").params["hostname"] == "2.2.2.2"
+    assert config.get_host_by_name("web.example").name == "first"
+    assert config.check_group_by_name("lab")
+    assert not config.check_host_by_name("missing")
+
+
+def test_index_follows_ops_changes():
+    config = SSH_Config(None, config1.splitlines()).parse()
+
+    rename_host(config, "lab-host", "lab-renamed")
+    assert config.check_host_by_name("lab-renamed")
+    assert not config.check_host_by_name("lab-host")
+
+    rename_group(config, "lab", "lab2")
+    assert config.get_group_by_name("lab2").hosts[0].group == "lab2"
+    assert not config.check_group_by_name("lab")
+
+    create_group(config, "new")
+    create_host(config, "new-host", target_group_name="new")
+    assert config.get_host_by_name("new-host") in config.get_group_by_name("new").hosts
+
+    edit_host(config, "new-host", new_name="edited-host", address="9.9.9.9")
+    assert config.get_host_by_name("edited-host").params == {"hostname": "9.9.9.9"}
+    assert not config.check_host_by_name("new-host")
+
+    edit_group(config, "new", new_name="newer")
+    assert config.get_host_by_name("edited-host").group == "newer"
+
+    delete_host(config, "first")
+    # Duplicate definition is still reachable after first one is removed
+    assert config.get_host_by_name("first").params["hostname"] == "3.3.3.3"
+    assert not config.check_host_by_name("web.example")
+
+    delete_group(config, "newer")
+    assert not config.check_group_by_name("newer")
+
+
+def test_index_detects_direct_model_changes():
+    config = SSH_Config(None, config1.splitlines()).parse()
+
+    config.groups.append(SSH_Group(name="direct"))
+    assert config.check_group_by_name("direct")
+
+    config.get_host_by_name("lab-host").name = "direct-rename"
+    with pytest.raises(Exception):
+        config.get_host_by_name("lab-host")
+
+    config.all_hosts.append(SSH_Host(name="direct-host", group="direct"))
+    assert config.check_host_by_name("direct-host")
+    assert config.check_host_by_name("direct-rename")
@@ -0,0 +1,84 @@
+import os
+import stat
+
+import pytest
+from sshclick.core import SSH_Config
+
+#------------------------------------------------------------------------------
+# Test streamed write-back: config is replaced atomically, keeps its mode and
+# symlink, and is left untouched when rendering fails midway
+#------------------------------------------------------------------------------
+config1="""
+#@group: lab
+Host lab-host
+    hostname 10.0.0.1
+"""
+config1_rendered = "\n".join([
+    "#<<<<< SSH Config file managed by sshclick >>>>>",
+    "",
+    "",
+    "#-------------------------------------------------------------------------------",
+    "#@group: lab",
+    "#-------------------------------------------------------------------------------",
+    "Host lab-host",
+    "    hostname 10.0.0.2",
+    "",
+])
+
+
+def _modify(config_path):
+    config = SSH_Config(str(config_path)).read().parse()
+    config.get_host_by_name("lab-host").params["hostname"] = "10.0.0.2"
+    return config
+
+
+def test_write_replaces_config_and_keeps_mode(tmp_path):
+    config_path = tmp_path / "config"
+    config_path.write_text(config1, encoding="utf-8")
+    os.chmod(config_path, 0o600)
+
+    config = _modify(config_path)
+    assert config.generate_ssh_config()
+
+    assert config_path.read_text(encoding="utf-8") == config1_rendered
+    assert config.ssh_config_lines == config1_rendered.split("\n")
+    assert stat.S_IMODE(config_path.stat().st_mode) == 0o600
+    assert not [name for name in os.listdir(tmp_path) if name.endswith(".tmp")]
+
+
+def test_write_follows_symlinked_config(tmp_path):
+    target_path = tmp_path / "dotfiles-config"
+    target_path.write_text(config1, encoding="utf-8")
+    config_path = tmp_path / "config"
+    config_path.symlink_to(target_path)
+
+    assert _modify(config_path).generate_ssh_config()
+
+    assert config_path.is_symlink()
+    assert target_path.read_text(encoding="utf-8") == config1_rendered
+
+
+def test_failed_render_keeps_original_config(tmp_path):
+    config_path = tmp_path / "config"
+    config_path.write_text(config1, encoding="utf-8")
+
+    config = _modify(config_path)
+    config.get_host_by_name("lab-host").params["port"] = 22
+
+    with pytest.raises(Exception, match="not 'str' or 'list'"):
+        config.generate_ssh_config()
+
+    assert config_path.read_text(encoding="utf-8") == config1
+    assert not [name for name in os.listdir(tmp_path) if name.endswith(".tmp")]
+
+
+def test_stdout_streams_rendered_config(tmp_path, capsys):
+    config_path = tmp_path / "config"
+    config_path.write_text(config1, encoding="utf-8")
+
+    config = _modify(config_path)
+    config.stdout = True
+
+    assert config.generate_ssh_config() is False
+    assert capsys.readouterr().out == config1_rendered + "\n"
+    assert config_path.read_text(encoding="utf-8") == config1
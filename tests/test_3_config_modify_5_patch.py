@@ -0,0 +1,123 @@
+from sshclick.core import SSH_Config
+from sshclick.ops import create_group, create_host, delete_host, rename_group, update_host
+
+#------------------------------------------------------------------------------
+# Test minimal-change write-back: only changed blocks of SSHClick managed
+# config are rendered again, everything else is kept verbatim
+#------------------------------------------------------------------------------
+managed_config = "\n".join([
+    "#<<<<< SSH Config file managed by sshclick >>>>>",
+    "",
+    "Host default-host",
+    "  HostName 10.0.0.1   # hand formatted",
+    "",
+    "#-------------------------------------------------------------------------------",
+    "#@group: lab",
+    "#@desc: Lab hosts",
+    "#-------------------------------------------------------------------------------",
+    "Host lab-1",
+    "  User admin",
+    "",
+    "#@host: second lab host",
+    "Host lab-2",
+    "  HostName 10.0.1.2",
+    "",
+    "#-------------------------------------------------------------------------------",
+    "#@group: prod",
+    "#-------------------------------------------------------------------------------",
+    "Host prod-1",
+    "\tHostName 10.0.2.1",
+    "",
+])
+
+
+def _config(tmp_path, content=managed_config):
+    config_path = tmp_path / "config"
+    config_path.write_text(content, encoding="utf-8")
+    return config_path, SSH_Config(str(config_path)).read().parse()
+
+
+def _write_and_reparse(config_path, config):
+    assert config.generate_ssh_config()
+    return config_path.read_text(encoding="utf-8").split("\n"), SSH_Config(str(config_path)).read().parse()
+
+
+def test_changed_host_is_rewritten_in_place(tmp_path):
+    config_path, config = _config(tmp_path)
+    update_host(config, "lab-1", parameters=[("port", "2222")])
+
+    lines, written = _write_and_reparse(config_path, config)
+
+    expected = managed_config.split("\n")
+    expected[9:11] = ["Host lab-1", "    user admin", "    port 2222"]
+    assert lines == expected
+    assert written.get_host_by_name("lab-1").params == {"user": "admin", "port": "2222"}
+
+
+def test_deleted_and_created_hosts_keep_other_blocks(tmp_path):
+    config_path, config = _config(tmp_path)
+    delete_host(config, "lab-2")
+    create_host(config, "lab-3", address="10.0.1.3", target_group_name="lab")
+
+    lines, written = _write_and_reparse(config_path, config)
+
+    assert "  HostName 10.0.0.1   # hand formatted" in lines
+    assert "\tHostName 10.0.2.1" in lines
+    assert "#@host: second lab host" not in lines
+    assert lines[9:15] == ["Host lab-1", "  User admin", "", "Host lab-3", "    hostname 10.0.1.3", ""]
+    assert [host.name for host in written.get_group_by_name("lab").hosts] == ["lab-1", "lab-3"]
+
+
+def test_moved_host_and_new_group(tmp_path):
+    config_path, config = _config(tmp_path)
+    update_host(config, "default-host", target_group_name="prod")
+    create_group(config, "new", desc="New group")
+    create_host(config, "new-1", target_group_name="new")
+    rename_group(config, "lab", "lab-renamed")
+
+    lines, written = _write_and_reparse(config_path, config)
+
+    assert lines[1:3] == ["", "#-------------------------------------------------------------------------------"]
+    assert "\tHostName 10.0.2.1" in lines
+    assert lines.index("#@group: lab-renamed") < lines.index("#@group: prod") < lines.index("#@group: new")
+    assert written.get_all_group_names() == ["default", "lab-renamed", "prod", "new"]
+    assert [host.name for host in written.get_group_by_name("prod").hosts] == ["prod-1", "default-host"]
+    assert [host.name for host in written.get_group_by_name("new").hosts] == ["new-1"]
+
+
+def test_consecutive_writes_keep_patching(tmp_path):
+    config_path, config = _config(tmp_path)
+    update_host(config, "lab-2", parameters=[("port", "22")])
+    config.generate_ssh_config()
+    update_host(config, "prod-1", parameters=[("port", "23")])
+    delete_host(config, "lab-1")
+
+    lines, written = _write_and_reparse(config_path, config)
+
+    assert "  HostName 10.0.0.1   # hand formatted" in lines
+    assert "Host lab-1" not in lines
+    assert written.get_host_by_name("lab-2").params["port"] == "22"
+    assert written.get_host_by_name("prod-1").params == {"hostname": "10.0.2.1", "port": "23"}
+
+
+def test_unmanaged_config_is_rendered_fully(tmp_path):
+    config_path, config = _config(tmp_path, "\n".join(managed_config.split("\n")[1:]))
+    update_host(config, "lab-1", parameters=[("port", "2222")])
+
+    lines, _ = _write_and_reparse(config_path, config)
+
+    assert lines[0] == "#<<<<< SSH Config file managed by sshclick >>>>>"
+    assert "    hostname 10.0.0.1   # hand formatted" in lines
+    assert "  HostName 10.0.0.1   # hand formatted" not in lines
+
+
+def test_untracked_model_change_falls_back_to_full_render(tmp_path):
+    config_path, config = _config(tmp_path)
+    host = config.get_host_by_name("lab-1")
+    config.get_group_by_name("lab").hosts.remove(host)
+
+    lines, written = _write_and_reparse(config_path, config)
+
+    assert "Host lab-1" not in lines
+    assert "    hostname 10.0.1.2" in lines
+    assert written.get_all_group_names() == ["default", "lab", "prod"]
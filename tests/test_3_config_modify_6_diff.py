@@ -0,0 +1,75 @@
+from difflib import unified_diff
+
+from sshclick.core import SSH_Config
+from sshclick.core.ssh_diff import block_unified_diff, diff_opcodes, output_diff
+from sshclick.ops import update_host
+
+#------------------------------------------------------------------------------
+# Test block-level diff used by --diff mode
+#------------------------------------------------------------------------------
+def _config_lines(host_count):
+    lines = ["#<<<<< SSH Config file managed by sshclick >>>>>", ""]
+    for index in range(host_count):
+        lines += [f"Host host-{index}", f"    hostname 10.0.{index // 250}.{index % 250}", "    user admin", ""]
+    return lines
+
+
+def test_single_changed_block_matches_difflib():
+    original = _config_lines(200)
+    modified = list(original)
+    modified[402] = "    user root"
+    modified[803:803] = ["    port 2222"]
+
+    assert list(block_unified_diff(original, modified, "original", "modified")) == \
+        list(unified_diff(original, modified, "original", "modified", lineterm=""))
+
+
+def test_removed_and_added_blocks_match_difflib():
+    original = _config_lines(50)
+    modified = original[:10] + original[14:100] + ["Host new", "    hostname 1.1.1.1", ""] + original[100:]
+
+    assert list(block_unified_diff(original, modified)) == list(unified_diff(original, modified, lineterm=""))
+
+
+def test_only_changed_blocks_are_compared_by_lines():
+    original = _config_lines(1000)
+    modified = list(original)
+    modified[2002] = "    user root"
+
+    assert diff_opcodes(original, modified) == [
+        ("equal", 0, 2002, 0, 2002),
+        ("replace", 2002, 2003, 2002, 2003),
+        ("equal", 2003, len(original), 2003, len(modified)),
+    ]
+
+
+def test_no_changes_give_no_diff(capsys):
+    lines = _config_lines(10)
+
+    assert list(block_unified_diff(lines, list(lines))) == []
+    output_diff(lines, list(lines))
+    assert capsys.readouterr().out == ""
+
+
+def test_diff_mode_prints_changes_and_keeps_config(tmp_path, capsys):
+    config_path = tmp_path / "config"
+    config_path.write_text("\n".join(_config_lines(3)), encoding="utf-8")
+    config = SSH_Config(str(config_path), diff=True).read().parse()
+    update_host(config, "host-1", parameters=[("port", "2222")])
+
+    assert config.generate_ssh_config() is False
+
+    assert capsys.readouterr().out.split("\n") == [
+        "--- original",
+        "+++ modified",
+        "@@ -7,6 +7,7 @@",
+        " Host host-1",
+        "     hostname 10.0.0.1",
+        "     user admin",
+        "+    port 2222",
+        " ",
+        " Host host-2",
+        "     hostname 10.0.0.2",
+        "",
+    ]
+    assert config_path.read_text(encoding="utf-8") == "\n".join(_config_lines(3))
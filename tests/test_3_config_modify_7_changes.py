@@ -0,0 +1,56 @@
+from sshclick.core import SSH_Config
+from sshclick.ops import ChangeSet, create_group, create_host, delete_group, delete_host, edit_host, rename_group, update_host
+
+#------------------------------------------------------------------------------
+# Test change sets recorded by config operations
+#------------------------------------------------------------------------------
+config1 = [
+    "#@group: lab",
+    "Host lab-1",
+    "    hostname 10.0.0.1",
+    "Host lab-2",
+    "    hostname 10.0.0.2",
+    "#@group: prod",
+    "Host prod-1",
+    "    hostname 10.0.1.1",
+]
+
+
+def test_host_operations_record_changes():
+    config = SSH_Config(None, config1).parse()
+    changes = ChangeSet()
+    assert not changes
+
+    created = create_host(config, "new-1", target_group_name="new", force_group=True, changes=changes)
+    moved = update_host(config, "lab-1", target_group_name="prod", changes=changes)
+    edited = edit_host(config, "lab-2", new_name="lab-2b", address="10.0.0.22", changes=changes)
+    deleted = delete_host(config, "prod-1", changes=changes)
+
+    assert changes
+    assert changes.added_groups == [config.get_group_by_name("new")]
+    assert changes.added_hosts == [created]
+    assert changes.moved_hosts == [(moved, "lab")]
+    assert changes.renamed_hosts == [(edited, "lab-2")]
+    assert changes.updated_hosts == [edited]
+    assert changes.removed_hosts == [deleted]
+
+
+def test_group_operations_record_changes():
+    config = SSH_Config(None, config1).parse()
+    changes = ChangeSet()
+
+    created = create_group(config, "new", changes=changes)
+    renamed = rename_group(config, "lab", "lab-renamed", changes=changes)
+    deleted = delete_group(config, "prod", changes=changes)
+
+    assert changes.added_groups == [created]
+    assert changes.renamed_groups == [(renamed, "lab")]
+    assert changes.removed_groups == [deleted]
+    assert not changes.added_hosts and not changes.removed_hosts
+
+
+def test_operations_without_change_set_keep_working():
+    config = SSH_Config(None, config1).parse()
+
+    assert create_host(config, "plain").name == "plain"
+    assert delete_host(config, "plain").name == "plain"
@@ -0,0 +1,104 @@
+import os
+from textwrap import dedent
+
+from click.testing import CliRunner
+
+from sshclick import main_cli
+from sshclick.core import SSH_Config, get_cache_dir, load_ssh_config_cached
+from sshclick.core.ssh_cache import load_cached_config
+
+#------------------------------------------------------------------------------
+# Test persistent parse cache is reused while config and includes are unchanged
+# and transparently invalidated once any of them changes
+#------------------------------------------------------------------------------
+
+def _write_configs(tmp_path):
+    included_config = tmp_path / "included.conf"
+    included_config.write_text("Host included-host\n    hostname 10.10.10.10\n", encoding="utf-8")
+
+    main_config = tmp_path / "config"
+    main_config.write_text(
+        dedent("""
+            Include included*.conf
+            #@config: host-style=simple
+
+            #@group: lab
+            Host main-host
+                hostname 20.20.20.20
+        """).strip(),
+        encoding="utf-8",
+    )
+    return main_config, included_config
+
+
+def test_cache_is_stored_and_reused(tmp_path):
+    main_config, included_config = _write_configs(tmp_path)
+
+    parsed = load_ssh_config_cached(str(main_config))
+    cached = load_cached_config(str(main_config), stdout=True)
+
+    assert get_cache_dir() == str(tmp_path / "xdg-cache" / "sshclick")
+    assert cached is not None
+    assert cached is not parsed
+    assert cached.stdout is True
+    assert cached.groups == parsed.groups
+    assert cached.all_hosts == parsed.all_hosts
+    assert cached.opts == {"host-style": "simple"}
+    assert cached.included_files == [str(included_config)]
+    assert cached.write_locked is True
+    assert cached.write_locked_reason == parsed.write_locked_reason
+
+
+def test_cache_invalidated_when_root_config_changes(tmp_path):
+    main_config, _ = _write_configs(tmp_path)
+    load_ssh_config_cached(str(main_config))
+
+    main_config.write_text(main_config.read_text(encoding="utf-8") + "\nHost new-host\n", encoding="utf-8")
+
+    assert load_cached_config(str(main_config)) is None
+    assert load_ssh_config_cached(str(main_config)).check_host_by_name("new-host")
+    assert load_cached_config(str(main_config)) is not None
+
+
+def test_cache_invalidated_when_included_file_changes(tmp_path):
+    main_config, included_config = _write_configs(tmp_path)
+    load_ssh_config_cached(str(main_config))
+
+    stat = included_config.stat()
+    included_config.write_text("Host other-host\n    hostname 10.10.10.11\n", encoding="utf-8")
+    os.utime(included_config, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    config = load_ssh_config_cached(str(main_config))
+    assert config.check_host_by_name("other-host")
+    assert not config.check_host_by_name("included-host")
+
+
+def test_cache_invalidated_when_include_glob_matches_new_file(tmp_path):
+    main_config, _ = _write_configs(tmp_path)
+    load_ssh_config_cached(str(main_config))
+
+    (tmp_path / "included2.conf").write_text("Host second-host\n", encoding="utf-8")
+
+    assert load_cached_config(str(main_config)) is None
+    assert load_ssh_config_cached(str(main_config)).check_host_by_name("second-host")
+
+
+def test_cache_not_used_when_disabled(tmp_path):
+    main_config, _ = _write_configs(tmp_path)
+
+    config = load_ssh_config_cached(str(main_config), use_cache=False)
+
+    assert isinstance(config, SSH_Config)
+    assert load_cached_config(str(main_config)) is None
+
+
+def test_sshc_no_cache_option_bypasses_cache(tmp_path):
+    main_config, _ = _write_configs(tmp_path)
+
+    result = CliRunner().invoke(main_cli.cli, ["--config", str(main_config), "--no-cache", "hosts"])
+    assert result.exit_code == 0
+    assert load_cached_config(str(main_config)) is None
+
+    result = CliRunner().invoke(main_cli.cli, ["--config", str(main_config), "hosts"])
+    assert result.exit_code == 0
+    assert load_cached_config(str(main_config)) is not None
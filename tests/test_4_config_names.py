@@ -0,0 +1,104 @@
+from textwrap import dedent
+
+from click.shell_completion import ShellComplete
+
+from sshclick import main_cli
+from sshclick.core import SSH_Config, load_config_names, scan_config_names
+from sshclick.core.ssh_names import load_names_index
+from sshclick.ops import create_host
+
+#------------------------------------------------------------------------------
+# Test completion name scanner and precomputed name index
+#------------------------------------------------------------------------------
+main_content = dedent("""
+    #@config: host-style=simple
+    #@group: early
+    Include included*.conf
+    include = missing*.conf
+
+    #@group: lab
+    #@desc: Lab group
+    Host lab-1 lab-alt
+        hostname 10.0.0.1
+        # include in host scope is not followed
+    host=lab-2
+        HostName 10.0.0.2
+    HOST lab-*
+        user admin
+
+    Match host other
+        user other
+
+    #@group: lab
+    Host lab-1
+        port 2222
+""").strip()
+
+
+def _write_configs(tmp_path):
+    (tmp_path / "included.conf").write_text("#@group: inc\nHost inc-host\n    hostname 1.1.1.1\n", encoding="utf-8")
+    main_config = tmp_path / "config"
+    main_config.write_text(main_content, encoding="utf-8")
+    return main_config
+
+
+def _complete(config_path, args, incomplete=""):
+    completion = ShellComplete(main_cli.cli, {}, "sshc", "_SSHC_COMPLETE")
+    return [item.value for item in completion.get_completions(["--config", str(config_path)] + args, incomplete)]
+
+
+def test_scan_matches_full_parse(tmp_path):
+    main_config = _write_configs(tmp_path)
+
+    names = scan_config_names(str(main_config))
+    config = SSH_Config(str(main_config)).read().parse()
+
+    assert names.hosts == ["inc-host", "lab-1", "lab-2", "lab-*"]
+    assert names.hosts == list(dict.fromkeys(config.get_all_host_names()))
+    assert names.groups == config.get_all_group_names() == ["default", "early", "inc", "lab"]
+    assert names.included_files == config.included_files
+    assert names.include_patterns == config.include_patterns
+
+
+def test_scan_missing_config_gives_no_names(tmp_path):
+    names = scan_config_names(str(tmp_path / "missing"))
+
+    assert names.hosts == []
+    assert names.groups == ["default"]
+
+
+def test_name_index_reused_until_config_changes(tmp_path):
+    main_config = _write_configs(tmp_path)
+
+    assert load_names_index(str(main_config)) is None
+    names = load_config_names(str(main_config))
+    assert load_names_index(str(main_config)) == names
+
+    (tmp_path / "included2.conf").write_text("Host inc-host2\n", encoding="utf-8")
+    assert load_names_index(str(main_config)) is None
+    assert "inc-host2" in load_config_names(str(main_config)).hosts
+
+
+def test_name_index_rewritten_when_config_is_written(tmp_path):
+    main_config = tmp_path / "config"
+    main_config.write_text("Host first\n    hostname 1.1.1.1\n", encoding="utf-8")
+    load_config_names(str(main_config))
+
+    config = SSH_Config(str(main_config)).read().parse()
+    create_host(config, "second")
+    assert config.generate_ssh_config()
+
+    assert load_names_index(str(main_config)).hosts == ["first", "second"]
+
+
+def test_completion_does_not_parse_config(tmp_path, monkeypatch):
+    main_config = _write_configs(tmp_path)
+
+    def fail_parse(self):
+        raise AssertionError("completion must not parse full config")
+
+    monkeypatch.setattr(SSH_Config, "parse", fail_parse)
+
+    assert _complete(main_config, ["host", "show"], "lab") == ["lab-1", "lab-2", "lab-*"]
+    assert _complete(main_config, ["group", "show"], "") == ["default", "early", "inc", "lab"]
+    assert _complete(main_config, ["host", "delete", "lab-1"], "inc") == ["inc-host"]
@@ -0,0 +1,57 @@
+import fnmatch
+import random
+
+from sshclick.core import SSH_Config
+from sshclick.core.ssh_patterns import SSH_PatternIndex
+
+#------------------------------------------------------------------------------
+# Test pattern index matching against plain fnmatch behavior, and verify that
+# inheritance keeps first-match ordering for patterns before/after hosts
+#------------------------------------------------------------------------------
+patterns = ["*", "test-*", "*-prod", "*.lab.*", "db-?", "web[12]-*", "test-a*", "**", "exact-*-name", "*-prod"]
+
+
+def test_pattern_index_matches_like_fnmatch():
+    index = SSH_PatternIndex(patterns)
+    rng = random.Random(42)
+    alphabet = "abdestw-12.?lab"
+
+    names = ["test-app", "app-prod", "srv.lab.local", "db-1", "web1-x", "exact-a-name", "", "test-", "-prod"]
+    names += ["".join(rng.choice(alphabet) for _ in range(rng.randint(0, 12))) for _ in range(500)]
+
+    for name in names:
+        expected = [i for i, pattern in enumerate(patterns) if fnmatch.fnmatch(name, pattern)]
+        assert index.match(name) == expected, name
+
+
+def test_pattern_index_returns_insertion_order():
+    index = SSH_PatternIndex(["test-a*", "*", "*-app", "test-*"])
+
+    assert index.match("test-app") == [0, 1, 2, 3]
+    assert index.match("other") == [1]
+
+
+config1 = """
+Host *-web
+    user before-suffix
+
+Host test-web
+    hostname 10.1.1.20
+
+Host test-*
+    port 1111
+    user after-prefix
+    hostname 10.0.0.1
+
+Host t?st-web
+    port 2222
+"""
+
+
+def test_inheritance_keeps_before_after_semantics():
+    config = SSH_Config(None, config1.splitlines()).parse()
+
+    assert config.get_host_by_name("test-web").matched_params == {
+        "user": ("before-suffix", "*-web"),     # Pattern before host wins
+        "port": ("1111", "test-*"),             # First pattern after host wins
+    }
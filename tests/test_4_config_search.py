@@ -0,0 +1,80 @@
+import random
+
+from sshclick.core import SSH_Config, SSH_HostSearchIndex
+
+#------------------------------------------------------------------------------
+# Test fuzzy host search index
+#------------------------------------------------------------------------------
+config1 = [
+    "#@group: web",
+    "#@host: Frontend in Amsterdam",
+    "Host web-ams-1 frontend1",
+    "    hostname 10.0.0.1",
+    "Host web-fra-1",
+    "    hostname fra1.example.com",
+    "#@group: db",
+    "#@host: Primary\tdatabase",
+    "Host db-1",
+    "    hostname 10.0.1.1",
+    "Host w-e-b-db",
+    "    user admin",
+    "Host *.example.com",
+    "    hostname %h",
+]
+
+
+def _names(hosts):
+    return [host.name for host in hosts]
+
+
+def test_search_ranks_name_matches_first():
+    config = SSH_Config(None, config1).parse()
+    index = SSH_HostSearchIndex(config.all_hosts)
+
+    # prefix, then contained, then in-order chars in name
+    assert _names(index.search("web")) == ["web-ams-1", "web-fra-1", "w-e-b-db"]
+    assert _names(index.search("db")) == ["db-1", "w-e-b-db"]
+    assert _names(index.search("WEB", limit=1)) == ["web-ams-1"]
+    assert index.count() == 3
+
+
+def test_search_matches_alt_names_hostname_and_info():
+    config = SSH_Config(None, config1).parse()
+    index = SSH_HostSearchIndex(config.all_hosts)
+
+    assert _names(index.search("frontend")) == ["web-ams-1"]
+    assert _names(index.search("fra1.exa")) == ["web-fra-1"]
+    assert _names(index.search("amsterdam")) == ["web-ams-1"]
+    assert _names(index.search("primary database")) == ["db-1"]     # whitespace in query is ignored
+    assert _names(index.search("primarydatabase")) == ["db-1"]      # tab inside info line is plain text
+    assert _names(index.search("database")) == ["db-1"]
+    assert _names(index.search("10.0.1")) == ["db-1", "web-ams-1"]    # contained before chars in order
+    # Chars in order are matched within one field only
+    assert _names(index.search("1frontend")) == []
+    assert _names(index.search("zzz")) == [] and index.count() == 0
+
+
+def test_search_empty_query_returns_all_hosts():
+    config = SSH_Config(None, config1).parse()
+    index = SSH_HostSearchIndex(config.all_hosts)
+
+    assert _names(index.search("")) == _names(config.all_hosts)
+    assert len(index.search(" ", limit=2)) == 2
+    assert index.count() == len(config.all_hosts)
+
+
+def test_search_narrowing_matches_full_scan():
+    rng = random.Random(7)
+    lines = []
+    for number in range(300):
+        lines.append(f"#@host: {rng.choice(['edge', 'core', 'lab'])} node {number}")
+        lines.append(f"Host {rng.choice(['web', 'db', 'cache'])}-{number}")
+        lines.append(f"    hostname 10.{number % 7}.{number % 11}.{number}")
+    config = SSH_Config(None, lines).parse()
+    typing_index = SSH_HostSearchIndex(config.all_hosts)
+
+    for query in ["w", "we", "web", "web-1", "web-12", "e", "ed", "edg", "1", "10", "10.3", "c", "c-", "c-2"]:
+        typed = typing_index.search(query)
+        fresh_index = SSH_HostSearchIndex(config.all_hosts)
+        assert _names(typed) == _names(fresh_index.search(query))
+        assert typing_index.count() == fresh_index.count()
@@ -0,0 +1,94 @@
+import socket
+import time
+
+from click.testing import CliRunner
+
+from sshclick import main_cli
+from sshclick.core import SSH_Config, check_reachability, generate_graph
+
+#------------------------------------------------------------------------------
+# Test concurrent TCP reachability check (sshc host check)
+#------------------------------------------------------------------------------
+def _closed_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _write_config(tmp_path, open_port, closed_port):
+    config_path = tmp_path / "config"
+    config_path.write_text("\n".join([
+        "#@group: up",
+        "Host up-1",
+        "    hostname 127.0.0.1",
+        f"    port {open_port}",
+        "Host up-2",
+        "    hostname 127.0.0.1",
+        "#@group: down",
+        "Host down-1",
+        "    hostname 127.0.0.1",
+        f"    port {closed_port}",
+        "Host bad-port",
+        "    hostname 127.0.0.1",
+        "    port ssh",
+        "Host up-*",
+        f"    port {open_port}",
+        "",
+    ]), encoding="utf-8")
+    return config_path
+
+
+def test_check_reports_status_and_latency(tmp_path):
+    with socket.create_server(("127.0.0.1", 0)) as server:
+        open_port = server.getsockname()[1]
+        config = SSH_Config(str(_write_config(tmp_path, open_port, _closed_port()))).read().parse()
+        hosts = [config.get_host_by_name(name) for name in ["up-1", "up-2", "down-1", "bad-port"]]
+
+        results = check_reachability(hosts, concurrency=2, timeout=2)
+
+    assert [result.name for result in results] == ["up-1", "up-2", "down-1", "bad-port"]
+    assert [result.online for result in results] == [True, True, False, False]
+    assert results[1].port == open_port     # port inherited from "up-*" pattern
+    assert results[0].latency is not None and results[2].latency is None
+    assert results[3].error == "invalid port 'ssh'"
+    assert [host.status for host in hosts] == ["online", "online", "offline", "offline"]
+
+
+def test_check_status_is_used_by_graph_and_not_written(tmp_path):
+    with socket.create_server(("127.0.0.1", 0)) as server:
+        config = SSH_Config(str(_write_config(tmp_path, server.getsockname()[1], _closed_port()))).read().parse()
+        host = config.get_host_by_name("up-1")
+        check_reachability([host])
+
+    assert host.status == "online"
+    assert "status" not in host.params
+    assert generate_graph([host]) is not None
+
+
+def test_check_many_hosts_concurrently(tmp_path):
+    config = SSH_Config(None, ["Host unreachable-*", "    hostname 192.0.2.1"] + [f"Host unreachable-{index}" for index in range(40)]).parse()
+    hosts = [host for host in config.all_hosts if host.name.startswith("unreachable-") and "*" not in host.name]
+
+    start = time.perf_counter()
+    results = check_reachability(hosts, concurrency=40, timeout=0.5)
+
+    assert time.perf_counter() - start < 5
+    assert not any(result.online for result in results)
+
+
+def test_sshc_host_check_selects_by_name_and_group(tmp_path):
+    with socket.create_server(("127.0.0.1", 0)) as server:
+        config_path = _write_config(tmp_path, server.getsockname()[1], _closed_port())
+
+        result = CliRunner().invoke(main_cli.cli, ["--config", str(config_path), "host", "check", "-g", "up"])
+        assert result.exit_code == 0
+        assert "2/2 hosts online" in result.output
+
+        result = CliRunner().invoke(main_cli.cli, ["--config", str(config_path), "host", "check", "r:^down", "up-1"])
+        assert result.exit_code == 1
+        assert "down-1" in result.output and "bad-port" not in result.output
+        assert "1/2 hosts online" in result.output
+
+        result = CliRunner().invoke(main_cli.cli, ["--config", str(config_path), "host", "check", "missing"])
+        assert result.exit_code == 1
+        assert "Unknown host 'missing'!" in result.output
@@ -0,0 +1,61 @@
+import subprocess
+import sys
+from pathlib import Path
+
+from click.testing import CliRunner
+
+#------------------------------------------------------------------------------
+# Test that `sshc` startup stays cheap: commands are loaded lazily and heavy
+# libraries (Rich, Textual) are only imported once a command needs them
+#------------------------------------------------------------------------------
+
+# Generous cumulative import budget for `sshclick.main_cli`, in microseconds
+IMPORT_BUDGET_US = 250_000
+
+TEST_CONFIG = Path(__file__).resolve().parent / "config_example"
+
+
+def _import_times(code: str) -> dict[str, int]:
+    """Run `code` under `python -X importtime` and return cumulative import time per module."""
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", code], capture_output=True, text=True, check=True)
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, module = line.split("|")
+        if cumulative.strip().isdigit():
+            times[module.strip()] = int(cumulative)
+    return times
+
+
+def test_main_cli_import_within_budget():
+    times = _import_times("import sshclick.main_cli")
+
+    assert times["sshclick.main_cli"] < IMPORT_BUDGET_US
+    assert not [module for module in times if module.split(".")[0] in ("rich", "textual")]
+    assert not [module for module in times if module.startswith("sshclick.cli.commands")]
+
+
+def test_version_does_not_load_rich():
+    code = "\n".join([
+        "import sys",
+        "from click.testing import CliRunner",
+        "from sshclick import main_cli",
+        "result = CliRunner().invoke(main_cli.cli, ['--version'])",
+        "assert result.exit_code == 0, result.output",
+        "print(any(name == 'rich' or name.startswith('rich.') for name in sys.modules))",
+    ])
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+
+    assert result.stdout.strip() == "False"
+
+
+def test_lazy_commands_listed_and_resolved():
+    from sshclick import main_cli
+
+    result = CliRunner().invoke(main_cli.cli, ["--config", str(TEST_CONFIG), "host", "--help"])
+
+    assert result.exit_code == 0
+    for name in ("create", "delete", "install", "list", "rename", "set", "show"):
+        assert name in result.output
+    assert main_cli.cli.list_commands(None) == ["config", "group", "groups", "host", "hosts"]
@@ -5,7 +5,10 @@ from textwrap import dedent
 
 from textual.widgets import OptionList, Static, TabbedContent
 
-from sshclick.core import SSH_Host
+from sshclick.core import SSH_Config, SSH_Host
+from sshclick.globals import DETAILS_DEBOUNCE
+from sshclick.ops import ChangeSet
+from sshclick.tui.screens import ManageGroupRequest, ManageHostRequest
 from sshclick.tui.sshtui import SSHTui
 
 from .tui_support import TEST_CONFIG
@@ -57,6 +60,87 @@ def test_sshtui_tree_navigation_can_expand_group_and_select_host():
     asyncio.run(scenario())
 
 
+def test_sshtui_tree_adds_host_leaves_only_for_expanded_groups():
+    async def scenario():
+        app = SSHTui(config_file=str(TEST_CONFIG))
+        async with app.run_test() as pilot:
+            await pilot.pause()
+
+            tree = app.query_one("#sshtree")
+            nav_tree = app.query_one("#nav_tree")
+            groups = {node.label.plain: node for node in tree.root.children}
+            assert all(not node.children for node in groups.values())
+            assert tree.render_label(groups["lab-servers"], tree.rich_style, tree.rich_style).plain.endswith("lab-servers (4)")
+
+            groups["network"].expand()
+            await pilot.pause()
+            assert [node.label.plain for node in groups["network"].children] == ["net-switch1", "net-*"]
+
+            assert nav_tree.select_node_by_name("lab-serv2")
+            await pilot.pause()
+            assert groups["lab-servers"].is_expanded is True
+            assert "lab-serv2" in [node.label.plain for node in groups["lab-servers"].children]
+
+            groups["network"].collapse()
+            nav_tree.rebuild(app.state.sshconf)
+            await pilot.pause()
+
+            groups = {node.label.plain: node for node in tree.root.children}
+            assert groups["lab-servers"].is_expanded is True
+            assert len(groups["lab-servers"].children) == 4
+            assert groups["network"].is_expanded is False
+            assert not groups["network"].children
+            assert not groups["jumphost"].children
+
+    asyncio.run(scenario())
+
+
+def test_sshtui_edits_patch_tree_nodes_in_place(tmp_path):
+    config_path = tmp_path / "config_example"
+    shutil.copyfile(TEST_CONFIG, config_path)
+
+    async def scenario():
+        app = SSHTui(config_file=str(config_path))
+        async with app.run_test() as pilot:
+            await pilot.pause()
+
+            tree = app.query_one("#sshtree")
+            groups = {node.label.plain: node for node in tree.root.children}
+            groups["lab-servers"].expand()
+            await pilot.pause()
+            lab_serv1 = next(node for node in groups["lab-servers"].children if node.label.plain == "lab-serv1")
+
+            app._handle_create_host_result(ManageHostRequest(
+                name="lab-serv3", hostname="10.30.0.3", port="", user="", identity_file="",
+                group_name="lab-servers", info_text="", create_group=False, extra_parameters=[],
+            ))
+            await pilot.pause()
+            app._handle_edit_group_result(ManageGroupRequest(name="network-renamed", desc="", info_text="", original_name="network"))
+            await pilot.pause()
+
+            # Existing nodes are kept, only new leaf is added and renamed group is relabeled
+            assert {node.label.plain: node for node in tree.root.children} == {
+                **{name: node for name, node in groups.items() if name != "network"},
+                "network-renamed": groups["network"],
+            }
+            assert lab_serv1 in groups["lab-servers"].children
+            assert [node.label.plain for node in groups["lab-servers"].children] == [
+                "lab-serv1", "lab-serv2", "server-behind-lab", "lab-serv3", "lab-*",
+            ]
+            assert not groups["network"].children
+            assert app.current_node is not None
+            assert app.current_node.name == "network-renamed"
+
+            app._set_current_node(app.state.sshconf.get_host_by_name("lab-serv1"))
+            app._delete_confirmed(True)
+            await pilot.pause()
+
+            assert lab_serv1 not in groups["lab-servers"].children
+            assert app.current_node.name == "lab-servers"
+
+    asyncio.run(scenario())
+
+
 def test_sshtui_enter_on_group_toggles_expand_without_opening_actions():
     async def scenario():
         app = SSHTui(config_file=str(TEST_CONFIG))
@@ -337,15 +421,40 @@ def test_sshtui_reload_preserves_selected_node():
             assert app.current_node is not None
             assert app.current_node.name == "lab-serv1"
 
+            previous_config = app.state.sshconf
             await pilot.press("r")
+            await app.workers.wait_for_complete()
             await pilot.pause()
 
+            assert app.state.sshconf is not previous_config
+            assert str(app.query_one("#status_progress", Static).render()) == ""
             assert app.current_node is not None
             assert app.current_node.name == "lab-serv1"
 
     asyncio.run(scenario())
 
 
+def test_sshtui_reload_result_is_dropped_when_newer_reload_started():
+    async def scenario():
+        app = SSHTui(config_file=str(TEST_CONFIG))
+        async with app.run_test() as pilot:
+            await pilot.pause()
+
+            current_config = app.state.sshconf
+            app._reload_generation = 2
+            app._finish_reload(1, SSH_Config(file=str(TEST_CONFIG)).read().parse(), None)
+            await pilot.pause()
+
+            assert app.state.sshconf is current_config
+
+            app._finish_reload(2, None, None, "broken config")
+            await pilot.pause()
+
+            assert app.state.sshconf is current_config
+
+    asyncio.run(scenario())
+
+
 def test_sshtui_delete_host_preserves_expanded_groups_and_selects_parent_group(tmp_path):
     config_path = tmp_path / "config_example"
     shutil.copyfile(TEST_CONFIG, config_path)
@@ -412,3 +521,123 @@ def test_sshtui_include_config_shows_read_only_mode(tmp_path):
             assert "Includes : 1" in str(app.query_one("#tree_stats", Static).render())
 
     asyncio.run(scenario())
+
+
+def test_sshtui_details_render_only_last_highlight_after_debounce():
+    async def scenario():
+        app = SSHTui(config_file=str(TEST_CONFIG))
+        async with app.run_test() as pilot:
+            await pilot.pause()
+            details = app.query_one("#details_pane")
+            shown = []
+            original_show_host = details._show_host
+            details._show_host = lambda host: (shown.append(host.name), original_show_host(host))
+
+            for name in ["lab-serv1", "lab-serv2", "server-behind-lab"]:
+                app._set_current_node(app.state.sshconf.get_host_by_name(name))
+            assert shown == []
+
+            await pilot.pause(DETAILS_DEBOUNCE * 4)
+            assert shown == ["server-behind-lab"]
+
+            # Immediate update cancels highlight that is still waiting
+            details.schedule_node(app.state.sshconf.get_host_by_name("lab-serv1"))
+            details.update_node(app.state.sshconf.get_host_by_name("jumper1"))
+            await pilot.pause(DETAILS_DEBOUNCE * 4)
+            assert shown == ["server-behind-lab", "jumper1"]
+
+    asyncio.run(scenario())
+
+
+def test_sshtui_details_cache_invalidates_on_host_pattern_and_proxy_changes():
+    async def scenario():
+        app = SSHTui(config_file=str(TEST_CONFIG))
+        async with app.run_test() as pilot:
+            await pilot.pause()
+            details = app.query_one("#details_pane")
+            config = app.state.sshconf
+            built = []
+            original_build_graph = details._build_host_connectivity_graph
+            details._build_host_connectivity_graph = lambda host: (built.append(host.name), original_build_graph(host))[1]
+
+            target = config.get_host_by_name("server-behind-lab")
+            details.update_node(target)
+            details.update_node(config.get_host_by_name("lab-serv2"))
+            details.update_node(target)
+            assert built == ["server-behind-lab", "lab-serv2"]
+
+            target.params["user"] = "changed"                   # host itself
+            details.update_node(target)
+            config.get_host_by_name("jumper1").params["port"] = "2222"     # last hop of proxy chain
+            details.update_node(target)
+            pattern_name = config.get_host_by_name("lab-serv1").matched_params["proxyjump"][1]
+            config.get_host_by_name(pattern_name).params["user"] = "other"  # pattern matched by proxy host
+            details.update_node(target)
+            assert built == ["server-behind-lab", "lab-serv2"] + ["server-behind-lab"] * 3
+
+            details.update_node(target)
+            assert len(built) == 5
+
+    asyncio.run(scenario())
+
+
+def test_sshtui_search_filters_hosts_and_selects_result():
+    async def scenario():
+        app = SSHTui(config_file=str(TEST_CONFIG))
+        async with app.run_test() as pilot:
+            await pilot.pause()
+            await app.workers.wait_for_complete()
+            nav_tree = app.query_one("#nav_tree")
+            tree = app.query_one("#sshtree")
+            results = app.query_one("#search_results", OptionList)
+            assert nav_tree.has_search_index
+
+            await pilot.press("slash")
+            assert app.focused.id == "tree_search"
+            assert tree.display
+
+            for key in "srv2":
+                await pilot.press(key)
+            await pilot.pause()
+            assert not tree.display and results.display
+            assert [host.name for host in nav_tree._search_results] == ["lab-serv2"]
+            assert "1 of" in str(results.border_title)
+
+            await pilot.press("backspace")
+            await pilot.pause()
+            assert [host.name for host in nav_tree._search_results][:2] == ["lab-serv1", "lab-serv2"]
+
+            await pilot.press("down", "enter")
+            await pilot.pause(DETAILS_DEBOUNCE * 4)
+            assert not nav_tree.is_searching and tree.display
+            assert app.focused.id == "sshtree"
+            assert tree.cursor_node.data.name == "lab-serv2"
+            assert app.current_node.name == "lab-serv2"
+            # Only the group holding the picked host got its leaves
+            assert [node.label.plain for node in tree.root.children if node.children] == ["lab-servers"]
+
+            await pilot.press("slash", "j", "escape")
+            await pilot.pause()
+            assert not nav_tree.is_searching
+            assert app.current_node.name == "lab-serv2"
+
+    asyncio.run(scenario())
+
+
+def test_sshtui_search_index_is_dropped_after_edit():
+    async def scenario():
+        app = SSHTui(config_file=str(TEST_CONFIG))
+        async with app.run_test() as pilot:
+            await pilot.pause()
+            await app.workers.wait_for_complete()
+            nav_tree = app.query_one("#nav_tree")
+            changes = ChangeSet(updated_hosts=[app.state.sshconf.get_host_by_name("lab-serv1")])
+            nav_tree.apply_changes(changes)
+            assert not nav_tree.has_search_index
+
+            nav_tree.open_search()
+            nav_tree._show_search_results("jump")
+            assert [host.name for host in nav_tree._search_results] == ["jumper1", "lab-serv1"]   # name, then info line
+            assert nav_tree.has_search_index
+
+    asyncio.run(scenario())
@@ -0,0 +1,46 @@
+import json
+
+from benchmarks.config_generator import GeneratorSpec, generate_config_files, write_config
+from benchmarks.run_benchmarks import run_benchmarks
+from sshclick.core import HostType, SSH_Config
+
+#------------------------------------------------------------------------------
+# Test synthetic config generator and benchmark runner on small inputs
+#------------------------------------------------------------------------------
+SPEC = GeneratorSpec(hosts=60, patterns=8, groups=4, includes=2, jump_hosts=3, forwards=2)
+
+
+def test_generator_is_deterministic():
+    assert generate_config_files(SPEC) == generate_config_files(SPEC)
+    assert generate_config_files(SPEC) != generate_config_files(GeneratorSpec(hosts=60, seed=2))
+
+
+def test_generated_config_parses_with_expected_shape(tmp_path):
+    config = SSH_Config(write_config(str(tmp_path), SPEC)).read().parse()
+
+    assert len(config.included_files) == 2
+    assert len([host for host in config.all_hosts if host.type == HostType.NORMAL]) == 60 + 3
+    assert len(config.all_hosts) == 60 + 8 + 3
+    assert config.check_group_by_name("group-0003")
+    assert len(config.get_host_by_name("host-000000").params["localforward"]) == 2
+    assert config.trace_proxyjump("host-000000") is not None
+
+
+def test_run_benchmarks_reports_all_phases():
+    results = run_benchmarks(GeneratorSpec(hosts=30, patterns=4, groups=3), repeat=1)
+
+    assert set(results["phases"]) == {
+        "read",
+        "parse",
+        "check_inheritance",
+        "scan_config_names",
+        "load_config_names",
+        "filter_hosts",
+        "expand_names",
+        "trace_proxyjump",
+        "generate_ssh_config",
+        "block_diff",
+        "navigation_tree_rebuild",
+    }
+    assert results["phases"]["parse"]["runs"] == 1
+    json.dumps(results)